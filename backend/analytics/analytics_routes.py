@@ -1,7 +1,7 @@
 from fastapi import APIRouter
 from collections import Counter
 from pydantic import BaseModel
-from database.mongo import resume_collection
+from database.mongo import get_resume_collection
 
 router = APIRouter(prefix="/analytics", tags=["Analytics"])
 
@@ -15,11 +15,11 @@ class SkillAnalytics(BaseModel):
 # ------------------ ROUTES ------------------
 
 @router.get("/top-skills", response_model=SkillAnalytics)
-def get_top_skills():
-    resumes = resume_collection.find({})
+async def get_top_skills():
+    resumes = get_resume_collection().find({}, {"cleaned_text": 1, "resume_text": 1})
     skill_counter = Counter()
 
-    for resume in resumes:
+    async for resume in resumes:
         # SAFE access (prevents 500 error)
         text = resume.get("cleaned_text") or resume.get("resume_text") or ""
 
@@ -1,6 +1,9 @@
  # Analytics APIs
-from fastapi import APIRouter
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
+from database.mongo import MONGO_UNAVAILABLE_ERRORS, get_collection
 from analytics.services import get_top_skills, get_match_distribution, extract_skills_from_text
 from analytics.schemas import SkillAnalytics, MatchDistribution
 
@@ -9,13 +12,30 @@ router = APIRouter(prefix="/analytics", tags=["Analytics"])
 class ResumeText(BaseModel):
     resume_text: str
 
+def _require_mongo():
+    if get_collection("resumes") is None:
+        raise HTTPException(status_code=503, detail="MongoDB is not available")
+
 @router.get("/top-skills", response_model=SkillAnalytics)
-def top_skills():
-    return {"skill_counts": get_top_skills()}
+async def top_skills():
+    _require_mongo()
+    try:
+        return {"skill_counts": await get_top_skills()}
+    except MONGO_UNAVAILABLE_ERRORS:
+        raise HTTPException(status_code=503, detail="MongoDB is not available")
 
 @router.get("/match-distribution", response_model=MatchDistribution)
-def match_distribution():
-    return {"ranges": get_match_distribution()}
+async def match_distribution(
+    jd_id: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+):
+    """Histogram of stored match percentages, optionally for one JD and date range."""
+    _require_mongo()
+    try:
+        return {"ranges": await get_match_distribution(jd_id, start_date, end_date)}
+    except MONGO_UNAVAILABLE_ERRORS:
+        raise HTTPException(status_code=503, detail="MongoDB is not available")
 
 @router.post("/extract-skills")
 def extract_skills(data: ResumeText):
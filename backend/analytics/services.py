@@ -1,46 +1,114 @@
 # Data aggregation logic
-from database.mongo import resume_collection
+from fastapi.concurrency import run_in_threadpool
+
+from analytics.skill_counters import counters_ready, read_skill_counts
+from database.mongo import (
+    get_match_results_collection,
+    get_resume_collection,
+    get_skill_counts_collection,
+)
+from matching.match_store import as_entity_id
+from matching.skill_matcher import SKILL_MATCHER
 from matching.skills import TECH_SKILLS
+from resume.fingerprint import (
+    CURRENT_FINGERPRINT_FILTER,
+    STALE_FINGERPRINT_FILTER,
+    fingerprint_skills,
+)
+
+# Count resumes per skill inside MongoDB from the upload-time skills array;
+# only one small document per distinct skill comes back over the wire.
+TOP_SKILLS_PIPELINE = [
+    {"$match": CURRENT_FINGERPRINT_FILTER},
+    {"$project": {"_id": 0, "skills": "$fingerprint.skills"}},
+    {"$unwind": "$skills"},
+    {"$group": {"_id": "$skills", "count": {"$sum": 1}}},
+]
+# Unfingerprinted resumes parsed per threadpool call
+STALE_BATCH_SIZE = 500
+
+async def get_top_skills():
+    # Materialized counters maintained on upload/delete; O(number of skills)
+    skill_counts_collection = get_skill_counts_collection()
+    if await counters_ready(skill_counts_collection):
+        return await read_skill_counts(skill_counts_collection)
+    # Counters not built yet (python -m analytics.skill_counters)
+    return await compute_top_skills()
+
 
-def get_top_skills():
+async def compute_top_skills():
+    """Recount skills across all stored resumes (used to rebuild the counters)."""
     skill_count = {skill: 0 for skill in TECH_SKILLS}
+    resume_collection = get_resume_collection()
 
-    resumes = resume_collection.find()
-    for resume in resumes:
-        text = resume.get("cleaned_text", "")
-        for skill in TECH_SKILLS:
-            if skill in text:
+    async for row in resume_collection.aggregate(TOP_SKILLS_PIPELINE):
+        if row["_id"] in skill_count:
+            skill_count[row["_id"]] += row["count"]
+
+    # Documents not yet backfilled (python -m resume.backfill) are parsed here, in the threadpool
+    def count_batch(resumes):
+        for resume in resumes:
+            for skill in fingerprint_skills(resume):
                 skill_count[skill] += 1
 
+    batch = []
+    stale = resume_collection.find(STALE_FINGERPRINT_FILTER, {"resume_text": 1, "cleaned_text": 1})
+    async for resume in stale:
+        batch.append(resume)
+        if len(batch) >= STALE_BATCH_SIZE:
+            await run_in_threadpool(count_batch, batch)
+            batch = []
+    if batch:
+        await run_in_threadpool(count_batch, batch)
+
     return skill_count
 
 
 def extract_skills_from_text(text):
     """Extract skills from a given text"""
-    skill_count = {skill: 0 for skill in TECH_SKILLS}
-    
-    # Convert text to lowercase for matching
-    text_lower = text.lower()
-    
-    # Count occurrences of each skill
-    for skill in TECH_SKILLS:
-        skill_lower = skill.lower()
-        count = text_lower.count(skill_lower)
-        if count > 0:
-            skill_count[skill_lower] = count
-    
-    # Filter out skills with 0 count
-    skill_count = {k: v for k, v in skill_count.items() if v > 0}
+    # Word-bounded counts for every skill in one scan of the text
+    skill_count = SKILL_MATCHER.count(text)
     
     return skill_count if skill_count else {"no_skills": "No recognized skills found"}
 
 
-def get_match_distribution():
-    # Temporary mock (will be dynamic in Phase 7 integration)
-    return {
-        "0-20": 2,
-        "21-40": 5,
-        "41-60": 8,
-        "61-80": 3,
-        "81-100": 1
-    }
+# Histogram bucket lower bounds (inclusive) and their display labels
+MATCH_BUCKETS = [0, 21, 41, 61, 81, 101]
+MATCH_BUCKET_LABELS = ["0-20", "21-40", "41-60", "61-80", "81-100"]
+
+
+def match_distribution_pipeline(jd_id=None, start_date=None, end_date=None):
+    """$bucket histogram over stored match_percentage values.
+
+    The $match always constrains match_percentage (and only indexed fields),
+    so the planner can answer it from the match_percentage / created_at /
+    jd_id indexes instead of scanning the collection.
+    """
+    match = {"match_percentage": {"$gte": MATCH_BUCKETS[0], "$lt": MATCH_BUCKETS[-1]}}
+    if jd_id is not None:
+        match["jd_id"] = as_entity_id(jd_id)
+    if start_date is not None or end_date is not None:
+        match["created_at"] = {}
+        if start_date is not None:
+            match["created_at"]["$gte"] = start_date
+        if end_date is not None:
+            match["created_at"]["$lte"] = end_date
+
+    return [
+        {"$match": match},
+        {"$project": {"_id": 0, "match_percentage": 1}},
+        {"$bucket": {
+            "groupBy": "$match_percentage",
+            "boundaries": MATCH_BUCKETS,
+            "output": {"count": {"$sum": 1}},
+        }},
+    ]
+
+
+async def get_match_distribution(jd_id=None, start_date=None, end_date=None):
+    ranges = dict.fromkeys(MATCH_BUCKET_LABELS, 0)
+    labels = dict(zip(MATCH_BUCKETS, MATCH_BUCKET_LABELS))
+    pipeline = match_distribution_pipeline(jd_id, start_date, end_date)
+    async for row in get_match_results_collection().aggregate(pipeline):
+        ranges[labels[row["_id"]]] = row["count"]
+    return ranges
@@ -0,0 +1,167 @@
+"""
+Materialized per-skill resume counters backing /analytics/top-skills.
+
+The ``skill_counts`` collection holds one ``{_id: skill, count: n}``
+document per skill. Uploads ``$inc`` the counters of the resume's skills,
+deletes and re-parses apply the difference, ``reconcile_skill_counts``
+recounts chosen skills from the stored fingerprints (the fingerprint
+backfill uses it), and ``rebuild_skill_counts`` overwrites everything.
+Recounts run under ``counters_lease``, a lease document in the same
+collection, so only one process recounts at a time:
+
+    python -m analytics.skill_counters
+"""
+import asyncio
+import time
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional
+
+from pymongo import ReplaceOne, UpdateOne
+from pymongo.errors import DuplicateKeyError
+
+from matching.skills import TECH_SKILLS
+from resume.fingerprint import CURRENT_FINGERPRINT_FILTER
+
+# Marker document written by a full rebuild; counters are only trusted once it exists
+META_ID = "__meta__"
+# Lease document held while counters are recounted
+LEASE_ID = "__lease__"
+# A lease not released by then (crashed holder) can be taken over
+LEASE_SECONDS = 600
+
+
+class CountersBusy(Exception):
+    """Raised when another process kept the recount lease for the whole wait."""
+
+
+async def increment_skills(counts_collection, skills: Iterable[str], amount: int = 1) -> None:
+    """Atomically add ``amount`` to the counter of every skill in ``skills``."""
+    operations = [
+        UpdateOne({"_id": skill}, {"$inc": {"count": amount}}, upsert=True)
+        for skill in set(skills)
+    ]
+    if operations:
+        await counts_collection.bulk_write(operations, ordered=False)
+
+
+async def update_skill_counts(counts_collection, old_skills: Iterable[str], new_skills: Iterable[str]) -> None:
+    """Move counters from a resume's previous skill set to its new one."""
+    old_skills, new_skills = set(old_skills), set(new_skills)
+    operations = [
+        UpdateOne({"_id": skill}, {"$inc": {"count": amount}}, upsert=True)
+        for skills, amount in ((new_skills - old_skills, 1), (old_skills - new_skills, -1))
+        for skill in skills
+    ]
+    if operations:
+        await counts_collection.bulk_write(operations, ordered=False)
+
+
+@asynccontextmanager
+async def counters_lease(counts_collection, wait_seconds: float = LEASE_SECONDS):
+    """Hold the recount lease, waiting up to ``wait_seconds`` for the current holder."""
+    owner = uuid.uuid4().hex
+    deadline = time.monotonic() + wait_seconds
+    while True:
+        now = datetime.utcnow()
+        try:
+            # Matches only a free (expired) lease; otherwise the upsert hits the existing _id
+            await counts_collection.update_one(
+                {"_id": LEASE_ID, "expires_at": {"$lt": now}},
+                {"$set": {"owner": owner, "expires_at": now + timedelta(seconds=LEASE_SECONDS)}},
+                upsert=True,
+            )
+            break
+        except DuplicateKeyError:
+            if time.monotonic() >= deadline:
+                raise CountersBusy("Skill counters are being recounted by another process")
+            await asyncio.sleep(1)
+    try:
+        yield
+    finally:
+        await counts_collection.delete_one({"_id": LEASE_ID, "owner": owner})
+
+
+async def reconcile_skill_counts(
+    counts_collection, resume_collection, skills: Optional[Iterable[str]] = None
+) -> None:
+    """Recount ``skills`` (default: all) from current fingerprints and ``$set`` the counters.
+
+    Call it holding ``counters_lease``. Resumes without a current fingerprint
+    are not counted, and an upload or delete landing between the recount
+    and the write can be missed until the next reconcile or rebuild.
+    """
+    skills = sorted(set(TECH_SKILLS if skills is None else skills))
+    if not skills:
+        return
+    actual = dict.fromkeys(skills, 0)
+    pipeline = [
+        {"$match": {**CURRENT_FINGERPRINT_FILTER, "fingerprint.skills": {"$in": skills}}},
+        {"$project": {"_id": 0, "skills": "$fingerprint.skills"}},
+        {"$unwind": "$skills"},
+        {"$match": {"skills": {"$in": skills}}},
+        {"$group": {"_id": "$skills", "count": {"$sum": 1}}},
+    ]
+    async for row in resume_collection.aggregate(pipeline):
+        actual[row["_id"]] = row["count"]
+    stored = dict.fromkeys(skills, 0)
+    async for row in counts_collection.find({"_id": {"$in": skills}}, {"count": 1}):
+        stored[row["_id"]] = int(row["count"])
+    operations = [
+        UpdateOne({"_id": skill}, {"$set": {"count": actual[skill]}}, upsert=True)
+        for skill in skills
+        if actual[skill] != stored[skill]
+    ]
+    if operations:
+        await counts_collection.bulk_write(operations, ordered=False)
+
+
+async def counters_ready(counts_collection) -> bool:
+    return await counts_collection.find_one({"_id": META_ID}, {"_id": 1}) is not None
+
+
+async def read_skill_counts(counts_collection) -> Dict[str, int]:
+    """Current counters for every TECH_SKILLS entry (O(number of skills))."""
+    skill_count = {skill: 0 for skill in TECH_SKILLS}
+    async for row in counts_collection.find({}, {"count": 1}):
+        if row["_id"] in skill_count:
+            skill_count[row["_id"]] = max(int(row["count"]), 0)
+    return skill_count
+
+
+async def rebuild_skill_counts(counts_collection, skill_count: Dict[str, int]) -> None:
+    """Overwrite the counters with freshly computed totals."""
+    operations = [
+        ReplaceOne({"_id": skill}, {"_id": skill, "count": count}, upsert=True)
+        for skill, count in skill_count.items()
+    ]
+    if operations:
+        await counts_collection.bulk_write(operations, ordered=False)
+    await counts_collection.delete_many({"_id": {"$nin": list(skill_count) + [META_ID, LEASE_ID]}})
+    await counts_collection.replace_one(
+        {"_id": META_ID}, {"_id": META_ID, "rebuilt_at": datetime.utcnow()}, upsert=True
+    )
+
+
+async def _reconcile() -> None:
+    from analytics.services import compute_top_skills
+    from database.mongo import get_resume_collection, get_skill_counts_collection
+    from database.schema import close_mongo_connection, connect_to_mongo
+    from resume.backfill import backfill_fingerprints
+
+    await connect_to_mongo()
+    try:
+        # Counters are recomputed from scratch below, so the backfill leaves them alone
+        updated = await backfill_fingerprints(get_resume_collection())
+        print(f"✅ Backfilled fingerprints for {updated} resumes")
+        counts_collection = get_skill_counts_collection()
+        async with counters_lease(counts_collection):
+            await rebuild_skill_counts(counts_collection, await compute_top_skills())
+        print("✅ Rebuilt skill_counts from stored fingerprints")
+    finally:
+        await close_mongo_connection()
+
+
+if __name__ == "__main__":
+    asyncio.run(_reconcile())
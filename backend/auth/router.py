@@ -1,13 +1,22 @@
+from functools import lru_cache
+
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from database.db import SessionLocal, engine
 from auth import models, schemas, utils
 
-models.Base.metadata.create_all(bind=engine)
-
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
+@lru_cache(maxsize=None)
+def create_auth_tables():
+    """Create the SQL auth tables if missing, once per process.
+
+    Called from the app lifespan, and lazily by get_db where no lifespan runs.
+    """
+    models.Base.metadata.create_all(bind=engine)
+
 def get_db():
+    create_auth_tables()
     db = SessionLocal()
     try:
         yield db
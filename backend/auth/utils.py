@@ -1,20 +1,27 @@
-from passlib.context import CryptContext
 from datetime import datetime, timedelta
-from jose import jwt
+from functools import lru_cache
 
 SECRET_KEY = "SUPER_SECRET_KEY_CHANGE_LATER"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+@lru_cache(maxsize=None)
+def get_pwd_context():
+    # passlib and its bcrypt backend load on the first login/register, not at startup
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 def hash_password(password: str):
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 def verify_password(password: str, hashed_password: str):
-    return pwd_context.verify(password, hashed_password)
+    return get_pwd_context().verify(password, hashed_password)
 
 def create_access_token(data: dict):
+    from jose import jwt
+
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     to_encode.update({"exp": expire})
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+"""Benchmark: N calls to calculate_ats_score vs one batch_ats_scores call.
+
+Run from the backend directory:
+    python benchmarks/bench_batch_scoring.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from matching.ats_engine import calculate_ats_score  # noqa: E402
+from matching.batch_scoring import batch_ats_scores  # noqa: E402
+from matching.skills import TECH_SKILLS  # noqa: E402
+
+FILLER = "Delivered features for customers, owned services end to end and worked with the team."
+
+
+def synthetic_resume(rng):
+    skills = rng.sample(TECH_SKILLS, 15)
+    return " ".join(f"Built systems with {skill}. {FILLER}" for skill in skills)
+
+
+def main():
+    rng = random.Random(42)
+    jd = "Looking for " + ", ".join(rng.sample(TECH_SKILLS, 12)) + ". " + FILLER * 20
+
+    print("=" * 60)
+    print("BATCH ATS SCORING BENCHMARK (many resumes vs one JD)")
+    print("=" * 60)
+    print(f"{'resumes':>8} {'loop s':>8} {'batch s':>8} {'speedup':>8}")
+    for n in (100, 1000, 5000):
+        resumes = [synthetic_resume(rng) for _ in range(n)]
+
+        start = time.perf_counter()
+        looped = sorted((calculate_ats_score(r, jd)["ats_score"] for r in resumes), reverse=True)
+        loop_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batched = [r["ats_score"] for r in batch_ats_scores(resumes, [jd])]
+        batch_s = time.perf_counter() - start
+
+        assert looped == batched
+        print(f"{n:>8} {loop_s:>8.3f} {batch_s:>8.3f} {loop_s / batch_s:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+"""Benchmark: analyze_resume_for_improvements on long resumes. It compares
+the streamed line scanner with the previous loops, which ran one regex
+search per weak verb per line plus a substring loop over METRICS_KEYWORDS.
+The previous code raised on any weak verb and any metric line, so it is
+reproduced here with only those two crashes fixed.
+
+Three 5,000-line inputs:
+- clean: no findings, so every line is scanned (the worst case);
+- mixed: findings spread through the text;
+- weak: weak verbs early, so the scan stops at the top-N cutoff.
+
+The script exits non-zero if the worst case median exceeds the budget.
+
+Run from the backend directory:
+    python benchmarks/bench_improvements.py [repeats] [budget_ms]
+"""
+import os
+import random
+import re
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_enhancements.generator import (  # noqa: E402
+    ACTION_VERBS,
+    METRICS_KEYWORDS,
+    QUANTIFIERS,
+    WEAK_VERBS,
+    analyze_resume_for_improvements,
+)
+
+LINES = 5_000
+DEFAULT_BUDGET_MS = 25
+CLEAN = [
+    "Designed a billing service in Python and Go, deployed on Kubernetes.",
+    "Built data pipelines with Airflow and Spark for the analytics team.",
+    "Mentored four engineers and ran the weekly architecture review.",
+]
+FINDINGS = ["Worked on the payments API with the platform team.", "Improved onboarding for new customers."]
+
+
+def legacy_scan(resume_text):
+    """The previous weak-verb and quantification loops."""
+    lines = resume_text.split("\n")
+    weak_verb_count = 0
+    quantified_lines = 0
+    for line in lines:
+        for weak_verb in WEAK_VERBS:
+            if re.search(r"\b" + weak_verb + r"\b", line.lower()):
+                weak_verb_count += 1
+                [k for k, v in ACTION_VERBS.items() if weak_verb in [a.lower() for a in v]]
+    for line in lines:
+        if any(metric in line.lower() for metric in METRICS_KEYWORDS):
+            if not (any(c.isdigit() for c in line) or any(quant in line for quant in QUANTIFIERS)):
+                quantified_lines += 1
+    return weak_verb_count, quantified_lines
+
+
+def resume(rng, kind):
+    if kind == "weak":
+        return "\n".join(FINDINGS[0] if i < 20 else rng.choice(CLEAN) for i in range(LINES))
+    pool = CLEAN + FINDINGS if kind == "mixed" else CLEAN
+    return "\n".join(rng.choice(pool) for _ in range(LINES))
+
+
+def median_ms(fn, text, repeats):
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(text)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    budget_ms = float(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_BUDGET_MS
+    rng = random.Random(42)
+
+    print("=" * 60)
+    print(f"RESUME IMPROVEMENT SCAN BENCHMARK ({LINES} lines, budget {budget_ms:.0f} ms)")
+    print("=" * 60)
+    print(f"{'input':>8} {'legacy ms':>10} {'scanner ms':>11} {'speedup':>8}")
+    results = {}
+    for kind in ("clean", "mixed", "weak"):
+        text = resume(rng, kind)
+        legacy_ms = median_ms(legacy_scan, text, repeats)
+        scanner_ms = median_ms(analyze_resume_for_improvements, text, repeats)
+        results[kind] = scanner_ms
+        print(f"{kind:>8} {legacy_ms:>10.2f} {scanner_ms:>11.2f} {legacy_ms / scanner_ms:>7.1f}x")
+
+    worst_ms = max(results.values())
+    if worst_ms > budget_ms:
+        print(f"❌ {worst_ms:.1f} ms exceeds budget {budget_ms:.0f} ms")
+        sys.exit(1)
+    print("✅ Within latency budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+"""Benchmark: /matching/jd-match latency, shared analysis context vs the
+previous triple computation (calculate_match_percentage, then
+calculate_ats_score again, then raw skill scans of both texts).
+
+Requests go through a TestClient so routing, validation and serialization
+are included. The debug output of calculate_match_percentage is discarded
+in both variants.
+
+Run from the backend directory:
+    python benchmarks/bench_jd_match.py [requests]
+"""
+import contextlib
+import io
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from matching.ats_engine import calculate_ats_score  # noqa: E402
+from matching.enhanced_router import JDMatchRequest, router  # noqa: E402
+from matching.jd_matcher import calculate_match_percentage  # noqa: E402
+from matching.skill_matcher import SKILL_MATCHER  # noqa: E402
+from matching.skills import TECH_SKILLS  # noqa: E402
+
+FILLER = "Delivered features for customers, owned services end to end and worked with the team."
+
+
+def legacy_jd_match(data: JDMatchRequest):
+    match_percentage = calculate_match_percentage(data.resume_text, data.job_description)
+    ats_score = calculate_ats_score(data.resume_text, data.job_description)
+    resume_skills = SKILL_MATCHER.count(data.resume_text)
+    jd_skills = SKILL_MATCHER.find(data.job_description)
+    return {
+        "match_percentage": match_percentage["match_percentage"],
+        "ats_score": ats_score["ats_score"],
+        "matched_skills": [s for s in resume_skills if s in jd_skills],
+        "missing_skills": sorted(jd_skills - set(resume_skills)),
+        "resume_skills": resume_skills,
+    }
+
+
+def payload(rng, resume_sentences):
+    resume = " ".join(
+        f"{rng.randint(1, 9)} years of experience building with {skill}. {FILLER}"
+        for skill in rng.choices(TECH_SKILLS, k=resume_sentences)
+    )
+    jd = "Looking for " + ", ".join(rng.sample(TECH_SKILLS, 12)) + ". 5+ years experience. " + FILLER * 10
+    return {"resume_text": resume, "job_description": jd}
+
+
+def timed(client, path, payloads):
+    samples = []
+    for body in payloads:
+        start = time.perf_counter()
+        response = client.post(path, json=body)
+        samples.append(time.perf_counter() - start)
+        assert response.status_code == 200
+    return statistics.median(samples) * 1000
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rng = random.Random(42)
+
+    app = FastAPI()
+    app.include_router(router)
+    app.post("/legacy/jd-match")(legacy_jd_match)
+    client = TestClient(app)
+
+    print("=" * 60)
+    print(f"JD-MATCH ENDPOINT BENCHMARK ({n} requests per size)")
+    print("=" * 60)
+    print(f"{'resume chars':>12} {'legacy ms':>10} {'context ms':>11} {'speedup':>8}")
+    with contextlib.redirect_stdout(io.StringIO()) as sink:
+        rows = []
+        for sentences in (20, 100, 400):
+            payloads = [payload(rng, sentences) for _ in range(n)]
+            for body in payloads[:5]:
+                assert client.post("/matching/jd-match", json=body).json() == \
+                    client.post("/legacy/jd-match", json=body).json()
+            legacy_ms = timed(client, "/legacy/jd-match", payloads)
+            context_ms = timed(client, "/matching/jd-match", payloads)
+            chars = statistics.median(len(p["resume_text"]) for p in payloads)
+            rows.append((chars, legacy_ms, context_ms))
+            sink.seek(0)
+            sink.truncate()
+    for chars, legacy_ms, context_ms in rows:
+        print(f"{chars:>12.0f} {legacy_ms:>10.2f} {context_ms:>11.2f} {legacy_ms / context_ms:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+"""Benchmark: keyword extraction and gap analysis on long job descriptions,
+compiled one-pass KeywordMatcher vs the previous per-keyword scans
+(a substring test per keyword, then an uncompiled word-bounded regex per
+JD keyword).
+
+Run from the backend directory:
+    python benchmarks/bench_keyword_gaps.py [repeats]
+"""
+import os
+import random
+import re
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from insights.analyzer import TECHNICAL_KEYWORDS, analyze_keyword_gaps  # noqa: E402
+
+FILLER = "We value ownership, clear writing and shipping small changes often. "
+ALL_KEYWORDS = [kw for keywords in TECHNICAL_KEYWORDS.values() for kw in keywords]
+
+
+def legacy_gaps(resume_text, job_description):
+    """Keyword counting of the previous analyze_keyword_gaps."""
+    def extract(text):
+        text_lower = text.lower()
+        return {
+            category: [kw for kw in keywords if kw in text_lower]
+            for category, keywords in TECHNICAL_KEYWORDS.items()
+        }
+
+    resume_keywords = extract(resume_text)
+    jd_keywords = extract(job_description)
+    jd_text_lower = job_description.lower()
+    keyword_frequency = {}
+    for category, keywords in jd_keywords.items():
+        for keyword in keywords:
+            keyword_frequency[keyword] = (category, len(re.findall(r'\b' + keyword + r'\b', jd_text_lower)))
+    resume_all = [kw for keywords in resume_keywords.values() for kw in keywords]
+    return [kw for kw in keyword_frequency if kw not in resume_all]
+
+
+def job_description(rng, chars):
+    parts = []
+    while sum(map(len, parts)) < chars:
+        parts.append(f"Experience with {rng.choice(ALL_KEYWORDS)} is required. {FILLER}")
+    return "".join(parts)
+
+
+def timed(fn, resume, jds):
+    samples = []
+    for jd in jds:
+        start = time.perf_counter()
+        fn(resume, jd)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    rng = random.Random(42)
+    resume = "Backend engineer: Python, Django, PostgreSQL, Docker and AWS. Mentoring and communication. " * 10
+
+    print("=" * 60)
+    print(f"KEYWORD GAP BENCHMARK ({repeats} JDs per size)")
+    print("=" * 60)
+    print(f"{'JD chars':>10} {'legacy ms':>10} {'matcher ms':>11} {'speedup':>8}")
+    for chars in (2_000, 20_000, 100_000):
+        jds = [job_description(rng, chars) for _ in range(repeats)]
+        legacy_ms = timed(legacy_gaps, resume, jds)
+        matcher_ms = timed(analyze_keyword_gaps, resume, jds)
+        print(f"{chars:>10} {legacy_ms:>10.2f} {matcher_ms:>11.2f} {legacy_ms / matcher_ms:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
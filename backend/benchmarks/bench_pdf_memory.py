@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+"""Benchmark: peak RSS of resume PDF processing, whole-document vs page stream.
+
+Each variant runs in a fresh subprocess so its peak RSS (ru_maxrss) is not
+polluted by the others. "legacy" is the previous implementation: every page
+of the open document appended to one string with ``+=``, then cleaned and
+fingerprinted as a whole.
+
+Run from the backend directory:
+    python benchmarks/bench_pdf_memory.py [pages]
+"""
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+LINES_PER_PAGE = 45
+LINE = "Built Python, Docker and Kubernetes services on AWS; 5 years of experience with FastAPI {}"
+
+
+def make_pdf(pages):
+    """Text-only PDF with ``pages`` pages of LINES_PER_PAGE lines each."""
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    kids = []
+    for i in range(pages):
+        page_id, content_id = 4 + 2 * i, 5 + 2 * i
+        kids.append(f"{page_id} 0 R")
+        lines = " ".join(f"({LINE.format(i * LINES_PER_PAGE + n)}) Tj T*" for n in range(LINES_PER_PAGE))
+        stream = f"BT /F1 9 Tf 30 780 Td 11 TL {lines} ET".encode()
+        objects[page_id] = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {content_id} 0 R "
+            "/Resources << /Font << /F1 3 0 R >> >> >>"
+        ).encode()
+        objects[content_id] = b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+    objects[2] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {pages} >>".encode()
+
+    parts, offsets, size = [b"%PDF-1.4\n"], {}, 9
+    for number in sorted(objects):
+        offsets[number] = size
+        chunk = b"%d 0 obj\n%s\nendobj\n" % (number, objects[number])
+        parts.append(chunk)
+        size += len(chunk)
+    parts.append(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    parts.extend(b"%010d 00000 n \n" % offsets[n] for n in sorted(objects))
+    parts.append(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, size))
+    return b"".join(parts)
+
+
+def _current_rss_mb():
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def run_variant(variant, path):
+    """Child process: process the PDF once and print baseline/peak RSS in MB."""
+    from io import BytesIO
+
+    import pdfplumber
+
+    from resume.cleaner import clean_text
+    from resume.extraction import process_resume_pdf
+    from resume.fingerprint import compute_fingerprint
+
+    with open(path, "rb") as handle:
+        content = handle.read()
+    baseline = _current_rss_mb()
+    start = time.perf_counter()
+
+    if variant == "legacy":
+        text = ""
+        with pdfplumber.open(BytesIO(content)) as pdf:
+            for page in pdf.pages:
+                page_text = page.extract_text()
+                if page_text:
+                    text += page_text + " "
+        text = text.strip()
+        result = (text, clean_text(text), compute_fingerprint(text))
+    elif variant == "stream":
+        result = process_resume_pdf(BytesIO(content))
+    else:
+        result = process_resume_pdf(BytesIO(content), max_pages=50, max_chars=200_000)
+
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    chars = len(result[0] if isinstance(result, tuple) else result["resume_text"])
+    print(f"{baseline:.1f} {peak:.1f} {elapsed:.2f} {chars}")
+
+
+def main():
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as handle:
+        handle.write(make_pdf(pages))
+        path = handle.name
+
+    print("=" * 60)
+    print(f"PDF MEMORY BENCHMARK ({pages} pages, {os.path.getsize(path) / 1024:.0f} KiB)")
+    print("=" * 60)
+    print(f"{'variant':<16} {'base MB':>8} {'peak MB':>8} {'delta MB':>9} {'secs':>6} {'chars':>9}")
+    try:
+        for variant, label in (("legacy", "legacy +="), ("stream", "stream"), ("budget", "stream+budget")):
+            output = subprocess.run(
+                [sys.executable, __file__, "--variant", variant, path],
+                check=True, capture_output=True, text=True,
+            ).stdout.split()
+            baseline, peak, elapsed, chars = float(output[-4]), float(output[-3]), output[-2], output[-1]
+            print(f"{label:<16} {baseline:>8.1f} {peak:>8.1f} {peak - baseline:>9.1f} {elapsed:>6} {chars:>9}")
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "--variant":
+        run_variant(sys.argv[2], sys.argv[3])
+    else:
+        main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""Benchmark: CPU per page view, one /report call vs the per-analyzer fan-out.
+
+A results page used to POST the same resume and JD to seven endpoints
+(/matching/jd-match, three /insights and three /ai analyzers), each of which
+lowercased, split and scanned the text on its own. /report builds the shared
+document once. CPU time (``time.process_time``) is measured in-process through
+a TestClient, so routing, validation and serialization are included for both.
+The response cache middleware is not installed.
+
+Run from the backend directory:
+    python benchmarks/bench_report.py [page_views]
+"""
+import contextlib
+import io
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from ai_enhancements.router import router as ai_router  # noqa: E402
+from insights.router import router as insights_router  # noqa: E402
+from matching.enhanced_router import router as matching_router  # noqa: E402
+from matching.skills import TECH_SKILLS  # noqa: E402
+from report.router import router as report_router  # noqa: E402
+
+FILLER = "Delivered features for customers and owned services end to end, improving uptime by 20%."
+
+
+def payload(rng, resume_lines):
+    resume = "\n".join(
+        f"Built {skill} systems over {rng.randint(1, 9)} years. {FILLER}"
+        for skill in rng.choices(TECH_SKILLS, k=resume_lines)
+    )
+    jd = "Looking for " + ", ".join(rng.sample(TECH_SKILLS, 12)) + ". 5+ years experience. " + FILLER * 5
+    return {
+        "resume_text": resume,
+        "job_description": jd,
+        "company_name": "Acme",
+        "position_title": "Senior Engineer",
+    }
+
+
+def fan_out(client, body):
+    pair = {"resume_text": body["resume_text"], "job_description": body["job_description"]}
+    for path, json in (
+        ("/matching/jd-match", pair),
+        ("/insights/keyword-gaps", pair),
+        ("/insights/job-role-match", {"resume_text": body["resume_text"]}),
+        ("/insights/career-paths", {"resume_text": body["resume_text"]}),
+        ("/ai/resume-improvements", pair),
+        ("/ai/interview-prep", pair),
+        ("/ai/cover-letter", body),
+    ):
+        assert client.post(path, json=json).status_code == 200, path
+
+
+def report(client, body):
+    response = client.post("/report", json=body)
+    assert response.status_code == 200 and response.json()["errors"] == {}
+
+
+def cpu_ms(fn, client, payloads):
+    samples = []
+    for body in payloads:
+        start = time.process_time()
+        fn(client, body)
+        samples.append(time.process_time() - start)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    rng = random.Random(42)
+
+    app = FastAPI()
+    for router in (matching_router, insights_router, ai_router, report_router):
+        app.include_router(router)
+    client = TestClient(app)
+
+    print("=" * 60)
+    print(f"FULL REPORT CPU BENCHMARK ({n} page views per size)")
+    print("=" * 60)
+    print(f"{'resume lines':>12} {'fan-out ms':>11} {'report ms':>10} {'saved':>7}")
+    with contextlib.redirect_stdout(io.StringIO()) as sink:
+        rows = []
+        for lines in (20, 100, 400):
+            payloads = [payload(rng, lines) for _ in range(n)]
+            report(client, payloads[0])  # warm up
+            fan_out_ms = cpu_ms(fan_out, client, payloads)
+            report_ms = cpu_ms(report, client, payloads)
+            rows.append((lines, fan_out_ms, report_ms))
+            sink.seek(0)
+            sink.truncate()
+    for lines, fan_out_ms, report_ms in rows:
+        print(f"{lines:>12} {fan_out_ms:>11.2f} {report_ms:>10.2f} {1 - report_ms / fan_out_ms:>6.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""Benchmark: scoring resumes against role catalogs of 10 and 3,000 profiles.
+It compares the compiled RoleCatalog (sparse role x skill and role x keyword
+matrices, top-k selection) with the previous loop, which tested list
+membership for every role.
+
+Both variants receive the same resume skills, experience and role keyword
+hits, so only the scoring and ranking are timed. Batch timings score 100
+resumes in one call and report the cost per resume.
+
+Run from the backend directory:
+    python benchmarks/bench_role_matching.py [resumes]
+"""
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from insights.role_catalog import RoleCatalog  # noqa: E402
+from matching.skills import TECH_SKILLS  # noqa: E402
+
+KEYWORDS = [f"domain{i}" for i in range(400)]
+BATCH = 100
+
+
+def legacy_top_roles(profiles, resume_skills, total_experience, keyword_hits, k=5):
+    """The previous per-role loop of match_job_roles."""
+    role_scores = []
+    for role_name, role_profile in profiles.items():
+        profile_skills = [s.lower() for s in role_profile["skills"]]
+        matched_skills = [s for s in resume_skills if s in profile_skills]
+        skill_overlap = len(matched_skills) / len(profile_skills) if profile_skills else 0
+        exp_min, exp_max = role_profile["experience_years"]
+        experience_match = 1.0 if exp_min <= total_experience <= exp_max else 0.5
+        keywords_found = sum(1 for kw in role_profile["keywords"] if kw in keyword_hits)
+        keyword_bonus = min(keywords_found * 0.1, 0.2)
+        match_score = (skill_overlap * 0.6 + experience_match * 0.3 + keyword_bonus * 0.1) * 100
+        role_scores.append({
+            "title": role_name,
+            "match_score": match_score,
+            "required_skills": profile_skills[:8],
+            "your_skills": matched_skills[:8],
+            "skill_overlap": skill_overlap,
+        })
+    role_scores.sort(key=lambda x: x["match_score"], reverse=True)
+    return role_scores[:k]
+
+
+def catalog(rng, size):
+    return {
+        f"Role {i}": {
+            "skills": rng.sample(TECH_SKILLS, rng.randint(6, 12)),
+            "experience_years": sorted(rng.sample(range(16), 2)),
+            "keywords": rng.sample(KEYWORDS, rng.randint(2, 5)),
+        }
+        for i in range(size)
+    }
+
+
+def resume(rng):
+    return (
+        rng.sample(TECH_SKILLS, rng.randint(8, 25)),
+        rng.randint(0, 15),
+        frozenset(rng.sample(KEYWORDS, rng.randint(0, 6))),
+    )
+
+
+def median_ms(fn, items):
+    samples = []
+    for item in items:
+        start = time.perf_counter()
+        fn(*item)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rng = random.Random(42)
+    resumes = [resume(rng) for _ in range(n)]
+
+    print("=" * 60)
+    print(f"ROLE MATCHING BENCHMARK ({n} resumes)")
+    print("=" * 60)
+    print(f"{'roles':>6} {'build ms':>9} {'loop ms':>9} {'matrix ms':>10} {'batch ms/resume':>16}")
+    for size in (10, 3_000):
+        profiles = catalog(rng, size)
+        start = time.perf_counter()
+        compiled = RoleCatalog(profiles)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        loop_ms = median_ms(lambda s, y, h: legacy_top_roles(profiles, s, y, h), resumes)
+        matrix_ms = median_ms(lambda s, y, h: compiled.top_roles([s], [y], [h]), resumes)
+        batches = [resumes[i:i + BATCH] for i in range(0, n, BATCH)]
+        batch_ms = median_ms(lambda *batch: compiled.top_roles(*zip(*batch)), batches) / BATCH
+
+        for s, y, h in resumes[:10]:
+            expected = legacy_top_roles(profiles, s, y, h)
+            got = compiled.top_roles([s], [y], [h])[0]
+            assert [r["title"] for r in got] == [r["title"] for r in expected]
+        print(f"{size:>6} {build_ms:>9.1f} {loop_ms:>9.3f} {matrix_ms:>10.3f} {batch_ms:>16.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+"""Benchmark: cold start of the API (import cost and time to first response).
+
+Each run is a fresh interpreter. ``python -X importtime -c "import main"``
+gives the cumulative import time of ``main`` and the most expensive
+top-level packages. A second child imports ``main`` and sends one ASGI
+request to "/" (no lifespan, so MongoDB is not involved), timing both steps
+from interpreter start.
+
+Heavy libraries that are only needed on specific code paths must not be
+imported by ``import main``. The script exits non-zero if one of them is, or
+if the median time to first response exceeds the budget.
+
+Run from the backend directory:
+    python benchmarks/bench_startup.py [runs] [budget_ms]
+"""
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFERRED_MODULES = ("sklearn", "scipy", "joblib", "nltk", "pdfplumber", "docx", "jose", "passlib", "bcrypt", "httpx")
+DEFAULT_BUDGET_MS = 2500
+
+FIRST_RESPONSE = """
+import asyncio, json, sys, time
+start = time.perf_counter()
+import main
+imported = time.perf_counter()
+
+async def first_response():
+    scope = {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+             "scheme": "http", "path": "/", "raw_path": b"/", "query_string": b"", "root_path": "",
+             "headers": [(b"host", b"localhost")], "client": ("127.0.0.1", 1), "server": ("localhost", 80)}
+    status = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+
+    await main.app(scope, receive, send)
+    return status[0]
+
+status = asyncio.run(first_response())
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "first_response_ms": (time.perf_counter() - start) * 1000,
+    "status": status,
+    "deferred_loaded": [m for m in %r if m in sys.modules],
+}))
+""" % (DEFERRED_MODULES,)
+
+
+def importtime_profile():
+    """Cumulative microseconds of ``main`` and of each top-level package it pulls in."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    )
+    packages = defaultdict(int)
+    total = 0
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)", line)
+        if not match:
+            continue
+        self_us, name = int(match.group(1)), match.group(4)
+        if name == "main":
+            total = int(match.group(2))
+        packages[name.split(".")[0]] += self_us
+    return total, packages
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    budget_ms = float(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_BUDGET_MS
+
+    print("=" * 60)
+    print(f"API COLD START BENCHMARK ({runs} runs, budget {budget_ms:.0f} ms)")
+    print("=" * 60)
+
+    total_us, packages = importtime_profile()
+    print(f"importtime 'main' (cumulative): {total_us / 1000:8.1f} ms")
+    print(f"{'top packages (self time)':<30}{'ms':>8}")
+    for name, self_us in sorted(packages.items(), key=lambda item: -item[1])[:10]:
+        print(f"  {name:<28}{self_us / 1000:>8.1f}")
+
+    samples = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", FIRST_RESPONSE],
+            cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+        )
+        samples.append(json.loads(result.stdout.strip().splitlines()[-1]))
+
+    import_ms = statistics.median(s["import_ms"] for s in samples)
+    first_ms = statistics.median(s["first_response_ms"] for s in samples)
+    loaded = sorted({m for s in samples for m in s["deferred_loaded"]})
+    print(f"import main (median):           {import_ms:8.1f} ms")
+    print(f"first response (median):        {first_ms:8.1f} ms  (status {samples[0]['status']})")
+    print(f"deferred modules loaded:        {', '.join(loaded) or 'none'}")
+
+    failures = []
+    if loaded:
+        failures.append(f"imported at startup: {', '.join(loaded)}")
+    if first_ms > budget_ms:
+        failures.append(f"first response {first_ms:.0f} ms exceeds budget {budget_ms:.0f} ms")
+    for failure in failures:
+        print(f"❌ {failure}")
+    if failures:
+        sys.exit(1)
+    print("✅ Within startup budget")
+
+
+if __name__ == "__main__":
+    main()
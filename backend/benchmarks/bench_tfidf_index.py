@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""Benchmark: TF-IDF resume index build, query, append and save at scale.
+
+Query latency is compared against the naive approach of scoring with
+sklearn's cosine_similarity and fully sorting every score.
+
+Run from the backend directory:
+    python benchmarks/bench_tfidf_index.py [resumes]
+"""
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sklearn.metrics.pairwise import cosine_similarity  # noqa: E402
+
+from matching.skills import TECH_SKILLS  # noqa: E402
+from matching.tfidf_index import TfidfIndex  # noqa: E402
+
+TOKENS_PER_RESUME = 150
+FILLER_VOCABULARY = 20000
+
+
+def synthetic_corpus(n, rng):
+    skill_tokens = [token for skill in TECH_SKILLS for token in skill.split()]
+    filler = [f"word{i}" for i in range(FILLER_VOCABULARY)]
+    # Zipf-like filler so a few words are common and most are rare
+    weights = 1.0 / np.arange(1, FILLER_VOCABULARY + 1)
+    weights /= weights.sum()
+    np_rng = np.random.default_rng(rng.randrange(1 << 30))
+    drawn = np_rng.choice(FILLER_VOCABULARY, size=(n, TOKENS_PER_RESUME - 15), p=weights)
+    texts = []
+    for row in drawn:
+        words = [filler[i] for i in row] + rng.sample(skill_tokens, 15)
+        rng.shuffle(words)
+        texts.append(" ".join(words))
+    return texts
+
+
+def percentile_ms(samples, pct):
+    return float(np.percentile(samples, pct)) * 1000
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(42)
+    texts = synthetic_corpus(n, rng)
+    ids = [f"{i:024x}" for i in range(n)]
+    jds = [" ".join(rng.sample(TECH_SKILLS, 10)) for _ in range(50)]
+
+    print("=" * 60)
+    print(f"TF-IDF RESUME INDEX BENCHMARK ({n} resumes)")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    index = TfidfIndex.build(ids, texts)
+    print(f"build:            {time.perf_counter() - start:8.2f} s  "
+          f"({index.matrix.shape[1]} terms, {index.matrix.nnz} nnz)")
+
+    naive, indexed = [], []
+    for jd in jds:
+        start = time.perf_counter()
+        scores = cosine_similarity(index.vectorizer.transform([jd]), index.matrix).ravel()
+        expected = [ids[i] for i in np.argsort(-scores, kind="stable")[:10]]
+        naive.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        results = index.query(jd, top_k=10)
+        indexed.append(time.perf_counter() - start)
+        assert [resume_id for resume_id, _ in results] == expected[:len(results)]
+
+    print(f"{'query (top 10)':<18}{'p50 ms':>8}{'p95 ms':>8}")
+    print(f"{'naive + argsort':<18}{percentile_ms(naive, 50):>8.2f}{percentile_ms(naive, 95):>8.2f}")
+    print(f"{'index':<18}{percentile_ms(indexed, 50):>8.2f}{percentile_ms(indexed, 95):>8.2f}")
+
+    new_texts = synthetic_corpus(1000, rng)
+    start = time.perf_counter()
+    for i, text in enumerate(new_texts):
+        index.add(f"new{i}", text)
+    append_s = time.perf_counter() - start
+    start = time.perf_counter()
+    index.query(jds[0], top_k=10)
+    print(f"append 1000:      {append_s * 1000:8.1f} ms  (first query after: "
+          f"{(time.perf_counter() - start) * 1000:.1f} ms incl. merge)")
+
+    directory = tempfile.mkdtemp()
+    try:
+        target = os.path.join(directory, "tfidf_index")
+        start = time.perf_counter()
+        index.save(target)
+        save_s = time.perf_counter() - start
+        size_mb = sum(os.path.getsize(os.path.join(target, f)) for f in os.listdir(target)) / 1e6
+        start = time.perf_counter()
+        TfidfIndex.load(target)
+        print(f"save / load:      {save_s:8.2f} s / {time.perf_counter() - start:.2f} s  ({size_mb:.1f} MB on disk)")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+"""Benchmark: /analytics/top-skills as a Python scan vs a MongoDB aggregation.
+
+Needs a running mongod. Seeds a scratch database with synthetic resumes,
+times both strategies and drops the database afterwards:
+    MONGODB_URL=mongodb://localhost:27017 python benchmarks/bench_top_skills.py 10000 50000
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pymongo import MongoClient  # noqa: E402
+
+from analytics.services import TOP_SKILLS_PIPELINE  # noqa: E402
+from matching.skills import TECH_SKILLS  # noqa: E402
+from resume.cleaner import clean_text  # noqa: E402
+from resume.fingerprint import compute_fingerprint  # noqa: E402
+
+MONGODB_URL = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
+FILLER = "Owned delivery of customer facing features and collaborated across teams. " * 30
+
+
+def synthetic_resume(rng):
+    text = " ".join(f"Built production systems with {s}. {FILLER}" for s in rng.sample(TECH_SKILLS, 12))
+    return {"resume_text": text, "cleaned_text": clean_text(text), "fingerprint": compute_fingerprint(text)}
+
+
+def legacy_top_skills(collection):
+    """The original implementation: pull every document and substring-scan it."""
+    skill_count = {skill: 0 for skill in TECH_SKILLS}
+    for resume in collection.find():
+        text = resume.get("cleaned_text", "")
+        for skill in TECH_SKILLS:
+            if skill in text:
+                skill_count[skill] += 1
+    return skill_count
+
+
+def aggregated_top_skills(collection):
+    return {row["_id"]: row["count"] for row in collection.aggregate(TOP_SKILLS_PIPELINE)}
+
+
+def main(sizes):
+    client = MongoClient(MONGODB_URL, serverSelectionTimeoutMS=5000)
+    db = client["bench_top_skills"]
+    collection = db["resumes"]
+    rng = random.Random(7)
+    templates = [synthetic_resume(rng) for _ in range(200)]
+
+    print("=" * 60)
+    print("TOP SKILLS BENCHMARK")
+    print("=" * 60)
+    print(f"{'resumes':>8} {'python scan s':>14} {'aggregation s':>14} {'speedup':>8}")
+    try:
+        collection.drop()
+        seeded = 0
+        for size in sizes:
+            while seeded < size:
+                batch = min(1000, size - seeded)
+                collection.insert_many([dict(rng.choice(templates)) for _ in range(batch)])
+                seeded += batch
+
+            start = time.perf_counter()
+            legacy_top_skills(collection)
+            legacy_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            aggregated_top_skills(collection)
+            aggregated_s = time.perf_counter() - start
+
+            print(f"{size:>8} {legacy_s:>14.3f} {aggregated_s:>14.3f} {legacy_s / aggregated_s:>7.1f}x")
+    finally:
+        client.drop_database(db.name)
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1000, 10000, 50000])
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""Load test: concurrent /resume/upload throughput against a running server.
+
+Start the API (with MongoDB available), then run from the backend directory:
+    python benchmarks/load_test_upload.py --url http://localhost:8000 --requests 200 --concurrency 32
+
+Run it once on a build with blocking pymongo inserts and once on the Motor
+build to compare the reported uploads/s and latency percentiles.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+def make_pdf(lines):
+    """Build a small single-page text PDF without extra dependencies."""
+    content = ["BT", "/F1 11 Tf", "50 780 Td", "14 TL"]
+    for line in lines:
+        escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+        content.append(f"({escaped}) Tj T*")
+    content.append("ET")
+    stream = "\n".join(content).encode("latin-1")
+
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Contents 4 0 R /Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length " + str(len(stream)).encode() + b" >>\nstream\n" + stream + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref_offset = len(pdf)
+    pdf += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        pdf += f"{offset:010d} 00000 n \n".encode()
+    pdf += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode()
+    return pdf
+
+
+RESUME_LINES = [
+    "Jane Doe - Senior Software Engineer",
+    "6 years of experience building APIs with Python, FastAPI and Django.",
+    "Deployed services with Docker, Kubernetes and GitHub Actions on AWS.",
+    "Led a team of 4 engineers, improved latency by 40%.",
+] * 10
+
+
+async def upload(client, url, pdf, index):
+    start = time.perf_counter()
+    response = await client.post(
+        f"{url}/resume/upload",
+        files={"file": (f"resume_{index}.pdf", pdf, "application/pdf")},
+    )
+    return response.status_code, time.perf_counter() - start
+
+
+async def run(url, total, concurrency):
+    pdf = make_pdf(RESUME_LINES)
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency)
+
+    async with httpx.AsyncClient(timeout=60, limits=limits) as client:
+        async def bounded(index):
+            async with semaphore:
+                return await upload(client, url, pdf, index)
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(bounded(i) for i in range(total)))
+        elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for _, latency in results)
+    failures = sum(1 for status, _ in results if status != 200)
+    print("=" * 60)
+    print(f"UPLOAD LOAD TEST: {total} uploads, concurrency {concurrency}")
+    print("=" * 60)
+    print(f"Throughput : {total / elapsed:.1f} uploads/s")
+    print(f"Latency p50: {statistics.median(latencies) * 1000:.1f} ms")
+    print(f"Latency p95: {latencies[int(len(latencies) * 0.95) - 1] * 1000:.1f} ms")
+    print(f"Failures   : {failures}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+    asyncio.run(run(args.url.rstrip("/"), args.requests, args.concurrency))
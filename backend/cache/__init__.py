@@ -0,0 +1,2 @@
+# Response Cache Module
+# Content-addressed caching of deterministic analysis responses (in-process LRU + optional Redis)
@@ -0,0 +1,323 @@
+"""
+Content-addressed cache for deterministic analysis endpoints.
+
+The endpoints in CACHED_PATHS are pure functions of their JSON body. A
+response is keyed by the SHA-256 of the engine version, the path and the
+canonical JSON body (sorted keys, no insignificant whitespace), so
+re-posting the same payload in any key order or formatting hits the same
+entry. Hits replay the stored response bytes without running validation
+or the analyzer.
+
+Two tiers:
+- an in-process LRU bounded by entry count and total bytes, with a TTL;
+- an optional shared Redis tier (REDIS_URL), so replicas share entries.
+  Redis errors are treated as misses.
+
+Every cached-path 200 carries ``ETag: "<key>"``. Because the response is a
+function of the key, a request whose If-None-Match equals its key gets a
+304 even when the entry has since been evicted.
+
+ENGINE_VERSION is a hash of the analysis packages' source plus the data
+files they load (ENGINE_DATA_ENV, e.g. the ROLE_CATALOG_PATH catalog), so
+a deploy that changes scoring or the role catalog never serves responses
+computed from the old ones.
+
+Configuration (environment):
+    RESPONSE_CACHE_MAX_ENTRIES  in-process entries (default: 1024; 0 disables caching)
+    RESPONSE_CACHE_MAX_BYTES    in-process body bytes (default: 64 MiB)
+    RESPONSE_CACHE_TTL_SECONDS  entry lifetime in both tiers (default: 3600)
+    REDIS_URL                   enables the shared tier, e.g. redis://redis:6379/0
+"""
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Pure functions of their request body
+CACHED_PATHS = frozenset({
+    "/ats/score",
+    "/insights/keyword-gaps",
+    "/insights/job-role-match",
+    "/insights/career-paths",
+    "/ai/resume-improvements",
+    "/ai/cover-letter",
+    "/ai/interview-prep",
+    "/analytics-advanced/compare",
+    "/report",
+})
+
+# Packages whose code decides the cached responses
+ENGINE_PACKAGES = ("matching", "insights", "ai_enhancements", "advanced_analytics", "report")
+
+# Environment variables naming data files that decide the cached responses
+ENGINE_DATA_ENV = ("ROLE_CATALOG_PATH",)
+
+REDIS_KEY_PREFIX = "response-cache:"
+
+
+def engine_data_files(names=ENGINE_DATA_ENV) -> Tuple[str, ...]:
+    return tuple(os.environ[name] for name in names if os.getenv(name))
+
+
+def engine_version(packages=ENGINE_PACKAGES, root: str = BACKEND_DIR, data_files=None) -> str:
+    """Hash of the .py sources of ``packages`` (read, not imported) and of ``data_files``.
+
+    ``data_files`` defaults to the files named by ENGINE_DATA_ENV.
+    """
+    digest = hashlib.sha256()
+    for package in packages:
+        directory = os.path.join(root, package)
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(".py"):
+                digest.update(f"{package}/{name}\0".encode())
+                with open(os.path.join(directory, name), "rb") as handle:
+                    digest.update(handle.read())
+    for path in engine_data_files() if data_files is None else data_files:
+        digest.update(f"data/{os.path.basename(path)}\0".encode())
+        try:
+            with open(path, "rb") as handle:
+                digest.update(handle.read())
+        except OSError:
+            # Loading it fails too, so nothing is cached against it
+            digest.update(b"missing")
+    return digest.hexdigest()[:16]
+
+
+ENGINE_VERSION = engine_version()
+
+
+def cache_key(path: str, body: bytes, version: str = ENGINE_VERSION) -> Optional[str]:
+    """Key for a JSON request body, or None if it is not valid JSON."""
+    try:
+        canonical = json.dumps(json.loads(body), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    except (ValueError, UnicodeDecodeError):
+        return None
+    return hashlib.sha256(f"{version}\0{path}\0{canonical}".encode()).hexdigest()
+
+
+class LRUTTLCache:
+    """key -> bytes, evicting least recently used entries beyond a count or byte budget."""
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024, ttl: float = 3600):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.bytes = 0
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, body = entry
+        if expires_at <= time.monotonic():
+            self._pop(key)
+            return None
+        self._entries.move_to_end(key)
+        return body
+
+    def put(self, key: str, body: bytes):
+        if self.max_entries <= 0 or len(body) > self.max_bytes:
+            return
+        self._pop(key)
+        self._entries[key] = (time.monotonic() + self.ttl, body)
+        self.bytes += len(body)
+        while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+            self._pop(next(iter(self._entries)))
+
+    def _pop(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= len(entry[1])
+
+
+class ResponseCache:
+    """In-process LRU in front of an optional shared store (redis.asyncio-compatible)."""
+
+    def __init__(self, local: LRUTTLCache, shared=None):
+        self.local = local
+        self.shared = shared
+        self.enabled = local.max_entries > 0
+        self.local_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.shared_errors = 0
+
+    async def get(self, key: str) -> Optional[bytes]:
+        body = self.local.get(key)
+        if body is not None:
+            self.local_hits += 1
+            return body
+        if self.shared is not None:
+            try:
+                body = await self.shared.get(REDIS_KEY_PREFIX + key)
+            except Exception as e:
+                self._shared_failed(e)
+            if body is not None:
+                self.shared_hits += 1
+                self.local.put(key, body)
+                return body
+        self.misses += 1
+        return None
+
+    async def put(self, key: str, body: bytes):
+        self.local.put(key, body)
+        if self.shared is not None:
+            try:
+                await self.shared.set(REDIS_KEY_PREFIX + key, body, ex=max(int(self.local.ttl), 1))
+            except Exception as e:
+                self._shared_failed(e)
+
+    def _shared_failed(self, error: Exception):
+        self.shared_errors += 1
+        # One line per 100 failures keeps a Redis outage from flooding the log
+        if self.shared_errors % 100 == 1:
+            print(f"⚠️  Response cache Redis tier unavailable: {error}")
+
+    def stats(self) -> Dict:
+        hits = self.local_hits + self.shared_hits
+        lookups = hits + self.misses
+        return {
+            "lookups": lookups,
+            "hits": hits,
+            "local_hits": self.local_hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "entries": len(self.local),
+            "bytes": self.local.bytes,
+            "shared": self.shared is not None,
+            "shared_errors": self.shared_errors,
+            "engine_version": ENGINE_VERSION,
+        }
+
+    async def aclose(self):
+        if self.shared is not None:
+            try:
+                await self.shared.aclose()
+            except Exception:
+                pass
+
+
+def _redis_from_env():
+    url = os.getenv("REDIS_URL")
+    if not url:
+        return None
+    try:
+        import redis.asyncio as redis
+    except ImportError:
+        print("⚠️  REDIS_URL is set but the redis package is not installed; response cache is local only")
+        return None
+    # Short timeouts: a slow Redis must not be slower than recomputing
+    return redis.Redis.from_url(url, socket_timeout=0.25, socket_connect_timeout=0.25)
+
+
+def _if_none_match(value: bytes):
+    return {tag.strip().removeprefix(b"W/") for tag in value.split(b",")}
+
+
+class ResponseCacheMiddleware:
+    """Serve CACHED_PATHS POSTs from ``cache``; store their 200 JSON responses."""
+
+    def __init__(self, app, cache: "ResponseCache" = None, paths=CACHED_PATHS):
+        self.app = app
+        self.cache = cache if cache is not None else RESPONSE_CACHE
+        self.paths = paths
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or scope["path"] not in self.paths
+            or not self.cache.enabled
+        ):
+            return await self.app(scope, receive, send)
+
+        chunks = []
+        while True:
+            message = await receive()
+            if message["type"] != "http.request":
+                return
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        body = b"".join(chunks)
+
+        key = cache_key(scope["path"], body)
+        if key is None:
+            return await self.app(scope, self._replay(body, receive), send)
+        etag = f'"{key}"'.encode()
+
+        if etag in _if_none_match(dict(scope["headers"]).get(b"if-none-match", b"")):
+            self.cache.not_modified += 1
+            return await self._send(send, 304, b"", etag)
+
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return await self._send(send, 200, cached, etag, b"HIT")
+
+        status = None
+        captured = []
+
+        async def capture(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if status == 200:
+                    message = dict(message)
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"etag", etag), (b"x-cache", b"MISS"),
+                    ]
+            elif message["type"] == "http.response.body" and status == 200:
+                captured.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    await send(message)
+                    await self.cache.put(key, b"".join(captured))
+                    return
+            await send(message)
+
+        await self.app(scope, self._replay(body, receive), capture)
+
+    @staticmethod
+    def _replay(body: bytes, receive):
+        sent = False
+
+        async def replay():
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        return replay
+
+    @staticmethod
+    async def _send(send, status: int, body: bytes, etag: bytes, cache_status: bytes = None):
+        headers = [(b"etag", etag)]
+        if status == 200:
+            headers += [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"x-cache", cache_status),
+            ]
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+
+RESPONSE_CACHE = ResponseCache(
+    LRUTTLCache(
+        max_entries=int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES") or 1024),
+        max_bytes=int(os.getenv("RESPONSE_CACHE_MAX_BYTES") or 64 * 1024 * 1024),
+        ttl=float(os.getenv("RESPONSE_CACHE_TTL_SECONDS") or 3600),
+    ),
+    shared=_redis_from_env(),
+)
@@ -1,21 +1,31 @@
-from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
-
-MONGO_URL = "mongodb://localhost:27017"
-
-try:
-    client = MongoClient(MONGO_URL, serverSelectionTimeoutMS=5000)
-    # Test connection
-    client.admin.command('ping')
-    print("✅ MongoDB connected successfully")
-    mongo_db = client["smart_hiring"]
-    resume_collection = mongo_db["resumes"]
-except (ConnectionFailure, ServerSelectionTimeoutError) as e:
-    print("❌ WARNING: MongoDB is not running!")
-    print(f"   Error: {e}")
-    print("   Please start MongoDB with: mongod")
-    print("   Or install MongoDB from: https://www.mongodb.com/try/download/community")
-    # Create dummy collections to prevent import errors
-    client = None
-    mongo_db = None
-    resume_collection = None
+"""
+Collection accessors over the shared async Motor client (database.schema).
+
+The client is opened and closed by the FastAPI lifespan in main.py. Until
+then these return ``None`` and routers answer 503, as they do when MongoDB
+is unreachable.
+"""
+from pymongo.errors import ConnectionFailure
+
+from database import schema
+
+# Raised by Motor operations when MongoDB cannot be reached
+MONGO_UNAVAILABLE_ERRORS = (ConnectionFailure,)
+
+
+def get_collection(name: str):
+    if schema.mongodb_client is None:
+        return None
+    return schema.get_database()[name]
+
+
+def get_resume_collection():
+    return get_collection("resumes")
+
+
+def get_skill_counts_collection():
+    return get_collection("skill_counts")
+
+
+def get_match_results_collection():
+    return get_collection("match_results")
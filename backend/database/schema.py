@@ -14,9 +14,10 @@ Collections:
 
 Indexes:
 - users: email (unique), username (unique), created_at
-- resumes: user_id, uploaded_at, ats_score
+- resumes: user_id, uploaded_at, ats_score, content_hash (unique)
 - job_descriptions: user_id, posted_at
-- match_results: user_id, resume_id, jd_id, created_at
+- match_results: user_id, resume_id, jd_id, created_at, match_percentage,
+  (jd_id, created_at, match_percentage)
 - analytics_events: user_id, event_type, timestamp
 """
 
@@ -36,10 +37,11 @@ mongodb_client: AsyncIOMotorClient = None
 
 
 async def connect_to_mongo():
-    """Connect to MongoDB on startup."""
+    """Create the MongoDB client on startup (no I/O; it connects on first use)."""
     global mongodb_client
-    mongodb_client = AsyncIOMotorClient(MONGODB_URL)
-    print(f"✅ Connected to MongoDB at {MONGODB_URL}")
+    # Fail fast (instead of the 30 s default) when MongoDB is unreachable
+    mongodb_client = AsyncIOMotorClient(MONGODB_URL, serverSelectionTimeoutMS=5000)
+    print(f"✅ MongoDB client ready for {MONGODB_URL}")
 
 
 async def close_mongo_connection():
@@ -47,6 +49,7 @@ async def close_mongo_connection():
     global mongodb_client
     if mongodb_client:
         mongodb_client.close()
+        mongodb_client = None
         print("❌ Closed MongoDB connection")
 
 
@@ -69,6 +72,9 @@ async def create_indexes():
     await db.resumes.create_index([("uploaded_at", DESCENDING)])
     await db.resumes.create_index([("ats_score", DESCENDING)])
     await db.resumes.create_index([("is_deleted", ASCENDING)])
+    await db.resumes.create_index([("fingerprint.version", ASCENDING)])
+    # Upload dedup key; sparse so resumes stored before hashing are exempt
+    await db.resumes.create_index([("content_hash", ASCENDING)], unique=True, sparse=True)
     
     # Job descriptions collection indexes
     await db.job_descriptions.create_index([("user_id", ASCENDING)])
@@ -81,6 +87,10 @@ async def create_indexes():
     await db.match_results.create_index([("jd_id", ASCENDING)])
     await db.match_results.create_index([("created_at", DESCENDING)])
     await db.match_results.create_index([("match_percentage", DESCENDING)])
+    # Covers JD-filtered match-distribution queries without fetching documents
+    await db.match_results.create_index(
+        [("jd_id", ASCENDING), ("created_at", DESCENDING), ("match_percentage", DESCENDING)]
+    )
     
     # Analytics events collection indexes
     await db.analytics_events.create_index([("user_id", ASCENDING)])
@@ -0,0 +1,2 @@
+# Health Module
+# Liveness and readiness probes, kept separate so CPU-only endpoints serve while MongoDB is down
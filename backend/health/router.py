@@ -0,0 +1,53 @@
+"""
+Liveness and readiness probes.
+
+- ``/health/live``: the process is up and serving requests. No I/O.
+- ``/health/ready``: startup (the lifespan) has finished, so the app can take
+  traffic. MongoDB and the in-memory indexes are reported but do not gate
+  readiness: CPU-only endpoints such as ``/ats/score`` work without them,
+  and MongoDB-backed endpoints answer 503 on their own until it is reachable.
+"""
+import asyncio
+
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+
+from database import schema
+from matching.tfidf_index import TFIDF_INDEX
+from resume.near_duplicates import NEAR_DUP_INDEX
+from search.skill_index import SKILL_INDEX
+
+# Keep the probe well inside a typical 1 s k8s probe timeout budget
+MONGO_PING_TIMEOUT = 0.5
+
+router = APIRouter(prefix="/health", tags=["Health"])
+
+
+async def _mongo_status() -> str:
+    if schema.mongodb_client is None:
+        return "not connected"
+    try:
+        await asyncio.wait_for(schema.mongodb_client.admin.command("ping"), MONGO_PING_TIMEOUT)
+    except Exception:
+        return "unavailable"
+    return "up"
+
+
+@router.get("/live")
+async def liveness():
+    return {"status": "alive"}
+
+
+@router.get("/ready")
+async def readiness(request: Request):
+    ready = getattr(request.app.state, "ready", False)
+    body = {
+        "status": "ready" if ready else "starting",
+        "mongo": await _mongo_status(),
+        "indexes": {
+            "tfidf": TFIDF_INDEX.index is not None,
+            "skills": SKILL_INDEX.index is not None,
+            "near_duplicates": NEAR_DUP_INDEX.index is not None,
+        },
+    }
+    return JSONResponse(body, status_code=200 if ready else 503)
@@ -1,11 +1,14 @@
 import re
 from typing import List, Dict, Tuple
 from collections import Counter
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import numpy as np
 
-# Role profiles with typical skills and experience
+from insights.career_graph import get_career_graph
+from insights.role_catalog import get_role_catalog
+from matching.analysis_context import TextAnalysis
+from matching.skill_matcher import SkillMatcher
+
+# Role profiles with typical skills and experience; career_track names the
+# CAREER_PATHS entry a role progresses from
 ROLE_PROFILES = {
     "Junior Software Developer": {
         "skills": ["python", "javascript", "git", "html", "css", "rest api", "sql", "debugging"],
@@ -15,12 +18,14 @@ ROLE_PROFILES = {
     "Mid-Level Backend Developer": {
         "skills": ["python", "fastapi", "django", "postgresql", "mongodb", "docker", "microservices", "testing"],
         "experience_years": (2, 5),
-        "keywords": ["backend", "server", "api design", "scalability"]
+        "keywords": ["backend", "server", "api design", "scalability"],
+        "career_track": "Backend Developer"
     },
     "Senior Backend Developer": {
         "skills": ["python", "fastapi", "django", "postgresql", "mongodb", "docker", "kubernetes", "aws", "system design", "leadership"],
         "experience_years": (5, 15),
-        "keywords": ["architect", "lead", "technical lead", "senior", "mentoring"]
+        "keywords": ["architect", "lead", "technical lead", "senior", "mentoring"],
+        "career_track": "Backend Developer"
     },
     "Full Stack Developer": {
         "skills": ["javascript", "react", "python", "fastapi", "postgresql", "mongodb", "docker", "html", "css"],
@@ -30,7 +35,8 @@ ROLE_PROFILES = {
     "Frontend Developer": {
         "skills": ["javascript", "react", "html", "css", "typescript", "responsive design", "ui/ux"],
         "experience_years": (1, 8),
-        "keywords": ["ui", "frontend", "react", "javascript"]
+        "keywords": ["ui", "frontend", "react", "javascript"],
+        "career_track": "Frontend Developer"
     },
     "DevOps Engineer": {
         "skills": ["docker", "kubernetes", "aws", "ci/cd", "jenkins", "terraform", "linux", "monitoring"],
@@ -40,7 +46,8 @@ ROLE_PROFILES = {
     "Data Engineer": {
         "skills": ["python", "sql", "spark", "hadoop", "etl", "postgresql", "mongodb", "airflow"],
         "experience_years": (2, 10),
-        "keywords": ["data", "pipeline", "etl", "big data"]
+        "keywords": ["data", "pipeline", "etl", "big data"],
+        "career_track": "Data Engineer"
     },
     "Machine Learning Engineer": {
         "skills": ["python", "tensorflow", "pytorch", "scikit-learn", "numpy", "pandas", "sql", "statistics"],
@@ -79,40 +86,70 @@ TECHNICAL_KEYWORDS = {
 }
 
 
+class KeywordMatcher:
+    """Word-bounded keyword counts grouped by category, in one scan.
+
+    All keywords share one compiled ``SkillMatcher``, so "java" does not
+    fire inside "javascript" and "c++" is matched literally. A keyword may
+    belong to several categories.
+    """
+
+    def __init__(self, categories: Dict[str, List[str]]):
+        self.categories = {category: [kw.lower() for kw in keywords] for category, keywords in categories.items()}
+        self._matcher = SkillMatcher(kw for keywords in self.categories.values() for kw in keywords)
+
+    def count(self, text: str) -> Dict[str, Dict[str, int]]:
+        """category -> {keyword: occurrences} for the keywords present in ``text``.
+
+        Keywords keep their declared order within each category; every
+        category is present, possibly empty.
+        """
+        counts = self._matcher.count(text)
+        return {
+            category: {kw: counts[kw] for kw in keywords if kw in counts}
+            for category, keywords in self.categories.items()
+        }
+
+
+KEYWORD_MATCHER = KeywordMatcher(TECHNICAL_KEYWORDS)
+
+
 def extract_keywords_by_category(text: str) -> Dict[str, List[str]]:
     """Extract keywords from text and categorize them."""
-    text_lower = text.lower()
-    found_keywords = {}
-    
-    for category, keywords in TECHNICAL_KEYWORDS.items():
-        found_keywords[category] = []
-        for keyword in keywords:
-            if keyword in text_lower:
-                found_keywords[category].append(keyword)
-    
-    return found_keywords
+    return {category: list(hits) for category, hits in KEYWORD_MATCHER.count(text).items()}
 
 
-def analyze_keyword_gaps(resume_text: str, job_description: str) -> Tuple[List[Dict], float, List[str], List[str]]:
-    """Analyze gaps between resume and job description."""
-    resume_keywords = extract_keywords_by_category(resume_text)
-    jd_keywords = extract_keywords_by_category(job_description)
-    
-    # Count keyword frequencies in JD
-    jd_text_lower = job_description.lower()
+def year_mentions_in_lowered(text_lower: str) -> Tuple[int, ...]:
+    """Every "N years"/"N yrs" figure in lowercased text."""
+    experience_pattern = r'(\d+)\s+years?|(\d+)\s+yrs?'
+    return tuple(int(match[0] or match[1]) for match in re.findall(experience_pattern, text_lower))
+
+
+def analyze_keyword_gaps(
+    resume_text: str,
+    job_description: str,
+    resume_doc: TextAnalysis = None,
+    jd_doc: TextAnalysis = None,
+) -> Tuple[List[Dict], float, List[str], List[str]]:
+    """Analyze gaps between resume and job description.
+
+    ``resume_doc``/``jd_doc`` share lowercasing and keyword hits with other analyzers.
+    """
+    resume_doc = resume_doc or TextAnalysis(resume_text)
+    jd_doc = jd_doc or TextAnalysis(job_description)
+    # Keyword frequencies in JD
     keyword_frequency = {}
     all_keywords = []
     
-    for category, keywords in jd_keywords.items():
-        for keyword in keywords:
-            count = len(re.findall(r'\b' + keyword + r'\b', jd_text_lower))
+    for category, hits in jd_doc.keyword_counts.items():
+        for keyword, count in hits.items():
             keyword_frequency[keyword] = (category, count)
             all_keywords.append(keyword)
     
     # Resume keywords
-    resume_all_keywords = []
-    for keywords in resume_keywords.values():
-        resume_all_keywords.extend(keywords)
+    resume_all_keywords = set()
+    for hits in resume_doc.keyword_counts.values():
+        resume_all_keywords.update(hits)
     
     # Find missing keywords
     missing_keywords = []
@@ -151,50 +188,27 @@ def analyze_keyword_gaps(resume_text: str, job_description: str) -> Tuple[List[D
     return missing_keywords, gap_score, critical_gaps, recommendations
 
 
-def match_job_roles(resume_text: str, skills_extracted: List[str] = None) -> Tuple[List[Dict], str, float]:
-    """Match resume to job roles based on skills and experience."""
+def match_job_roles(
+    resume_text: str,
+    skills_extracted: List[str] = None,
+    resume_doc: TextAnalysis = None,
+) -> Tuple[List[Dict], str, float]:
+    """Match resume to job roles based on skills and experience (see ``insights.role_catalog``)."""
     if skills_extracted is None:
         skills_extracted = []
     
-    resume_lower = resume_text.lower()
-    resume_keywords = extract_keywords_by_category(resume_text)
+    resume_doc = resume_doc or TextAnalysis(resume_text)
     all_resume_skills = [s.lower() for s in skills_extracted]
-    for keywords in resume_keywords.values():
+    for keywords in resume_doc.keyword_counts.values():
         all_resume_skills.extend(keywords)
     
     # Extract experience years
-    experience_pattern = r'(\d+)\s+years?|(\d+)\s+yrs?'
-    years_matches = re.findall(experience_pattern, resume_lower)
-    total_experience = sum(int(match[0] or match[1]) for match in years_matches) if years_matches else 0
+    total_experience = sum(resume_doc.year_mentions)
     
-    # Calculate role matches
-    role_scores = []
-    for role_name, role_profile in ROLE_PROFILES.items():
-        profile_skills = [s.lower() for s in role_profile["skills"]]
-        matched_skills = [s for s in all_resume_skills if s in profile_skills]
-        skill_overlap = len(matched_skills) / len(profile_skills) if profile_skills else 0
-        
-        # Check experience range
-        exp_min, exp_max = role_profile["experience_years"]
-        experience_match = 1.0 if exp_min <= total_experience <= exp_max else 0.5
-        
-        # Check keywords
-        keywords_found = sum(1 for kw in role_profile["keywords"] if kw in resume_lower)
-        keyword_bonus = min(keywords_found * 0.1, 0.2)
-        
-        match_score = (skill_overlap * 0.6 + experience_match * 0.3 + keyword_bonus * 0.1) * 100
-        
-        role_scores.append({
-            "title": role_name,
-            "match_score": match_score,
-            "required_skills": profile_skills[:8],
-            "your_skills": matched_skills[:8],
-            "skill_overlap": skill_overlap
-        })
-    
-    # Sort by match score
-    role_scores.sort(key=lambda x: x["match_score"], reverse=True)
-    top_roles = role_scores[:5]
+    # Score every role of the catalog at once; keep the top 5
+    [top_roles] = get_role_catalog().top_roles(
+        [all_resume_skills], [total_experience], [resume_doc.role_keywords], k=5
+    )
     
     # Determine current level
     if total_experience < 2:
@@ -210,40 +224,49 @@ def match_job_roles(resume_text: str, skills_extracted: List[str] = None) -> Tup
     return top_roles, current_level, confidence
 
 
-def suggest_career_paths(resume_text: str, skills_extracted: List[str] = None, experience_years: float = None) -> Tuple[str, List[Dict], List[str]]:
-    """Suggest career progression paths."""
+def suggest_career_paths(
+    resume_text: str,
+    skills_extracted: List[str] = None,
+    experience_years: float = None,
+    resume_doc: TextAnalysis = None,
+    role_match: Tuple[List[Dict], str, float] = None,
+) -> Tuple[str, List[Dict], List[str]]:
+    """Suggest career progression paths.
+
+    ``role_match`` is a ``match_job_roles`` result for the same resume, reused
+    instead of matching again. Paths are the cheapest (by skill gap)
+    progressions from the matched role in the career graph, possibly
+    several hops long.
+    """
     if skills_extracted is None:
         skills_extracted = []
+    resume_doc = resume_doc or TextAnalysis(resume_text)
     
     # Get current role match
-    top_roles, current_level, _ = match_job_roles(resume_text, skills_extracted)
+    if role_match is None:
+        role_match = match_job_roles(resume_text, skills_extracted, resume_doc=resume_doc)
+    top_roles, current_level, _ = role_match
     current_trajectory = top_roles[0]["title"] if top_roles else "Software Developer"
     
     # Extract experience if not provided
     if experience_years is None:
-        resume_lower = resume_text.lower()
-        years_pattern = r'(\d+)\s+years?|(\d+)\s+yrs?'
-        matches = re.findall(years_pattern, resume_lower)
-        experience_years = sum(int(m[0] or m[1]) for m in matches) if matches else 1
+        mentions = resume_doc.year_mentions
+        experience_years = sum(mentions) if mentions else 1
     
-    # Get career paths for current role
+    # Precomputed shortest skill-gap progressions from the current role
     recommended_paths = []
-    
-    # Find relevant career progressions
-    for base_role, progressions in CAREER_PATHS.items():
-        if base_role.lower() in current_trajectory.lower():
-            for next_role, required_skills in progressions:
-                path_info = {
-                    "current_role": current_trajectory,
-                    "next_role": next_role,
-                    "skill_gaps": required_skills,
-                    "experience_needed": f"{int(experience_years + 2)}-{int(experience_years + 4)} years",
-                    "learning_resources": [
-                        {"name": f"Learn {skill}", "url": f"https://learn.microsoft.com", "type": "course"}
-                        for skill in required_skills[:3]
-                    ]
-                }
-                recommended_paths.append(path_info)
+    for _, hops, next_role, via, skill_gaps in get_career_graph().top_progressions(current_trajectory, k=3):
+        recommended_paths.append({
+            "current_role": current_trajectory,
+            "next_role": next_role,
+            "via": list(via),
+            "skill_gaps": list(skill_gaps),
+            "experience_needed": f"{int(experience_years + 2 * hops)}-{int(experience_years + 4 * hops)} years",
+            "learning_resources": [
+                {"name": f"Learn {skill}", "url": f"https://learn.microsoft.com", "type": "course"}
+                for skill in skill_gaps[:3]
+            ]
+        })
     
     # If no specific paths found, suggest generic progressions
     if not recommended_paths:
@@ -251,6 +274,7 @@ def suggest_career_paths(resume_text: str, skills_extracted: List[str] = None, e
             {
                 "current_role": current_trajectory,
                 "next_role": "Senior " + current_trajectory,
+                "via": [],
                 "skill_gaps": ["leadership", "system design", "mentoring"],
                 "experience_needed": f"{int(experience_years + 3)}-{int(experience_years + 5)} years",
                 "learning_resources": [
@@ -0,0 +1,102 @@
+"""
+Career progressions as a weighted directed graph.
+
+Every CAREER_PATHS entry ``base -> (next_role, skills)`` is an edge whose
+cost is its skill gap (the number of skills to learn). Catalog roles whose
+profile names a ``career_track`` get a zero-cost edge to that track's
+node, e.g. "Mid-Level Backend Developer" -> "Backend Developer". That
+replaces matching track names as substrings of the role title.
+
+Shortest skill-gap paths from every node are computed once, when the
+graph is built. Each source keeps its MAX_PROGRESSIONS best targets,
+sorted by skill gap, then hops, then declaration order. Suggesting the
+top-k next moves for a matched role is then a dict lookup.
+"""
+import heapq
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from insights.role_catalog import RoleCatalog, get_role_catalog
+
+# (skill gap, progression hops, destination, intermediate roles, skills to learn in order)
+Progression = Tuple[int, int, str, Tuple[str, ...], Tuple[str, ...]]
+
+# Progressions kept per source role
+MAX_PROGRESSIONS = 10
+
+
+class CareerGraph:
+    """Shortest skill-gap progressions from every role, precomputed."""
+
+    def __init__(self, career_paths: Dict[str, List[Tuple[str, List[str]]]], tracks: Dict[str, str] = None):
+        # node -> [(cost, target, skills, is_progression)]
+        self.edges: Dict[str, List[Tuple[int, str, Tuple[str, ...], bool]]] = {}
+        self.targets = set()
+        for base_role, progressions in career_paths.items():
+            for next_role, skills in progressions:
+                self.edges.setdefault(base_role, []).append((len(skills), next_role, tuple(skills), True))
+                self.targets.add(next_role)
+        for role, track in (tracks or {}).items():
+            if role != track:
+                self.edges.setdefault(role, []).append((0, track, (), False))
+
+        self._order = {node: i for i, node in enumerate(dict.fromkeys(
+            [node for node in self.edges] + [target for edges in self.edges.values() for _, target, _, _ in edges]
+        ))}
+        self.progressions: Dict[str, List[Progression]] = {
+            source: self._shortest_from(source) for source in self.edges
+        }
+
+    def _shortest_from(self, source: str) -> List[Progression]:
+        """Dijkstra from ``source`` on (skill gap, progression hops), stopped after MAX_PROGRESSIONS.
+
+        Nodes settle in result order (ties go to earlier-declared roles), so
+        the first MAX_PROGRESSIONS progression targets settled are the best.
+        """
+        order = self._order
+        targets = self.targets
+        settled = set()
+        parent: Dict[str, Tuple[str, Tuple[str, ...]]] = {}
+        found: List[Progression] = []
+        # (skill gap, progression hops, declaration order, node, previous node, edge skills)
+        heap = [(0, 0, order[source], source, None, ())]
+        while heap and len(found) < MAX_PROGRESSIONS:
+            cost, steps, _, node, previous, edge_skills = heapq.heappop(heap)
+            if node in settled:
+                continue
+            settled.add(node)
+            parent[node] = (previous, edge_skills)
+            if node != source and node in targets and steps:
+                found.append(self._progression(source, node, cost, steps, parent))
+            for edge_cost, target, skills, is_progression in self.edges.get(node, ()):
+                if target not in settled:
+                    heapq.heappush(heap, (cost + edge_cost, steps + is_progression, order[target], target, node, skills))
+        return found
+
+    def _progression(self, source: str, node: str, cost: int, steps: int, parent: Dict) -> Progression:
+        path, skills = [], []
+        while node is not None:
+            path.append(node)
+            previous, edge_skills = parent[node]
+            skills[:0] = edge_skills
+            node = previous
+        path.reverse()
+        # Intermediate progression targets, without the zero-cost track hops
+        via = tuple(step for step in path[1:-1] if step in self.targets and step != source)
+        return cost, steps, path[-1], via, tuple(dict.fromkeys(skills))
+
+    def top_progressions(self, role: str, k: int = 3) -> List[Progression]:
+        """Cheapest ``k`` (at most MAX_PROGRESSIONS) progressions from ``role``; empty if it is not in the graph."""
+        return self.progressions.get(role, [])[:k]
+
+
+@lru_cache(maxsize=1)
+def _graph_for(catalog: RoleCatalog) -> CareerGraph:
+    from insights.analyzer import CAREER_PATHS  # analyzer imports this module
+
+    return CareerGraph(CAREER_PATHS, catalog.tracks)
+
+
+def get_career_graph(catalog: Optional[RoleCatalog] = None) -> CareerGraph:
+    """The graph over CAREER_PATHS and the role catalog's tracks; rebuilt if the catalog changes."""
+    return _graph_for(catalog or get_role_catalog())
@@ -0,0 +1,209 @@
+"""
+Role profiles compiled for vectorized matching.
+
+A catalog of role profiles ({title: {"skills", "experience_years",
+"keywords", optional "career_track"}}) becomes:
+- a sparse role x skill matrix (1 where the role lists the skill), plus
+  each profile's skill list length;
+- experience minimum/maximum arrays;
+- a sparse role x keyword matrix (how often the role lists the keyword),
+  with one compiled matcher over every role keyword.
+
+Scoring one resume, or a batch, against every role is then two sparse
+matrix products and a few array operations, followed by top-k selection.
+The formula is the one match_job_roles always used:
+
+    skill_overlap    = matched resume skills / len(profile skills)
+    experience_match = 1.0 if min <= years <= max else 0.5
+    keyword_bonus    = min(keywords found * 0.1, 0.2)
+    match_score      = (skill_overlap * 0.6 + experience_match * 0.3 + keyword_bonus * 0.1) * 100
+
+Resume skills are counted with multiplicity, as the previous list scan
+did. Ties keep catalog order.
+
+Configuration (environment):
+    ROLE_CATALOG_PATH   JSON file of role profiles in the shape of
+                        insights.analyzer.ROLE_PROFILES, with
+                        "experience_years" as [min, max]
+                        (default: the built-in ROLE_PROFILES); its
+                        contents are part of the response cache's
+                        ENGINE_VERSION
+"""
+import json
+import os
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Sequence
+
+import numpy as np
+
+from matching.skill_matcher import SkillMatcher
+
+
+def _role_level(exp_min: float) -> str:
+    if exp_min < 2:
+        return "junior"
+    if exp_min < 5:
+        return "mid"
+    return "senior"
+
+
+class RoleCatalog:
+    """Role profiles as sparse matrices and arrays, scored in bulk."""
+
+    def __init__(self, profiles: Dict[str, Dict]):
+        from scipy import sparse  # deferred: heavy and only needed once a catalog is built
+
+        self.titles: List[str] = list(profiles)
+        self.profile_skills: List[List[str]] = [
+            [s.lower() for s in profile["skills"]] for profile in profiles.values()
+        ]
+        self.skills: List[str] = list(dict.fromkeys(s for skills in self.profile_skills for s in skills))
+        self.skill_index: Dict[str, int] = {skill: i for i, skill in enumerate(self.skills)}
+
+        rows, cols = [], []
+        for row, skills in enumerate(self.profile_skills):
+            for col in sorted({self.skill_index[s] for s in skills}):
+                rows.append(row)
+                cols.append(col)
+        self.skill_matrix = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)), shape=(len(self.titles), len(self.skills))
+        )
+        # A skill listed twice still counts twice in the denominator
+        self.profile_sizes = np.array([max(len(skills), 1) for skills in self.profile_skills], dtype=float)
+
+        experience = np.array([profile["experience_years"] for profile in profiles.values()], dtype=float)
+        experience = experience.reshape(len(self.titles), 2)
+        self.exp_min = experience[:, 0]
+        self.exp_max = experience[:, 1]
+
+        role_keywords = [[kw.lower() for kw in profile["keywords"]] for profile in profiles.values()]
+        self.keywords: List[str] = list(dict.fromkeys(kw for keywords in role_keywords for kw in keywords))
+        self.keyword_index: Dict[str, int] = {kw: i for i, kw in enumerate(self.keywords)}
+        rows = [row for row, keywords in enumerate(role_keywords) for _ in keywords]
+        cols = [self.keyword_index[kw] for keywords in role_keywords for kw in keywords]
+        # Duplicate entries are summed: a keyword listed twice counts twice
+        self.keyword_matrix = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)), shape=(len(self.titles), len(self.keywords))
+        )
+        self._keyword_matcher = SkillMatcher(self.keywords) if self.keywords else None
+
+        # title -> CAREER_PATHS node the role progresses from (see insights.career_graph)
+        self.tracks: Dict[str, str] = {
+            title: profile["career_track"] for title, profile in profiles.items() if profile.get("career_track")
+        }
+
+    def __len__(self):
+        return len(self.titles)
+
+    def keyword_hits(self, text: str) -> FrozenSet[str]:
+        """Role keywords present (word-bounded) in ``text``."""
+        if self._keyword_matcher is None:
+            return frozenset()
+        return frozenset(self._keyword_matcher.find(text))
+
+    def _skill_counts(self, resume_skills: Iterable[str]) -> np.ndarray:
+        counts = np.zeros(len(self.skills))
+        index = self.skill_index
+        for skill in resume_skills:
+            col = index.get(skill)
+            if col is not None:
+                counts[col] += 1
+        return counts
+
+    def _keyword_vector(self, keyword_hits: Iterable[str]) -> np.ndarray:
+        present = np.zeros(len(self.keywords))
+        index = self.keyword_index
+        for keyword in keyword_hits:
+            col = index.get(keyword)
+            if col is not None:
+                present[col] = 1
+        return present
+
+    def score(
+        self,
+        resume_skills: Sequence[Sequence[str]],
+        experience_years: Sequence[float],
+        keyword_hits: Sequence[Iterable[str]],
+    ) -> np.ndarray:
+        """Match scores of a batch of resumes: (roles x resumes).
+
+        ``resume_skills[j]`` are resume j's lowercased skills (duplicates
+        count), ``keyword_hits[j]`` the role keywords found in its text.
+        """
+        skill_counts = np.column_stack([self._skill_counts(skills) for skills in resume_skills])
+        keywords_present = np.column_stack([self._keyword_vector(hits) for hits in keyword_hits])
+        years = np.asarray(experience_years, dtype=float)
+
+        # In place, but in the formula's order of operations, so scores are bit-identical
+        scores = self.skill_matrix @ skill_counts
+        scores /= self.profile_sizes[:, None]  # skill_overlap
+        scores *= 0.6
+        in_range = (self.exp_min[:, None] <= years) & (years <= self.exp_max[:, None])
+        scores += np.where(in_range, 1.0 * 0.3, 0.5 * 0.3)  # experience_match * 0.3
+        keyword_bonus = self.keyword_matrix @ keywords_present
+        keyword_bonus *= 0.1
+        np.minimum(keyword_bonus, 0.2, out=keyword_bonus)
+        keyword_bonus *= 0.1
+        scores += keyword_bonus
+        scores *= 100
+        return scores
+
+    @staticmethod
+    def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+        """Indices of the ``k`` highest scores, descending; ties keep catalog order."""
+        if k >= len(scores):
+            return np.argsort(-scores, kind="stable")
+        # Everything tied with the k-th best is a candidate, so ties resolve as a full sort would
+        kth = np.partition(scores, len(scores) - k)[len(scores) - k]
+        candidates = np.flatnonzero(scores >= kth)
+        return candidates[np.argsort(-scores[candidates], kind="stable")][:k]
+
+    def role_match(self, row: int, score: float, resume_skills: Sequence[str]) -> Dict:
+        """The role dict returned by ``match_job_roles``."""
+        profile_skills = self.profile_skills[row]
+        required = set(profile_skills)
+        matched_skills = [s for s in resume_skills if s in required]
+        return {
+            "title": self.titles[row],
+            "match_score": float(score),
+            "required_skills": profile_skills[:8],
+            "your_skills": matched_skills[:8],
+            "skill_overlap": len(matched_skills) / len(profile_skills) if profile_skills else 0,
+            "experience_match": _role_level(self.exp_min[row]),
+        }
+
+    def top_roles(
+        self,
+        resume_skills: Sequence[Sequence[str]],
+        experience_years: Sequence[float],
+        keyword_hits: Sequence[Iterable[str]],
+        k: int = 5,
+    ) -> List[List[Dict]]:
+        """Best ``k`` role matches for each resume of a batch."""
+        if not len(self.titles) or not len(resume_skills):
+            return [[] for _ in resume_skills]
+        # One contiguous row of role scores per resume
+        scores = np.ascontiguousarray(self.score(resume_skills, experience_years, keyword_hits).T)
+        return [
+            [self.role_match(row, resume_scores[row], skills) for row in self.top_k(resume_scores, k)]
+            for resume_scores, skills in zip(scores, resume_skills)
+        ]
+
+
+def load_profiles(path: str) -> Dict[str, Dict]:
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+@lru_cache(maxsize=1)
+def get_role_catalog() -> RoleCatalog:
+    """The catalog from ROLE_CATALOG_PATH, or the built-in ROLE_PROFILES; built on first use."""
+    path = os.getenv("ROLE_CATALOG_PATH")
+    if path:
+        profiles = load_profiles(path)
+        print(f"✅ Loaded {len(profiles)} role profiles from {path}")
+    else:
+        from insights.analyzer import ROLE_PROFILES  # analyzer imports this module
+
+        profiles = ROLE_PROFILES
+    return RoleCatalog(profiles)
@@ -70,7 +70,8 @@ async def get_job_role_matches(request: JobRoleMatchRequest):
                 match_score=role["match_score"],
                 required_skills=role["required_skills"],
                 your_skills=role["your_skills"],
-                skill_overlap=role["skill_overlap"]
+                skill_overlap=role["skill_overlap"],
+                experience_match=role["experience_match"]
             )
             for role in top_roles
         ]
@@ -105,6 +106,7 @@ async def get_career_suggestions(request: CareerPathRequest):
             CareerPath(
                 current_role=path["current_role"],
                 next_role=path["next_role"],
+                via=path["via"],
                 skill_gaps=path["skill_gaps"],
                 experience_needed=path["experience_needed"],
                 learning_resources=path["learning_resources"]
@@ -37,6 +37,7 @@ class JobRoleMatchResponse(BaseModel):
 class CareerPath(BaseModel):
     current_role: str
     next_role: str
+    via: List[str] = []  # intermediate roles of a multi-hop path
     skill_gaps: List[str]
     experience_needed: str
     learning_resources: List[Dict[str, str]]  # name, url, type
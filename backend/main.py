@@ -1,18 +1,81 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.middleware.cors import CORSMiddleware
 import os
-from auth.router import router as auth_router
+from auth.router import create_auth_tables, router as auth_router
 from resume.router import router as resume_router
 from matching.router import router as ats_router
 from analytics.router import router as analytics_router
 from insights.router import router as insights_router
 from ai_enhancements.router import router as ai_router
 from advanced_analytics.router import router as advanced_analytics_router
+from search.router import router as search_router
+from health.router import router as health_router
+from report.router import router as report_router
+from database.schema import connect_to_mongo, close_mongo_connection, create_indexes
+from database.mongo import get_resume_collection
+from matching.tfidf_index import TFIDF_INDEX
+from matching.url_fetcher import JD_FETCHER
+from search.skill_index import SKILL_INDEX
+from resume.extraction import extraction_service
+from resume.ingest import UploadLimitMiddleware
+from resume.near_duplicates import NEAR_DUP_INDEX
+from cache.response_cache import RESPONSE_CACHE, ResponseCacheMiddleware
 
-app = FastAPI(title="Smart Hiring Platform", docs_url=None, redoc_url=None)
+
+async def _create_mongo_indexes():
+    try:
+        await create_indexes()
+    except Exception as e:
+        print(f"⚠️  Could not create MongoDB indexes: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open shared clients and the extraction pool on startup, close them on shutdown.
+
+    Nothing here waits on MongoDB (the client connects lazily), so the app is
+    ready to serve CPU-only endpoints as soon as this yields.
+    """
+    extraction_service.start()
+    await run_in_threadpool(create_auth_tables)
+    await connect_to_mongo()
+    # Built in the background; their endpoints answer 503 until ready
+    mongo_indexes = asyncio.create_task(_create_mongo_indexes())
+    await TFIDF_INDEX.start(get_resume_collection())
+    await SKILL_INDEX.start(get_resume_collection())
+    await NEAR_DUP_INDEX.start(get_resume_collection())
+    app.state.ready = True
+    yield
+    app.state.ready = False
+    mongo_indexes.cancel()
+    try:
+        await mongo_indexes
+    except asyncio.CancelledError:
+        pass
+    await NEAR_DUP_INDEX.stop()
+    await SKILL_INDEX.stop()
+    await TFIDF_INDEX.stop()
+    await close_mongo_connection()
+    await JD_FETCHER.aclose()
+    await RESPONSE_CACHE.aclose()
+    extraction_service.shutdown()
+
+
+app = FastAPI(title="Smart Hiring Platform", docs_url=None, redoc_url=None, lifespan=lifespan)
+
+# Replay stored responses for deterministic analysis endpoints (innermost, so
+# hits still pass through CORS)
+app.add_middleware(ResponseCacheMiddleware)
+
+# Refuse oversize multipart bodies before they are read in full (inside CORS,
+# so 413s still carry CORS headers)
+app.add_middleware(UploadLimitMiddleware)
 
 # Add CORS middleware
 app.add_middleware(
@@ -37,6 +100,9 @@ app.include_router(analytics_router)
 app.include_router(insights_router)
 app.include_router(ai_router)
 app.include_router(advanced_analytics_router)
+app.include_router(search_router)
+app.include_router(report_router)
+app.include_router(health_router)
 
 # Define directories
 ai_frontend_dist = os.path.join(os.path.dirname(__file__), "../ai-resume-frontend/dist")
@@ -0,0 +1,121 @@
+"""
+Per-request analysis context.
+
+One resume/JD pair is preprocessed, skill-scanned and experience-parsed at
+most once per request, however many matching functions read it. Every
+stage is a lazily computed, memoized property, so a caller that only needs
+the ATS score never pays for skill counts or experience parsing.
+
+``TextAnalysis`` is also the shared document model of the full report:
+the insights and AI analyzers accept one instead of the raw text and read
+its lowercased text, lines and keyword hits.
+"""
+import re
+from functools import cached_property
+from itertools import accumulate
+from typing import Dict, FrozenSet, List, Tuple
+
+from matching.ats_engine import _preprocess, score_skill_sets
+from matching.skill_matcher import SKILL_MATCHER
+
+# Checked in order; the first pattern with a match decides
+EXPERIENCE_PATTERNS = [
+    r'(\d+)\+?\s*years?\s+(?:of\s+)?experience',
+    r'experience[:\s]+(\d+)\+?\s*years?',
+    r'(\d+)\+?\s*yrs?\s+(?:of\s+)?experience'
+]
+
+
+def _experience_from_lowered(lowered: str) -> int:
+    for pattern in EXPERIENCE_PATTERNS:
+        match = re.search(pattern, lowered)
+        if match:
+            return int(match.group(1))
+    return 0
+
+
+def extract_experience_years(text: str) -> int:
+    """Extract years of experience from text"""
+    return _experience_from_lowered(text.lower())
+
+
+class TextAnalysis:
+    """Memoized views of one text (resume or job description)."""
+
+    def __init__(self, text: str):
+        self.text = text or ""
+
+    @cached_property
+    def lower(self) -> str:
+        return self.text.lower()
+
+    @cached_property
+    def lines(self) -> List[str]:
+        return self.text.split("\n")
+
+    @cached_property
+    def lines_lower(self) -> List[str]:
+        return self.lower.split("\n")
+
+    @cached_property
+    def line_offsets(self) -> List[int]:
+        """Start offset of each line in ``lower`` (for mapping a match to its line)."""
+        return list(accumulate((len(line) + 1 for line in self.lines_lower[:-1]), initial=0))
+
+    @cached_property
+    def preprocessed(self) -> str:
+        """Text after the shared ATS pipeline (aliases normalized, stopwords removed)."""
+        return _preprocess(self.text)
+
+    @cached_property
+    def skills(self) -> FrozenSet[str]:
+        """Skills found in the preprocessed text (what ATS scoring compares)."""
+        return frozenset(SKILL_MATCHER.find(self.preprocessed))
+
+    @cached_property
+    def raw_skill_counts(self) -> Dict[str, int]:
+        """Occurrence counts of skills in the original text."""
+        return SKILL_MATCHER.count(self.text)
+
+    @cached_property
+    def raw_skills(self) -> FrozenSet[str]:
+        """Skills present in the original text (same as ``SKILL_MATCHER.find``)."""
+        return frozenset(self.raw_skill_counts)
+
+    @cached_property
+    def experience_years(self) -> int:
+        return _experience_from_lowered(self.lower)
+
+    @cached_property
+    def keyword_counts(self) -> Dict[str, Dict[str, int]]:
+        """category -> {keyword: count} of ``insights.analyzer.TECHNICAL_KEYWORDS``."""
+        from insights.analyzer import KEYWORD_MATCHER  # insights imports this module
+
+        return KEYWORD_MATCHER.count(self.lower)
+
+    @cached_property
+    def role_keywords(self) -> FrozenSet[str]:
+        """Keywords of the role catalog (``insights.role_catalog``) present in the text."""
+        from insights.role_catalog import get_role_catalog
+
+        return get_role_catalog().keyword_hits(self.lower)
+
+    @cached_property
+    def year_mentions(self) -> Tuple[int, ...]:
+        """Every "N years"/"N yrs" figure in the text (role matching sums these)."""
+        from insights.analyzer import year_mentions_in_lowered
+
+        return year_mentions_in_lowered(self.lower)
+
+
+class AnalysisContext:
+    """A resume and a job description, analysed lazily and at most once each."""
+
+    def __init__(self, resume_text: str, job_description: str):
+        self.resume = TextAnalysis(resume_text)
+        self.jd = TextAnalysis(job_description)
+
+    @cached_property
+    def ats_result(self) -> Dict:
+        """Same result as ``calculate_ats_score(resume_text, job_description)``."""
+        return score_skill_sets(self.resume.skills, self.jd.skills)
@@ -1,7 +1,8 @@
 from typing import List, Set
-import re
 
-from matching.skills import TECH_SKILLS
+from matching.skills import ALIAS_MAP  # noqa: F401 (re-exported)
+from matching.skill_matcher import SKILL_MATCHER
+from matching.text_pipeline import ALIAS_NORMALIZER, TextPipeline
 
 # Minimal, explicit stopword list keeps noise words from skewing matches
 STOPWORDS: Set[str] = {
@@ -11,61 +12,30 @@ STOPWORDS: Set[str] = {
     "your", "our", "their", "they", "i", "me", "my", "mine", "us"
 }
 
-# Normalize common aliases to canonical skill names present in TECH_SKILLS
-ALIAS_MAP = {
-    "fast api": "fastapi",
-    "fast-api": "fastapi",
-    "node js": "node.js",
-    "nodejs": "node.js",
-    "js": "javascript",
-    "py": "python",
-    "c sharp": "c#",
-    "c-sharp": "c#",
-    "c plus plus": "c++",
-    "c++": "c++",
-    "machine learning": "machine learning",
-    "ml": "machine learning",
-    "deep-learning": "deep learning",
-    "data-science": "data science",
-    "ci cd": "ci/cd",
-    "ci-cd": "ci/cd",
-}
+# Lowercase, alias normalization, symbol stripping and stopword removal
+ATS_PIPELINE = TextPipeline(
+    normalizer=ALIAS_NORMALIZER,
+    # Keep letters, numbers, plus, hash, dot, and spaces; drop other symbols
+    strip_pattern=r"[^a-z0-9+#\.\s]",
+    stopwords=STOPWORDS,
+)
 
 
 def _normalize_aliases(text: str) -> str:
-    normalized = text
-    for alias, canonical in ALIAS_MAP.items():
-        pattern = re.compile(r"\b" + re.escape(alias) + r"\b", re.IGNORECASE)
-        normalized = pattern.sub(canonical, normalized)
-    return normalized
+    return ALIAS_NORMALIZER.normalize(text)
 
 
 def _preprocess(text: str) -> str:
-    text = _normalize_aliases(text.lower())
-    # Keep letters, numbers, plus, hash, dot, and spaces; drop other symbols
-    text = re.sub(r"[^a-z0-9+#\.\s]", " ", text)
-    tokens = [t for t in text.split() if t and t not in STOPWORDS]
-    return " ".join(tokens)
+    return ATS_PIPELINE(text)
 
 
 def _extract_skills(clean_text: str) -> List[str]:
-    found: Set[str] = set()
-    for skill in TECH_SKILLS:
-        # Convert multi-word skills to flexible whitespace matching
-        pattern = r"\b" + re.escape(skill).replace(r"\ ", r"\s+") + r"\b"
-        if re.search(pattern, clean_text, flags=re.IGNORECASE):
-            found.add(skill)
-    return sorted(found)
-
-
-def calculate_ats_score(resume_text: str, job_description: str):
-    # Shared preprocessing pipeline for resume and JD
-    clean_resume = _preprocess(resume_text)
-    clean_jd = _preprocess(job_description)
+    # Single pass over the text with the precompiled TECH_SKILLS matcher
+    return sorted(SKILL_MATCHER.find(clean_text))
 
-    resume_skills = set(_extract_skills(clean_resume))
-    jd_skills = set(_extract_skills(clean_jd))
 
+def score_skill_sets(resume_skills: Set[str], jd_skills: Set[str]):
+    """ATS result for already-extracted resume and JD skill sets."""
     matched_skills = sorted(resume_skills.intersection(jd_skills))
     missing_skills = sorted(jd_skills.difference(resume_skills))
 
@@ -81,3 +51,18 @@ def calculate_ats_score(resume_text: str, job_description: str):
         "missing_skills": missing_skills,
         "total_jd_skills": total_jd_skills,
     }
+
+
+def calculate_ats_score(resume_text: str, job_description: str, context=None):
+    """Score a resume against a JD; pass a matching.analysis_context.AnalysisContext
+    to reuse (and memoize) the preprocessing and skill extraction."""
+    if context is not None:
+        return context.ats_result
+
+    # Shared preprocessing pipeline for resume and JD
+    clean_resume = _preprocess(resume_text)
+    clean_jd = _preprocess(job_description)
+
+    resume_skills = set(_extract_skills(clean_resume))
+    jd_skills = set(_extract_skills(clean_jd))
+    return score_skill_sets(resume_skills, jd_skills)
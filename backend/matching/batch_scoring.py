@@ -0,0 +1,118 @@
+"""
+Vectorized ATS scoring for one resume against many JDs, or many resumes
+against one JD (as raw text or as stored resume fingerprints).
+
+Every text is preprocessed and skill-extracted exactly once; pairwise
+scoring is a boolean (pairs x skills) intersection in NumPy.
+"""
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from matching.ats_engine import _extract_skills, _preprocess
+from matching.jd_matcher import build_match_result, extract_experience_years
+from matching.skill_matcher import SKILL_MATCHER
+from resume.fingerprint import fingerprint_matrix
+
+_SKILL_NAMES = np.array(SKILL_MATCHER.skills, dtype=object)
+
+
+def _skill_matrix(texts: List[str]) -> np.ndarray:
+    """Boolean (texts x TECH_SKILLS) matrix, one preprocessing pass per text."""
+    matrix = np.zeros((len(texts), len(SKILL_MATCHER.skills)), dtype=bool)
+    index = SKILL_MATCHER.index
+    for row, text in enumerate(texts):
+        columns = [index[skill] for skill in _extract_skills(_preprocess(text))]
+        matrix[row, columns] = True
+    return matrix
+
+
+def _skill_names(row: np.ndarray) -> List[str]:
+    return sorted(_SKILL_NAMES[row].tolist())
+
+
+class _PairScores:
+    """ATS scores for n resume/JD pairs given broadcastable skill matrices."""
+
+    def __init__(self, resume_matrix: np.ndarray, jd_matrix: np.ndarray):
+        self.matched = resume_matrix & jd_matrix
+        self.jd_matrix = np.broadcast_to(jd_matrix, self.matched.shape)
+        matched_counts = self.matched.sum(axis=1)
+        self.totals = self.jd_matrix.sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratios = np.where(self.totals > 0, matched_counts / self.totals * 100, 0)
+        # np.round and round() both round half to even, matching calculate_ats_score
+        self.scores = np.round(ratios).astype(int)
+
+    def ranked(self, top_k: Optional[int]) -> np.ndarray:
+        order = np.argsort(-self.scores, kind="stable")
+        return order if top_k is None else order[:top_k]
+
+    def ats_result(self, i: int) -> Dict:
+        return {
+            "ats_score": int(self.scores[i]),
+            "matched_skills": _skill_names(self.matched[i]),
+            "missing_skills": _skill_names(self.jd_matrix[i] & ~self.matched[i]),
+            "total_jd_skills": int(self.totals[i]),
+        }
+
+
+def _pair_scores(resume_matrix: np.ndarray, jd_matrix: np.ndarray) -> _PairScores:
+    if len(resume_matrix) != 1 and len(jd_matrix) != 1:
+        raise ValueError("Batch scoring needs exactly one resume or exactly one job description")
+    return _PairScores(resume_matrix, jd_matrix)
+
+
+def _ats_results(pairs: _PairScores, top_k: Optional[int]) -> List[Dict]:
+    return [{"index": int(i), **pairs.ats_result(i)} for i in pairs.ranked(top_k)]
+
+
+def _match_results(pairs: _PairScores, top_k: Optional[int], resume_years: List[int], jd_years: List[int]) -> List[Dict]:
+    results = []
+    for i in pairs.ranked(top_k):
+        i = int(i)
+        match = build_match_result(
+            pairs.ats_result(i),
+            resume_exp=resume_years[i if len(resume_years) > 1 else 0],
+            jd_exp=jd_years[i if len(jd_years) > 1 else 0],
+        )
+        results.append({"index": i, **match})
+    return results
+
+
+def batch_ats_scores(resume_texts: List[str], job_descriptions: List[str], top_k: Optional[int] = None) -> List[Dict]:
+    """Rank ATS scores for one resume vs many JDs or many resumes vs one JD.
+
+    Each result carries ``calculate_ats_score``'s fields plus ``index``, the
+    position of the varying text in its input list.
+    """
+    pairs = _pair_scores(_skill_matrix(resume_texts), _skill_matrix(job_descriptions))
+    return _ats_results(pairs, top_k)
+
+
+def batch_match_percentages(resume_texts: List[str], job_descriptions: List[str], top_k: Optional[int] = None) -> List[Dict]:
+    """Batch counterpart of ``calculate_match_percentage``, ranked by match."""
+    pairs = _pair_scores(_skill_matrix(resume_texts), _skill_matrix(job_descriptions))
+    return _match_results(
+        pairs,
+        top_k,
+        resume_years=[extract_experience_years(text) for text in resume_texts],
+        jd_years=[extract_experience_years(text) for text in job_descriptions],
+    )
+
+
+def stored_ats_scores(fingerprints: List[Dict], job_description: str, top_k: Optional[int] = None) -> List[Dict]:
+    """Rank stored resumes against a JD straight from their skill fingerprints."""
+    resume_matrix = fingerprint_matrix([fp["skills_bitset"] for fp in fingerprints])
+    return _ats_results(_pair_scores(resume_matrix, _skill_matrix([job_description])), top_k)
+
+
+def stored_match_percentages(fingerprints: List[Dict], job_description: str, top_k: Optional[int] = None) -> List[Dict]:
+    """Match stored resumes against a JD without rescanning their text."""
+    resume_matrix = fingerprint_matrix([fp["skills_bitset"] for fp in fingerprints])
+    return _match_results(
+        _pair_scores(resume_matrix, _skill_matrix([job_description])),
+        top_k,
+        resume_years=[fp["experience_years"] for fp in fingerprints],
+        jd_years=[extract_experience_years(job_description)],
+    )
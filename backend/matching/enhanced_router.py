@@ -3,9 +3,9 @@ Enhanced matching router with JD comparison and ATS scoring
 """
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
+from matching.analysis_context import AnalysisContext
 from matching.ats_engine import calculate_ats_score
 from matching.jd_matcher import calculate_match_percentage
-from matching.skills import TECH_SKILLS
 
 router = APIRouter(prefix="/matching", tags=["Matching"])
 
@@ -24,40 +24,34 @@ class MatchResponse(BaseModel):
 def match_resume_to_jd(data: JDMatchRequest):
     """Match resume to job description with detailed analysis"""
     try:
+        # Each preprocessing/scan stage runs at most once for this request
+        context = AnalysisContext(data.resume_text, data.job_description)
+
         # Calculate basic match percentage
         match_percentage = calculate_match_percentage(
             resume_text=data.resume_text,
-            job_description=data.job_description
+            job_description=data.job_description,
+            context=context,
         )
         
-        # Calculate ATS score
+        # Calculate ATS score (memoized by the context, not recomputed)
         ats_score = calculate_ats_score(
             resume_text=data.resume_text,
-            job_description=data.job_description
+            job_description=data.job_description,
+            context=context,
         )
         
-        # Extract skills from resume
-        resume_text_lower = data.resume_text.lower()
-        resume_skills = {}
-        for skill in TECH_SKILLS:
-            count = resume_text_lower.count(skill.lower())
-            if count > 0:
-                resume_skills[skill] = count
-        
-        # Extract skills from JD
-        jd_lower = data.job_description.lower()
-        jd_skills = set()
-        for skill in TECH_SKILLS:
-            if skill.lower() in jd_lower:
-                jd_skills.add(skill)
+        # Skill counts from the resume and skill set from the JD, on the raw text
+        resume_skills = context.resume.raw_skill_counts
+        jd_skills = context.jd.raw_skills
         
         # Find matched and missing skills
         matched_skills = [s for s in resume_skills.keys() if s in jd_skills]
-        missing_skills = list(jd_skills - set(resume_skills.keys()))
+        missing_skills = sorted(jd_skills - set(resume_skills.keys()))
         
         return {
-            "match_percentage": match_percentage if isinstance(match_percentage, (int, float)) else match_percentage.get("match_percentage", 0),
-            "ats_score": ats_score.get("ats_score", 0) if isinstance(ats_score, dict) else 0,
+            "match_percentage": match_percentage["match_percentage"],
+            "ats_score": ats_score["ats_score"],
             "matched_skills": matched_skills,
             "missing_skills": missing_skills,
             "resume_skills": resume_skills
@@ -1,27 +1,12 @@
-import io
-import re
-from typing import List, Dict
+from typing import List, Dict, Optional
 
-import pdfplumber
-from docx import Document
-
-from matching.ats_engine import calculate_ats_score
-
-
-def extract_experience_years(text: str) -> int:
-    """Extract years of experience from text"""
-    patterns = [
-        r'(\d+)\+?\s*years?\s+(?:of\s+)?experience',
-        r'experience[:\s]+(\d+)\+?\s*years?',
-        r'(\d+)\+?\s*yrs?\s+(?:of\s+)?experience'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text.lower())
-        if match:
-            return int(match.group(1))
-    
-    return 0
+from matching.analysis_context import (  # noqa: F401 (re-exported)
+    EXPERIENCE_PATTERNS,
+    AnalysisContext,
+    extract_experience_years,
+)
+from matching.url_fetcher import JD_FETCHER
+from resume.parser import iter_pdf_pages
 
 
 def _simple_recommendations(missing_skills: List[str], matched_skills: List[str]) -> List[str]:
@@ -33,24 +18,31 @@ def _simple_recommendations(missing_skills: List[str], matched_skills: List[str]
     return recs
 
 
-def calculate_match_percentage(resume_text: str, job_description: str):
-    """Use the shared ATS pipeline to produce match stats for the existing endpoint."""
-    print(f"\n🔍 DEBUG: calculate_match_percentage called")
-    print(f"📄 Resume length: {len(resume_text)}")
-    print(f"📋 JD length: {len(job_description)}")
-    
+def calculate_match_percentage(resume_text: str, job_description: str, context: Optional[AnalysisContext] = None):
+    """Use the shared ATS pipeline to produce match stats for the existing endpoint.
+
+    Pass ``context`` to share preprocessing, skill extraction and experience
+    parsing with other analyses of the same pair.
+    """
     # Ensure both texts go through identical cleaning and skill extraction
-    ats_result = calculate_ats_score(resume_text=resume_text, job_description=job_description)
-    
-    print(f"📊 ATS Result: {ats_result}")
+    if context is None:
+        context = AnalysisContext(resume_text, job_description)
+    ats_result = context.ats_result
 
+    return build_match_result(
+        ats_result,
+        resume_exp=context.resume.experience_years,
+        jd_exp=context.jd.experience_years,
+    )
+
+
+def build_match_result(ats_result: Dict, resume_exp: int, jd_exp: int) -> Dict:
+    """Shape an ATS result and experience years into the match response."""
     matched_skills = ats_result["matched_skills"]
     missing_skills = ats_result["missing_skills"]
     total_jd_skills = ats_result["total_jd_skills"]
 
     # Experience analysis retained (lightweight)
-    resume_exp = extract_experience_years(resume_text)
-    jd_exp = extract_experience_years(job_description)
     exp_match = jd_exp == 0 or resume_exp >= jd_exp
     exp_gap = 0 if exp_match else max(0, jd_exp - resume_exp)
 
@@ -81,49 +73,41 @@ def calculate_match_percentage(resume_text: str, job_description: str):
     }
 
 
-def _extract_text_from_bytes(content: bytes, filename: str) -> str:
-    """Extract text from raw bytes for PDF, DOCX, or TXT."""
+def extract_text_from_file(
+    file_obj,
+    filename: str,
+    max_pages: Optional[int] = None,
+    max_chars: Optional[int] = None,
+) -> str:
+    """Extract text from a PDF, DOCX, or TXT given as a path or binary file object.
+
+    PDFs are read page by page up to ``max_pages``; all types are cut at ``max_chars``.
+    """
     lower_name = filename.lower()
 
     if lower_name.endswith('.txt'):
+        if isinstance(file_obj, str):
+            with open(file_obj, 'rb') as handle:
+                content = handle.read()
+        else:
+            content = file_obj.read()
         try:
-            return content.decode('utf-8', errors='ignore')
+            return content.decode('utf-8', errors='ignore')[:max_chars]
         except Exception:
-            return content.decode('latin-1', errors='ignore')
+            return content.decode('latin-1', errors='ignore')[:max_chars]
 
     if lower_name.endswith('.pdf'):
-        with pdfplumber.open(io.BytesIO(content)) as pdf:
-            pages = [page.extract_text() or '' for page in pdf.pages]
-            return '\n'.join(pages)
+        return '\n'.join(iter_pdf_pages(file_obj, max_pages, max_chars))
 
     if lower_name.endswith('.docx'):
-        document = Document(io.BytesIO(content))
-        return '\n'.join([p.text for p in document.paragraphs])
+        from docx import Document
 
-    raise ValueError('Unsupported file type. Please upload PDF, DOCX, or TXT.')
-
-
-def extract_text_from_upload(file) -> str:
-    """Extract text from an uploaded JD file (PDF/DOCX/TXT)."""
-    content = file.file.read()
-    return _extract_text_from_bytes(content, file.filename)
-
-
-def extract_text_from_resume_upload(file) -> str:
-    """Extract text from an uploaded resume file (PDF/DOCX/TXT)."""
-    content = file.file.read()
-    return _extract_text_from_bytes(content, file.filename)
+        document = Document(file_obj)
+        return '\n'.join([p.text for p in document.paragraphs])[:max_chars]
 
+    raise ValueError('Unsupported file type. Please upload PDF, DOCX, or TXT.')
 
-def fetch_text_from_url(url: str) -> str:
-    """Fetch JD text from a URL (basic HTTP GET)."""
-    import urllib.request
 
-    with urllib.request.urlopen(url) as response:
-        if response.status != 200:
-            raise ValueError('Could not fetch job description from URL')
-        data = response.read()
-        try:
-            return data.decode('utf-8', errors='ignore')
-        except Exception:
-            return data.decode('latin-1', errors='ignore')
+async def fetch_text_from_url(url: str) -> str:
+    """Fetch JD text from a URL through the shared pooled, cached fetcher."""
+    return await JD_FETCHER.fetch_text(url)
@@ -0,0 +1,41 @@
+"""
+Optional persistence of match results into the ``match_results`` collection
+(see database/schema.py), feeding /analytics/match-distribution.
+"""
+from datetime import datetime
+from typing import Dict, Optional
+
+from bson import ObjectId
+
+from database.mongo import get_match_results_collection
+
+
+def as_entity_id(value: Optional[str]):
+    """Store ids as ObjectId when they look like one, otherwise as given."""
+    if value is None:
+        return None
+    return ObjectId(value) if ObjectId.is_valid(value) else value
+
+
+async def save_match_result(result: Dict, resume_id: Optional[str] = None, jd_id: Optional[str] = None) -> Optional[str]:
+    """Insert a calculate_match_percentage result; returns the new id, or None if not stored."""
+    match_results_collection = get_match_results_collection()
+    if match_results_collection is None:
+        print("Match result not stored: MongoDB is not available")
+        return None
+    try:
+        inserted = await match_results_collection.insert_one({
+            "resume_id": as_entity_id(resume_id),
+            "jd_id": as_entity_id(jd_id),
+            "match_percentage": result["match_percentage"],
+            "ats_score": result["match_percentage"],
+            "matched_skills": result["matched_skills"],
+            "missing_skills": result["missing_skills"],
+            "skill_gap_analysis": result["skill_gap_analysis"],
+            "recommendations": result["recommendations"],
+            "created_at": datetime.utcnow(),
+        })
+        return str(inserted.inserted_id)
+    except Exception as db_error:
+        print(f"Failed to store match result: {db_error}")
+        return None
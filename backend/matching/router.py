@@ -1,15 +1,51 @@
+from bson import ObjectId
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException
-from matching.schemas import ATSRequest, ATSResponse, JDMatchRequest, JDMatchResponse
+from fastapi.concurrency import run_in_threadpool
+from database.mongo import MONGO_UNAVAILABLE_ERRORS, get_resume_collection
+from matching.schemas import (
+    ATSRequest, ATSResponse, JDMatchRequest, JDMatchResponse,
+    BatchRequest, ATSBatchResponse, JDMatchBatchResponse,
+    SimilarResumesRequest, SimilarResumesResponse,
+)
 from matching.ats_engine import calculate_ats_score
+from matching.batch_scoring import (
+    batch_ats_scores,
+    batch_match_percentages,
+    stored_ats_scores,
+    stored_match_percentages,
+)
 from matching.jd_matcher import (
     calculate_match_percentage,
-    extract_text_from_upload,
-    extract_text_from_resume_upload,
     fetch_text_from_url,
 )
+from matching.match_store import save_match_result
+from matching.tfidf_index import TFIDF_INDEX
+from matching.url_fetcher import UpstreamFetchError
+from resume.cleaner import clean_text
+from resume.extraction import (
+    ExtractionQueueFull,
+    ExtractionTimeout,
+    ExtractionUnavailable,
+    extraction_service,
+)
+from resume.ingest import ingest_or_413
+from resume.fingerprint import load_fingerprints
 
 router = APIRouter(prefix="/ats", tags=["ATS Scoring"])
 
+
+async def _extract_upload_text(file: UploadFile) -> str:
+    """Spool an uploaded PDF/DOCX/TXT and parse it in the extraction pool."""
+    with await ingest_or_413(file) as upload:
+        try:
+            return await extraction_service.extract_document(upload.source, upload.filename)
+        except ExtractionQueueFull as busy:
+            raise HTTPException(status_code=429, detail=str(busy))
+        except ExtractionTimeout as timeout:
+            raise HTTPException(status_code=504, detail=str(timeout))
+        except ExtractionUnavailable as unavailable:
+            raise HTTPException(status_code=503, detail=str(unavailable))
+
 @router.post("/score", response_model=ATSResponse)
 def ats_score(data: ATSRequest):
     return calculate_ats_score(
@@ -18,20 +54,127 @@ def ats_score(data: ATSRequest):
     )
 
 @router.post("/match", response_model=JDMatchResponse)
-def jd_resume_match(data: JDMatchRequest):
-    return calculate_match_percentage(
+async def jd_resume_match(data: JDMatchRequest):
+    # CPU-bound scoring stays off the event loop; only the optional insert is awaited
+    result = await run_in_threadpool(
+        calculate_match_percentage,
         resume_text=data.resume_text,
         job_description=data.job_description
     )
+    if data.persist:
+        result["match_result_id"] = await save_match_result(result, resume_id=data.resume_id, jd_id=data.jd_id)
+    return result
+
+
+def _batch_inputs(data: BatchRequest):
+    """Resolve a batch request into (resume_texts, job_descriptions)."""
+    if data.resume_text is not None and data.job_descriptions is not None:
+        resumes, jds = [data.resume_text], data.job_descriptions
+    elif data.resume_texts is not None and data.job_description is not None:
+        resumes, jds = data.resume_texts, [data.job_description]
+    else:
+        raise HTTPException(
+            status_code=400,
+            detail="Provide resume_text with job_descriptions, or resume_texts or resume_ids with job_description",
+        )
+    if not resumes or not jds:
+        raise HTTPException(status_code=400, detail="Batch must contain at least one item")
+    return resumes, jds
+
+
+async def _stored_fingerprints(resume_ids):
+    """Load upload-time fingerprints for stored resumes, in request order."""
+    resume_collection = get_resume_collection()
+    if resume_collection is None:
+        raise HTTPException(status_code=503, detail="MongoDB is not available")
+    if not resume_ids or not all(ObjectId.is_valid(rid) for rid in resume_ids):
+        raise HTTPException(status_code=400, detail="resume_ids must be valid resume ids")
+    object_ids = [ObjectId(rid) for rid in resume_ids]
+    try:
+        fingerprints = await load_fingerprints(resume_collection, object_ids)
+    except MONGO_UNAVAILABLE_ERRORS:
+        raise HTTPException(status_code=503, detail="MongoDB is not available")
+    missing = [rid for rid, oid in zip(resume_ids, object_ids) if oid not in fingerprints]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Resumes not found: {', '.join(missing)}")
+    return [fingerprints[oid] for oid in object_ids]
+
+
+def _with_resume_ids(results, resume_ids):
+    for result in results:
+        result["resume_id"] = resume_ids[result["index"]]
+    return results
+
+
+@router.post("/score/batch", response_model=ATSBatchResponse)
+async def ats_score_batch(data: BatchRequest):
+    """Rank ATS scores for one resume vs many JDs, or many resumes vs one JD.
+
+    Stored resumes can be ranked by ``resume_ids`` using their upload-time
+    fingerprints instead of re-sending and rescanning their text.
+    """
+    if data.resume_ids is not None and data.job_description is not None:
+        fingerprints = await _stored_fingerprints(data.resume_ids)
+        results = await run_in_threadpool(stored_ats_scores, fingerprints, data.job_description, top_k=data.top_k)
+        return {"results": _with_resume_ids(results, data.resume_ids), "total": len(fingerprints)}
+
+    resumes, jds = _batch_inputs(data)
+    results = await run_in_threadpool(batch_ats_scores, resumes, jds, top_k=data.top_k)
+    return {"results": results, "total": max(len(resumes), len(jds))}
+
+
+@router.post("/match/batch", response_model=JDMatchBatchResponse)
+async def jd_resume_match_batch(data: BatchRequest):
+    """Batch version of /ats/match, ranked by match percentage."""
+    if data.resume_ids is not None and data.job_description is not None:
+        fingerprints = await _stored_fingerprints(data.resume_ids)
+        results = await run_in_threadpool(stored_match_percentages, fingerprints, data.job_description, top_k=data.top_k)
+        return {"results": _with_resume_ids(results, data.resume_ids), "total": len(fingerprints)}
+
+    resumes, jds = _batch_inputs(data)
+    results = await run_in_threadpool(batch_match_percentages, resumes, jds, top_k=data.top_k)
+    return {"results": results, "total": max(len(resumes), len(jds))}
+
+
+@router.post("/similar-resumes", response_model=SimilarResumesResponse)
+async def similar_resumes(data: SimilarResumesRequest):
+    """Top-k stored resumes by TF-IDF cosine similarity to a job description."""
+    index = TFIDF_INDEX.index
+    if index is None:
+        raise HTTPException(status_code=503, detail="Resume similarity index is not ready yet")
+
+    matches = await run_in_threadpool(index.query, clean_text(data.job_description), data.top_k)
+
+    # Attach filenames; ids deleted since the index was saved drop out here
+    filenames = None
+    collection = get_resume_collection()
+    if collection is not None and matches:
+        try:
+            object_ids = [ObjectId(resume_id) for resume_id, _ in matches if ObjectId.is_valid(resume_id)]
+            filenames = {
+                str(doc["_id"]): doc.get("filename")
+                async for doc in collection.find({"_id": {"$in": object_ids}}, {"filename": 1})
+            }
+        except MONGO_UNAVAILABLE_ERRORS:
+            filenames = None
+
+    results = [
+        {"resume_id": resume_id, "filename": filenames.get(resume_id) if filenames else None, "score": score}
+        for resume_id, score in matches
+        if filenames is None or resume_id in filenames
+    ]
+    return {"results": results, "indexed": index.size}
 
 
 @router.post("/jd-upload")
 async def jd_upload(file: UploadFile = File(...)):
     try:
-        text = extract_text_from_upload(file)
+        text = await _extract_upload_text(file)
         return {"job_description": text}
     except ValueError as ve:
         raise HTTPException(status_code=400, detail=str(ve))
+    except HTTPException:
+        raise
     except Exception:
         raise HTTPException(status_code=500, detail="Failed to process job description file")
 
@@ -42,8 +185,10 @@ async def jd_fetch(payload: dict):
     if not url:
         raise HTTPException(status_code=400, detail="URL is required")
     try:
-        text = fetch_text_from_url(url)
+        text = await fetch_text_from_url(url)
         return {"job_description": text}
+    except UpstreamFetchError as e:
+        raise HTTPException(status_code=502, detail=str(e))
     except ValueError as ve:
         raise HTTPException(status_code=400, detail=str(ve))
     except Exception:
@@ -56,6 +201,9 @@ async def job_match_analyze(
     resume_text: str = Form(None),
     jd_file: UploadFile = File(None),
     resume_file: UploadFile = File(None),
+    persist: bool = Form(False),
+    resume_id: str = Form(None),
+    jd_id: str = Form(None),
 ):
     """Analyze JD and resume to compute ATS match and insights."""
     if not jd_text and jd_file is None:
@@ -65,19 +213,24 @@ async def job_match_analyze(
 
     try:
         if jd_file:
-            jd_text = extract_text_from_upload(jd_file)
+            jd_text = await _extract_upload_text(jd_file)
         if resume_file:
-            resume_text = extract_text_from_resume_upload(resume_file)
+            resume_text = await _extract_upload_text(resume_file)
 
         if not jd_text or not jd_text.strip():
             raise HTTPException(status_code=400, detail="Job description is empty after parsing")
         if not resume_text or not resume_text.strip():
             raise HTTPException(status_code=400, detail="Resume text is empty after parsing")
 
-        return calculate_match_percentage(
+        # CPU-bound scoring stays off the event loop, as in /ats/match
+        result = await run_in_threadpool(
+            calculate_match_percentage,
             resume_text=resume_text,
             job_description=jd_text,
         )
+        if persist:
+            result["match_result_id"] = await save_match_result(result, resume_id=resume_id, jd_id=jd_id)
+        return result
     except ValueError as ve:
         raise HTTPException(status_code=400, detail=str(ve))
     except HTTPException:
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import List, Dict, Any
+from pydantic import BaseModel, Field
+from typing import List, Dict, Any, Optional
 
 class ATSRequest(BaseModel):
     resume_text: str
@@ -14,6 +14,10 @@ class ATSResponse(BaseModel):
 class JDMatchRequest(BaseModel):
     resume_text: str
     job_description: str
+    # Optionally store the result in match_results for analytics
+    persist: bool = False
+    resume_id: Optional[str] = None
+    jd_id: Optional[str] = None
 
 class JDMatchResponse(BaseModel):
     match_percentage: float
@@ -22,3 +26,46 @@ class JDMatchResponse(BaseModel):
     recommendations: List[str]
     skill_gap_analysis: Dict[str, Any]
     experience_match: Dict[str, Any]
+    match_result_id: Optional[str] = None
+
+# Batch size caps: texts are scanned per request, stored ids only read fingerprints
+MAX_BATCH_TEXTS = 100
+MAX_BATCH_IDS = 1000
+
+class BatchRequest(BaseModel):
+    """One resume against many JDs, or many resumes against one JD."""
+    resume_text: Optional[str] = None
+    resume_texts: Optional[List[str]] = Field(default=None, max_length=MAX_BATCH_TEXTS)
+    resume_ids: Optional[List[str]] = Field(default=None, max_length=MAX_BATCH_IDS)
+    job_description: Optional[str] = None
+    job_descriptions: Optional[List[str]] = Field(default=None, max_length=MAX_BATCH_TEXTS)
+    top_k: Optional[int] = Field(default=None, ge=1)
+
+class ATSBatchResult(ATSResponse):
+    index: int
+    resume_id: Optional[str] = None
+
+class ATSBatchResponse(BaseModel):
+    results: List[ATSBatchResult]
+    total: int
+
+class JDMatchBatchResult(JDMatchResponse):
+    index: int
+    resume_id: Optional[str] = None
+
+class JDMatchBatchResponse(BaseModel):
+    results: List[JDMatchBatchResult]
+    total: int
+
+class SimilarResumesRequest(BaseModel):
+    job_description: str
+    top_k: int = Field(default=10, ge=1, le=100)
+
+class SimilarResume(BaseModel):
+    resume_id: str
+    filename: Optional[str] = None
+    score: float
+
+class SimilarResumesResponse(BaseModel):
+    results: List[SimilarResume]
+    indexed: int
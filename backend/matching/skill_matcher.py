@@ -0,0 +1,123 @@
+"""
+Precompiled skill matcher.
+
+Builds a single trie-shaped regex over a skill vocabulary once, so finding
+every skill in a text is one linear scan instead of one regex per skill.
+"""
+import re
+from typing import Dict, Iterable, List, Set
+
+from matching.skills import TECH_SKILLS
+
+_TERMINAL = ""
+_WORD_CHAR = re.compile(r"\w")
+
+
+def _skill_pattern(skill: str) -> str:
+    # Multi-word skills tolerate any run of whitespace between words
+    return r"\s+".join(re.escape(word) for word in skill.split())
+
+
+def _build_trie(skills: Iterable[str]) -> Dict:
+    root: Dict = {}
+    for skill in skills:
+        node = root
+        for word_index, word in enumerate(skill.split()):
+            if word_index:
+                node = node.setdefault(" ", {})
+            for char in word:
+                node = node.setdefault(char, {})
+        node[_TERMINAL] = {}
+    return root
+
+
+def _trie_to_regex(node: Dict) -> str:
+    """Render a trie as a regex whose alternations share common prefixes."""
+    terminal = _TERMINAL in node
+    branches = []
+    for char in sorted(c for c in node if c != _TERMINAL):
+        edge = r"\s+" if char == " " else re.escape(char)
+        branches.append(edge + _trie_to_regex(node[char]))
+
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if terminal:
+        # Greedy optional: prefer the longer skill, fall back to the shorter one
+        return "(?:" + body + ")?"
+    return body
+
+
+class SkillMatcher:
+    """Find word-bounded occurrences of a fixed skill vocabulary in one pass.
+
+    A skill matches when it is not directly preceded or followed by a word
+    character, so "java" does not fire inside "javascript" while "c++" and
+    "c#" still match before punctuation or whitespace.
+    """
+
+    def __init__(self, skills: Iterable[str]):
+        self.skills: List[str] = list(dict.fromkeys(s.lower() for s in skills))
+        self.index: Dict[str, int] = {skill: i for i, skill in enumerate(self.skills)}
+        self._canonical = {" ".join(s.split()): s for s in self.skills}
+
+        # The scan reports the longest skill at each start position; shorter
+        # skills that are boundary-aligned prefixes of it are added back here.
+        self._implied: Dict[str, List[str]] = {
+            skill: [skill] + self._boundary_prefixes(skill) for skill in self.skills
+        }
+
+        trie_regex = _trie_to_regex(_build_trie(self.skills))
+        # Zero-width lookahead so overlapping skills starting at later
+        # positions (e.g. "testing" inside "unit testing") are still seen
+        self._regex = re.compile(r"(?<!\w)(?=(" + trie_regex + r")(?!\w))")
+
+    def _boundary_prefixes(self, skill: str) -> List[str]:
+        """Other skills that match at the start of ``skill`` and end before a non-word character.
+
+        Only cuts before a non-word character can qualify, so this looks up
+        those prefixes instead of trying every skill's pattern (which made
+        construction quadratic in the vocabulary size).
+        """
+        index = self.index
+        found = set()
+        for cut in range(1, len(skill)):
+            if not _WORD_CHAR.match(skill, cut):
+                other = self._canonical.get(" ".join(skill[:cut].split()))
+                if other is not None and other != skill:
+                    found.add(other)
+        return sorted(found, key=index.__getitem__)
+
+    def _iter_matches(self, text: str):
+        canonical = self._canonical
+        for match in self._regex.finditer(text.lower()):
+            found = match.group(1)
+            skill = canonical.get(found)
+            if skill is None:
+                skill = canonical[" ".join(found.split())]
+            yield skill
+
+    def find(self, text: str) -> Set[str]:
+        """Return the set of skills present in ``text``."""
+        if not text:
+            return set()
+        found: Set[str] = set()
+        implied = self._implied
+        for skill in set(self._iter_matches(text)):
+            found.update(implied[skill])
+        return found
+
+    def count(self, text: str) -> Dict[str, int]:
+        """Return word-bounded occurrence counts for skills present in ``text``."""
+        counts: Dict[str, int] = {}
+        if not text:
+            return counts
+        implied = self._implied
+        for skill in self._iter_matches(text):
+            for hit in implied[skill]:
+                counts[hit] = counts.get(hit, 0) + 1
+        return counts
+
+
+# Shared matcher over the canonical skill list, built once at import
+SKILL_MATCHER = SkillMatcher(TECH_SKILLS)
@@ -28,3 +28,24 @@ TECH_SKILLS = [
     "rest", "graphql", "microservices", "agile", "scrum", "ci/cd", "testing",
     "unit testing", "integration testing", "jest", "pytest", "selenium"
 ]
+
+# Normalize common aliases to canonical skill names present in TECH_SKILLS.
+# Order matters: aliases are applied as if substituted one after another.
+ALIAS_MAP = {
+    "fast api": "fastapi",
+    "fast-api": "fastapi",
+    "node js": "node.js",
+    "nodejs": "node.js",
+    "js": "javascript",
+    "py": "python",
+    "c sharp": "c#",
+    "c-sharp": "c#",
+    "c plus plus": "c++",
+    "c++": "c++",
+    "machine learning": "machine learning",
+    "ml": "machine learning",
+    "deep-learning": "deep learning",
+    "data-science": "data science",
+    "ci cd": "ci/cd",
+    "ci-cd": "ci/cd",
+}
@@ -0,0 +1,77 @@
+"""
+Shared text normalization pipeline.
+
+Alias normalization and token cleanup used by both the ATS engine
+(``matching.ats_engine._preprocess``) and resume cleaning
+(``resume.cleaner.clean_text``), compiled once at import.
+"""
+import re
+from typing import Dict, Iterable, Optional
+
+from matching.skills import ALIAS_MAP
+
+
+class AliasNormalizer:
+    """Rewrite every alias in ``alias_map`` to its canonical form in one pass.
+
+    Output is identical to substituting each alias in turn, in map order:
+    each alias is mapped straight to what the later substitutions would
+    have turned its canonical form into (so "node js" becomes
+    "node.javascript", as "js" is rewritten after "node js"), and where two
+    aliases could match at the same position the earlier one wins.
+    """
+
+    def __init__(self, alias_map: Dict[str, str]):
+        aliases = list(alias_map.items())
+        self._replacements: Dict[str, str] = {}
+
+        for index, (alias, canonical) in enumerate(aliases):
+            final = canonical
+            for later_alias, later_canonical in aliases[index + 1:]:
+                final = self._alias_regex(later_alias).sub(later_canonical, final)
+            self._replacements.setdefault(alias.lower(), final)
+
+        alternation = "|".join(re.escape(alias) for alias, _ in aliases)
+        self._regex = re.compile(r"\b(?:" + alternation + r")\b", re.IGNORECASE)
+
+    @staticmethod
+    def _alias_regex(alias: str):
+        return re.compile(r"\b" + re.escape(alias) + r"\b", re.IGNORECASE)
+
+    def _replace(self, match) -> str:
+        return self._replacements[match.group(0).lower()]
+
+    def normalize(self, text: str) -> str:
+        return self._regex.sub(self._replace, text)
+
+
+class TextPipeline:
+    """Lowercase -> alias normalization -> symbol stripping -> token filtering."""
+
+    def __init__(
+        self,
+        normalizer: Optional[AliasNormalizer] = None,
+        strip_pattern: str = r"[^a-z0-9+#\.\s]",
+        stopwords: Iterable[str] = (),
+        min_token_length: int = 1,
+    ):
+        self.normalizer = normalizer
+        self.stopwords = frozenset(stopwords)
+        self.min_token_length = min_token_length
+        self._strip = re.compile(strip_pattern)
+
+    def __call__(self, text: str) -> str:
+        text = text.lower()
+        if self.normalizer is not None:
+            text = self.normalizer.normalize(text)
+        text = self._strip.sub(" ", text)
+        stopwords = self.stopwords
+        min_length = self.min_token_length
+        return " ".join(
+            token for token in text.split()
+            if len(token) >= min_length and token not in stopwords
+        )
+
+
+# Shared alias normalizer over the canonical ALIAS_MAP
+ALIAS_NORMALIZER = AliasNormalizer(ALIAS_MAP)
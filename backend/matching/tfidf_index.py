@@ -0,0 +1,357 @@
+"""
+Persistent TF-IDF index over stored resumes' ``cleaned_text``.
+
+A fitted TfidfVectorizer plus an L2-normalised CSR matrix (one row per
+resume). A JD is ranked against every resume with a single sparse
+matrix-vector product, and the top k are picked with ``argpartition``
+instead of sorting every score.
+
+New uploads are transformed with the existing vocabulary and appended, and
+deletes are masked out (a pending append is just flagged, so a delete never
+copies the matrix). The vocabulary and IDF weights drift as uploads
+accumulate, so the index is rebuilt from MongoDB once enough has changed
+or it gets old, then saved to disk. On startup the saved index is
+loaded and caught up with resumes inserted after it was saved.
+
+scikit-learn, scipy and joblib are imported on first build/load (in the
+background startup task), not when the app is imported.
+
+Configuration (environment):
+    TFIDF_INDEX_DIR           where the index is saved (default: backend/data/tfidf_index)
+    TFIDF_MAX_FEATURES        vocabulary size cap (default: 50000)
+    TFIDF_CHECK_SECONDS       how often to check for rebuild/save (default: 300)
+    TFIDF_REBUILD_FRACTION    rebuild once adds/deletes reach this share of the index (default: 0.1)
+    TFIDF_REBUILD_SECONDS     rebuild a changed index after this age (default: 86400)
+"""
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from typing import List, Optional, Set, Tuple
+
+import numpy as np
+from bson import ObjectId
+from fastapi.concurrency import run_in_threadpool
+
+VECTORIZER_FILE = "vectorizer.joblib"
+MATRIX_FILE = "matrix.npz"
+META_FILE = "meta.json"
+
+# cleaned_text keeps "+" and "#" (c++, c#); single letters like "c" and "r" are skills too
+TOKEN_PATTERN = r"(?u)[\w+#]+"
+
+
+def _new_vectorizer(max_features: Optional[int]):
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    return TfidfVectorizer(
+        token_pattern=TOKEN_PATTERN,
+        lowercase=False,
+        sublinear_tf=True,
+        max_df=0.95,
+        max_features=max_features,
+        dtype=np.float32,
+    )
+
+
+class TfidfIndex:
+    """TF-IDF rows for a set of resume ids, queryable by cosine similarity."""
+
+    def __init__(self, vectorizer, matrix, ids: List[str], alive=None, built_at: float = None):
+        self.vectorizer = vectorizer
+        self.matrix = matrix.tocsr()
+        self.ids = list(ids)
+        self.alive = np.ones(len(self.ids), dtype=bool) if alive is None else np.asarray(alive, dtype=bool)
+        self.built_at = built_at or time.time()
+        self.changes = 0
+        self._positions = {resume_id: i for i, resume_id in enumerate(self.ids)}
+        self._pending_ids: List[str] = []
+        self._pending_rows = []
+        self._pending_alive: List[bool] = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def build(cls, ids: List[str], texts: List[str], max_features: Optional[int] = 50000) -> "TfidfIndex":
+        vectorizer = _new_vectorizer(max_features)
+        try:
+            matrix = vectorizer.fit_transform(texts)
+        except ValueError:
+            import scipy.sparse as sp
+
+            # Empty corpus or no usable tokens; appends wait for the next rebuild
+            return cls(None, sp.csr_matrix((len(ids), 0), dtype=np.float32), ids)
+        return cls(vectorizer, matrix, ids)
+
+    @property
+    def size(self) -> int:
+        return int(self.alive.sum()) + sum(self._pending_alive)
+
+    def add(self, resume_id: str, text: str):
+        """Append a resume using the current vocabulary (no-op if already indexed)."""
+        with self._lock:
+            self.changes += 1
+            if self.vectorizer is None or resume_id in self._positions:
+                return
+            self._positions[resume_id] = len(self.ids) + len(self._pending_ids)
+            self._pending_ids.append(resume_id)
+            self._pending_rows.append(self.vectorizer.transform([text or ""]))
+            self._pending_alive.append(True)
+
+    def remove(self, resume_id: str):
+        """Mask a resume out; O(1), so it is safe to call on the event loop."""
+        with self._lock:
+            position = self._positions.pop(resume_id, None)
+            if position is None:
+                return
+            if position < len(self.ids):
+                self.alive[position] = False
+            else:
+                self._pending_alive[position - len(self.ids)] = False
+            self.changes += 1
+
+    def _merge_pending(self):
+        # Appends are batched into one vstack at query/save time
+        if not self._pending_ids:
+            return
+        import scipy.sparse as sp
+
+        self.matrix = sp.vstack([self.matrix, *self._pending_rows], format="csr")
+        self.ids.extend(self._pending_ids)
+        self.alive = np.concatenate([self.alive, np.array(self._pending_alive, dtype=bool)])
+        self._pending_ids, self._pending_rows, self._pending_alive = [], [], []
+
+    def query(self, text: str, top_k: int = 10) -> List[Tuple[str, float]]:
+        """Return up to ``top_k`` (resume_id, cosine score) pairs, best first."""
+        if self.vectorizer is None or top_k <= 0:
+            return []
+        with self._lock:
+            self._merge_pending()
+            matrix, ids, alive = self.matrix, self.ids, self.alive
+
+        query_vector = self.vectorizer.transform([text or ""])
+        if not query_vector.nnz or not len(ids):
+            return []
+        # Rows and query are L2-normalised, so the dot product is the cosine
+        scores = matrix @ query_vector.toarray().ravel()
+        scores[~alive] = 0.0
+
+        k = min(top_k, len(scores))
+        top = np.argpartition(scores, len(scores) - k)[len(scores) - k:]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(ids[i], round(float(scores[i]), 4)) for i in top if scores[i] > 0]
+
+    def save(self, directory: str, last_id: Optional[str] = None):
+        """Write the index to ``directory``, replacing any previous copy.
+
+        Each writer stages into its own temp directory next to ``directory``
+        and renames it into place, so workers saving at once never share files.
+        """
+        import joblib
+        import scipy.sparse as sp
+
+        with self._lock:
+            self._merge_pending()
+            matrix, ids, alive = self.matrix, list(self.ids), self.alive.copy()
+
+        parent, name = os.path.split(os.path.abspath(directory))
+        os.makedirs(parent, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix=f".{name}.tmp-", dir=parent)
+        joblib.dump(self.vectorizer, os.path.join(staging, VECTORIZER_FILE))
+        # Uncompressed: zlib on millions of float32 values dominates save time
+        sp.save_npz(os.path.join(staging, MATRIX_FILE), matrix, compressed=False)
+        with open(os.path.join(staging, META_FILE), "w") as handle:
+            json.dump({
+                "ids": ids,
+                "alive": alive.astype(int).tolist(),
+                "built_at": self.built_at,
+                "last_id": last_id or (max(ids) if ids else None),
+            }, handle)
+
+        previous = staging + ".old"
+        try:
+            os.rename(directory, previous)
+        except FileNotFoundError:
+            pass
+        try:
+            os.rename(staging, directory)
+        except OSError:
+            # Another writer put its copy in place between the two renames; keep theirs
+            shutil.rmtree(staging, ignore_errors=True)
+        shutil.rmtree(previous, ignore_errors=True)
+
+    @classmethod
+    def load(cls, directory: str) -> Tuple[Optional["TfidfIndex"], Optional[str]]:
+        """Load a saved index and the last resume id it covers; (None, None) if absent."""
+        meta_path = os.path.join(directory, META_FILE)
+        if not os.path.exists(meta_path):
+            return None, None
+        import joblib
+        import scipy.sparse as sp
+
+        with open(meta_path) as handle:
+            meta = json.load(handle)
+        vectorizer = joblib.load(os.path.join(directory, VECTORIZER_FILE))
+        matrix = sp.load_npz(os.path.join(directory, MATRIX_FILE))
+        index = cls(vectorizer, matrix, meta["ids"], alive=meta["alive"], built_at=meta["built_at"])
+        return index, meta.get("last_id")
+
+
+async def _read_corpus(collection, query=None) -> Tuple[List[str], List[str]]:
+    ids, texts = [], []
+    async for doc in collection.find(query or {}, {"cleaned_text": 1}).sort("_id", 1):
+        ids.append(str(doc["_id"]))
+        texts.append(doc.get("cleaned_text") or "")
+    return ids, texts
+
+
+class TfidfIndexManager:
+    """Owns the live TfidfIndex: load/build at startup, append, periodic rebuild and save."""
+
+    def __init__(
+        self,
+        directory: str,
+        max_features: Optional[int] = 50000,
+        check_seconds: float = 300,
+        rebuild_fraction: float = 0.1,
+        rebuild_seconds: float = 86400,
+    ):
+        self.directory = directory
+        self.max_features = max_features
+        self.check_seconds = check_seconds
+        self.rebuild_fraction = rebuild_fraction
+        self.rebuild_seconds = rebuild_seconds
+        self.index: Optional[TfidfIndex] = None
+        self._saved_changes = 0
+        self._task: Optional[asyncio.Task] = None
+        # Deletes seen while a load/rebuild runs, replayed on the new index
+        self._removed_while_building: Optional[Set[str]] = None
+
+    async def start(self, collection):
+        """Load or build the index in the background, then keep it maintained."""
+        if collection is not None and self._task is None:
+            self._task = asyncio.create_task(self._run(collection))
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.index is not None and self.index.changes != self._saved_changes:
+            await self.save()
+
+    async def _run(self, collection):
+        try:
+            await self.load_or_build(collection)
+        except Exception as e:
+            print(f"⚠️  Could not load resume TF-IDF index: {e}")
+        while True:
+            await asyncio.sleep(self.check_seconds)
+            try:
+                await self.maintain(collection)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️  Resume TF-IDF index maintenance failed: {e}")
+
+    def _install(self, index: TfidfIndex):
+        for resume_id in self._removed_while_building or ():
+            index.remove(resume_id)
+        self._removed_while_building = None
+        self.index = index
+
+    async def load_or_build(self, collection):
+        self._removed_while_building = set()
+        try:
+            index, last_id = await run_in_threadpool(TfidfIndex.load, self.directory)
+            if index is None:
+                await self.rebuild(collection)
+                return
+            # Catch up with resumes stored after the index was saved
+            if last_id and ObjectId.is_valid(last_id):
+                ids, texts = await _read_corpus(collection, {"_id": {"$gt": ObjectId(last_id)}})
+                for resume_id, text in zip(ids, texts):
+                    index.add(resume_id, text)
+        except BaseException:
+            self._removed_while_building = None
+            raise
+        self._install(index)
+        print(f"✅ Resume TF-IDF index loaded ({index.size} resumes)")
+
+    def needs_rebuild(self) -> bool:
+        index = self.index
+        if index is None:
+            return True
+        if not index.changes:
+            return False
+        if index.vectorizer is None:
+            return True
+        base = max(len(index.ids), 1)
+        age = time.time() - index.built_at
+        return index.changes >= self.rebuild_fraction * base or age >= self.rebuild_seconds
+
+    async def rebuild(self, collection):
+        if self._removed_while_building is None:
+            self._removed_while_building = set()
+        try:
+            ids, texts = await _read_corpus(collection)
+            started = time.perf_counter()
+            index = await run_in_threadpool(TfidfIndex.build, ids, texts, self.max_features)
+            # Pick up resumes uploaded while the new index was being fitted
+            if not ids or ObjectId.is_valid(ids[-1]):
+                query = {"_id": {"$gt": ObjectId(ids[-1])}} if ids else None
+                new_ids, new_texts = await _read_corpus(collection, query)
+                for resume_id, text in zip(new_ids, new_texts):
+                    index.add(resume_id, text)
+        except BaseException:
+            self._removed_while_building = None
+            raise
+        # ...and drop the ones deleted meanwhile, which the snapshot still had
+        self._install(index)
+        self._saved_changes = 0
+        await self.save()
+        print(f"✅ Resume TF-IDF index built ({len(ids)} resumes, {time.perf_counter() - started:.1f}s)")
+
+    async def maintain(self, collection):
+        if self.needs_rebuild():
+            await self.rebuild(collection)
+        elif self.index.changes != self._saved_changes:
+            await self.save()
+
+    async def save(self):
+        index = self.index
+        if index is None:
+            return
+        changes = index.changes
+        await run_in_threadpool(index.save, self.directory)
+        self._saved_changes = changes
+
+    def add(self, resume_id: str, text: str):
+        if self.index is not None:
+            self.index.add(resume_id, text)
+
+    def remove(self, resume_id: str):
+        if self.index is not None:
+            self.index.remove(resume_id)
+        if self._removed_while_building is not None:
+            self._removed_while_building.add(resume_id)
+
+
+def _env_number(name: str, default):
+    value = os.getenv(name)
+    return type(default)(value) if value else default
+
+
+TFIDF_INDEX = TfidfIndexManager(
+    directory=os.getenv("TFIDF_INDEX_DIR")
+    or os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "tfidf_index"),
+    max_features=_env_number("TFIDF_MAX_FEATURES", 50000) or None,
+    check_seconds=_env_number("TFIDF_CHECK_SECONDS", 300.0),
+    rebuild_fraction=_env_number("TFIDF_REBUILD_FRACTION", 0.1),
+    rebuild_seconds=_env_number("TFIDF_REBUILD_SECONDS", 86400.0),
+)
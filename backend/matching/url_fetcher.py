@@ -0,0 +1,256 @@
+"""
+Async job description fetcher.
+
+One shared httpx connection pool with connect/read timeouts, a cap on the
+response body, and a limit on concurrent requests per host. Responses that
+carry an ETag or Last-Modified are cached by URL and revalidated with a
+conditional GET, so an unchanged posting costs a 304 instead of a refetch.
+HTML is reduced to text while the body streams in. httpx is imported when
+the first URL is fetched.
+
+Bad input (a non-http(s) URL, an oversized page) raises ValueError; failing
+to reach the page (transport errors, timeouts, non-200 responses, httpx not
+installed) raises UpstreamFetchError, a ValueError subclass the router maps
+to 502.
+
+Configuration (environment):
+    JD_FETCH_CONNECT_TIMEOUT  seconds to connect (default: 5)
+    JD_FETCH_READ_TIMEOUT     seconds between received bytes (default: 10)
+    JD_FETCH_MAX_BYTES        largest accepted body (default: 2 MiB)
+    JD_FETCH_PER_HOST         concurrent requests per host (default: 4)
+    JD_FETCH_CACHE_SIZE       cached URLs (default: 128)
+"""
+import asyncio
+import codecs
+import os
+import re
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from html.parser import HTMLParser
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+# Content of these elements is never visible text
+_SKIPPED_TAGS = {"script", "style", "noscript", "template", "svg", "head"}
+# Elements that start a new line of text
+_BLOCK_TAGS = {
+    "p", "div", "br", "li", "ul", "ol", "tr", "table", "section", "article",
+    "header", "footer", "h1", "h2", "h3", "h4", "h5", "h6", "pre", "blockquote",
+}
+
+
+class UpstreamFetchError(ValueError):
+    """Raised when the job description page could not be retrieved."""
+
+
+class HTMLTextExtractor(HTMLParser):
+    """Incremental HTML-to-text: ``feed`` chunks as they arrive, then ``text()``."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._parts = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag in _BLOCK_TAGS:
+            self._parts.append("\n")
+
+    def handle_startendtag(self, tag, attrs):
+        if tag in _BLOCK_TAGS:
+            self._parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in _BLOCK_TAGS:
+            self._parts.append("\n")
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self._parts.append(data)
+
+    def text(self) -> str:
+        self.close()
+        lines = (re.sub(r"[ \t\r\f\v]+", " ", line).strip() for line in "".join(self._parts).split("\n"))
+        return "\n".join(line for line in lines if line)
+
+
+class _PlainText:
+    """Same interface as HTMLTextExtractor for non-HTML bodies."""
+
+    def __init__(self):
+        self._parts = []
+
+    def feed(self, data):
+        self._parts.append(data)
+
+    def text(self) -> str:
+        return "".join(self._parts).strip()
+
+
+class _CachedPage:
+    __slots__ = ("text", "etag", "last_modified")
+
+    def __init__(self, text: str, etag: Optional[str], last_modified: Optional[str]):
+        self.text = text
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+class JDFetcher:
+    """Pooled, size-capped, per-host limited URL fetcher with a revalidating cache."""
+
+    def __init__(
+        self,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 10.0,
+        max_bytes: int = 2 * 1024 * 1024,
+        per_host: int = 4,
+        cache_size: int = 128,
+        max_connections: int = 20,
+    ):
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_bytes = max_bytes
+        self.per_host = per_host
+        self.cache_size = cache_size
+        self.max_connections = max_connections
+        self._client: Optional["httpx.AsyncClient"] = None
+        # host -> semaphore, only while some request holds or waits on it (hosts are user-supplied)
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self._host_users: Dict[str, int] = {}
+        self._cache: "OrderedDict[str, _CachedPage]" = OrderedDict()
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.read_timeout, connect=self.connect_timeout),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                follow_redirects=True,
+                headers={"User-Agent": "SmartHiringPlatform/1.0 (job description fetcher)"},
+            )
+        return self._client
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._host_limits.clear()
+        self._host_users.clear()
+
+    @asynccontextmanager
+    async def _host_slot(self, host: str):
+        """Hold one of ``host``'s ``per_host`` slots; its semaphore is dropped once idle."""
+        limit = self._host_limits.get(host)
+        if limit is None:
+            limit = self._host_limits[host] = asyncio.Semaphore(self.per_host)
+        self._host_users[host] = self._host_users.get(host, 0) + 1
+        try:
+            async with limit:
+                yield
+        finally:
+            # aclose() may have cleared the maps meanwhile
+            users = self._host_users.get(host, 1) - 1
+            if users:
+                self._host_users[host] = users
+            elif self._host_limits.get(host) is limit:
+                del self._host_limits[host]
+                self._host_users.pop(host, None)
+
+    def _remember(self, url: str, page: _CachedPage):
+        if self.cache_size <= 0:
+            return
+        self._cache[url] = page
+        self._cache.move_to_end(url)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    async def fetch_text(self, url: str) -> str:
+        """Fetch ``url`` and return its text (HTML stripped).
+
+        Raises ValueError for bad input and UpstreamFetchError when the page
+        cannot be retrieved.
+        """
+        try:
+            import httpx
+        except ImportError:
+            raise UpstreamFetchError("Fetching job descriptions from URLs is unavailable (httpx is not installed)")
+
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError("URL must be an absolute http(s) URL")
+
+        cached = self._cache.get(url)
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        try:
+            async with self._host_slot(parts.hostname):
+                async with self._get_client().stream("GET", url, headers=headers) as response:
+                    if response.status_code == 304 and cached is not None:
+                        self._cache.move_to_end(url)
+                        return cached.text
+                    if response.status_code != 200:
+                        raise UpstreamFetchError("Could not fetch job description from URL")
+                    text = await self._read_text(response)
+        except httpx.InvalidURL:
+            raise ValueError("URL must be an absolute http(s) URL")
+        except httpx.TimeoutException:
+            raise UpstreamFetchError("Timed out fetching job description from URL")
+        except (httpx.HTTPError, httpx.StreamError, OSError):
+            raise UpstreamFetchError("Could not fetch job description from URL")
+
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if etag or last_modified:
+            self._remember(url, _CachedPage(text, etag, last_modified))
+        else:
+            self._cache.pop(url, None)
+        return text
+
+    async def _read_text(self, response: "httpx.Response") -> str:
+        too_large = ValueError(f"Job description page is larger than {self.max_bytes // 1024} KiB")
+        declared = response.headers.get("content-length")
+        if declared and declared.isdigit() and int(declared) > self.max_bytes:
+            raise too_large
+
+        content_type = response.headers.get("content-type", "").lower()
+        sink = HTMLTextExtractor() if "html" in content_type else _PlainText()
+        try:
+            decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="ignore")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+
+        received = 0
+        async for chunk in response.aiter_bytes():
+            received += len(chunk)
+            if received > self.max_bytes:
+                raise too_large
+            sink.feed(decoder.decode(chunk))
+        sink.feed(decoder.decode(b"", final=True))
+        return sink.text()
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+JD_FETCHER = JDFetcher(
+    connect_timeout=_env_float("JD_FETCH_CONNECT_TIMEOUT", 5),
+    read_timeout=_env_float("JD_FETCH_READ_TIMEOUT", 10),
+    max_bytes=int(_env_float("JD_FETCH_MAX_BYTES", 2 * 1024 * 1024)),
+    per_host=int(_env_float("JD_FETCH_PER_HOST", 4)),
+    cache_size=int(_env_float("JD_FETCH_CACHE_SIZE", 128)),
+)
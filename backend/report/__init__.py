@@ -0,0 +1,2 @@
+# Full Report Module
+# One call that runs every resume/JD analyzer over a single shared document model
@@ -0,0 +1,169 @@
+"""
+Full resume/JD report in one call.
+
+The frontend used to POST the same resume and JD to every analyzer
+endpoint, and each one lowercased, split and keyword-scanned the text
+again. Here the pair becomes one ``ReportContext`` (an ``AnalysisContext``),
+whose resume and JD ``TextAnalysis`` documents memoize the lowercased text,
+lines, ATS tokens, skill and keyword hits and experience figures. Every
+section reads those instead of the raw text, and the role match is shared
+by the job_roles and career_paths sections.
+
+Each section matches its standalone endpoint's response (and error
+message), and can be left out via ``sections``. Sections run one after
+another: they are pure-Python and hold the GIL, so spreading them over
+threads measured no faster, while a report runs in a threadpool worker
+and concurrent reports already use the others.
+"""
+from functools import cached_property
+from typing import Callable, Dict, List, Tuple
+
+from ai_enhancements.generator import (
+    analyze_resume_for_improvements,
+    generate_cover_letter,
+    generate_interview_prep,
+)
+from insights.analyzer import analyze_keyword_gaps, match_job_roles, suggest_career_paths
+from matching.analysis_context import AnalysisContext
+from matching.jd_matcher import calculate_match_percentage
+from report.schemas import ReportRequest
+
+
+class ReportContext(AnalysisContext):
+    """The shared documents plus results more than one section needs."""
+
+    def __init__(self, request: ReportRequest):
+        super().__init__(request.resume_text, request.job_description or "")
+        self.request = request
+
+    @cached_property
+    def role_match(self) -> Tuple[List[Dict], str, float]:
+        """``match_job_roles`` result, shared by the job_roles and career_paths sections."""
+        return match_job_roles(self.request.resume_text, self.request.skills_extracted, resume_doc=self.resume)
+
+
+def _ats_match(request: ReportRequest, context: AnalysisContext) -> Dict:
+    return calculate_match_percentage(request.resume_text, request.job_description, context=context)
+
+
+def _keyword_gaps(request: ReportRequest, context: AnalysisContext) -> Dict:
+    missing_keywords, gap_score, critical_gaps, recommendations = analyze_keyword_gaps(
+        request.resume_text, request.job_description, resume_doc=context.resume, jd_doc=context.jd
+    )
+    return {
+        "missing_keywords": missing_keywords[:15],  # Top 15 gaps, as /insights/keyword-gaps
+        "total_gap_score": gap_score,
+        "critical_gaps": critical_gaps,
+        "recommendations": recommendations,
+    }
+
+
+def _job_roles(request: ReportRequest, context: ReportContext) -> Dict:
+    top_roles, current_level, confidence = context.role_match
+    return {"top_roles": top_roles, "current_level": current_level, "confidence": confidence}
+
+
+def _career_paths(request: ReportRequest, context: ReportContext) -> Dict:
+    current_trajectory, recommended_paths, skill_plan = suggest_career_paths(
+        request.resume_text,
+        request.skills_extracted,
+        request.experience_years,
+        resume_doc=context.resume,
+        role_match=context.role_match,
+    )
+    return {
+        "current_trajectory": current_trajectory,
+        "recommended_paths": recommended_paths,
+        "skill_development_plan": skill_plan,
+    }
+
+
+def _resume_improvements(request: ReportRequest, context: AnalysisContext) -> Dict:
+    suggestions, improvement_potential, top_improvements, estimated_impact = analyze_resume_for_improvements(
+        request.resume_text, request.job_description, resume_doc=context.resume
+    )
+    return {
+        "suggestions": suggestions,
+        "overall_score": improvement_potential,
+        "top_improvements": top_improvements,
+        "estimated_impact": estimated_impact,
+    }
+
+
+def _interview_prep(request: ReportRequest, context: AnalysisContext) -> Dict:
+    questions, talking_points, skills_to_highlight, common_questions = generate_interview_prep(
+        request.resume_text, request.job_description, request.focus_areas, resume_doc=context.resume
+    )
+    return {
+        "questions": questions,
+        "key_talking_points": talking_points,
+        "skills_to_highlight": skills_to_highlight,
+        "common_questions": common_questions,
+    }
+
+
+def _cover_letter(request: ReportRequest, context: AnalysisContext) -> Dict:
+    cover_letter, sections, key_highlights, customization = generate_cover_letter(
+        request.resume_text,
+        request.job_description,
+        request.company_name,
+        request.position_title,
+        request.tone,
+        resume_doc=context.resume,
+    )
+    return {
+        "cover_letter": cover_letter,
+        "sections": sections,
+        "key_highlights": key_highlights,
+        "customization_level": customization,
+    }
+
+
+# name -> (builder, request fields it needs, error prefix of the standalone endpoint)
+SECTIONS: Dict[str, Tuple[Callable, Tuple[str, ...], str]] = {
+    "ats_match": (_ats_match, ("job_description",), "Failed to analyze job match"),
+    "keyword_gaps": (_keyword_gaps, ("job_description",), "Error analyzing keyword gaps"),
+    "job_roles": (_job_roles, (), "Error matching job roles"),
+    "career_paths": (_career_paths, (), "Error suggesting career paths"),
+    "resume_improvements": (_resume_improvements, (), "Error analyzing resume"),
+    "interview_prep": (_interview_prep, (), "Error preparing interview materials"),
+    "cover_letter": (
+        _cover_letter,
+        ("job_description", "company_name", "position_title"),
+        "Error generating cover letter",
+    ),
+}
+
+
+def select_sections(request: ReportRequest) -> List[str]:
+    """Requested sections, or every section whose inputs are present.
+
+    Raises ValueError if a requested section is missing an input.
+    """
+    if request.sections is None:
+        return [
+            name for name, (_, needs, _) in SECTIONS.items()
+            if all(getattr(request, field) for field in needs)
+        ]
+    for name in request.sections:
+        missing = [field for field in SECTIONS[name][1] if not getattr(request, field)]
+        if missing:
+            raise ValueError(f"Section '{name}' needs: {', '.join(missing)}")
+    return list(dict.fromkeys(request.sections))
+
+
+def build_report(request: ReportRequest) -> Dict:
+    """Run the selected sections over one shared ReportContext."""
+    if not request.resume_text:
+        raise ValueError("Resume text is required")
+    names = select_sections(request)
+    context = ReportContext(request)
+
+    report: Dict = {"errors": {}}
+    for name in names:
+        builder, _, error_prefix = SECTIONS[name]
+        try:
+            report[name] = builder(request, context)
+        except Exception as e:
+            report["errors"][name] = f"{error_prefix}: {e}"
+    return report
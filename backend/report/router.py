@@ -0,0 +1,23 @@
+from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
+
+from .builder import build_report
+from .schemas import ReportRequest, ReportResponse
+
+router = APIRouter(prefix="/report", tags=["report"])
+
+
+@router.post("", response_model=ReportResponse)
+async def full_report(request: ReportRequest):
+    """
+    Run the ATS match, insights and AI analyzers on one resume/JD pair.
+
+    The text is lowercased, split and scanned once and shared by every
+    section. Use ``sections`` to request a subset; sections that fail are
+    listed in ``errors`` and the rest are still returned.
+    """
+    try:
+        # CPU-bound; keep it off the event loop
+        return await run_in_threadpool(build_report, request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -0,0 +1,39 @@
+from pydantic import BaseModel
+from typing import Dict, List, Literal, Optional
+
+from ai_enhancements.schemas import CoverLetterResponse, InterviewPrepResponse, ResumeImprovementResponse
+from insights.schemas import CareerPathResponse, JobRoleMatchResponse, KeywordGapAnalysis
+from matching.schemas import JDMatchResponse
+
+ReportSection = Literal[
+    "ats_match",
+    "keyword_gaps",
+    "job_roles",
+    "career_paths",
+    "resume_improvements",
+    "interview_prep",
+    "cover_letter",
+]
+
+class ReportRequest(BaseModel):
+    resume_text: str
+    job_description: Optional[str] = None
+    skills_extracted: Optional[List[str]] = None
+    experience_years: Optional[float] = None
+    focus_areas: Optional[List[str]] = None
+    company_name: Optional[str] = None
+    position_title: Optional[str] = None
+    tone: Optional[str] = "professional"
+    # Field mask; default is every section whose inputs are present
+    sections: Optional[List[ReportSection]] = None
+
+class ReportResponse(BaseModel):
+    ats_match: Optional[JDMatchResponse] = None
+    keyword_gaps: Optional[KeywordGapAnalysis] = None
+    job_roles: Optional[JobRoleMatchResponse] = None
+    career_paths: Optional[CareerPathResponse] = None
+    resume_improvements: Optional[ResumeImprovementResponse] = None
+    interview_prep: Optional[InterviewPrepResponse] = None
+    cover_letter: Optional[CoverLetterResponse] = None
+    # Sections that failed, with the same message their standalone endpoint gives
+    errors: Dict[str, str] = {}
@@ -0,0 +1,100 @@
+"""
+Backfill resume fingerprints for documents stored before fingerprints
+existed, or built against an older fingerprint version / TECH_SKILLS size.
+
+Usage (from the backend directory):
+    python -m resume.backfill
+"""
+import asyncio
+
+from fastapi.concurrency import run_in_threadpool
+from pymongo import ASCENDING, UpdateOne
+
+from analytics.skill_counters import counters_lease, counters_ready, reconcile_skill_counts
+from resume.fingerprint import STALE_FINGERPRINT_FILTER, bitset_to_skills, get_fingerprint
+
+
+def _previous_skills(old_fingerprint):
+    """Skills a document was counted under before re-parsing, or None if unknown."""
+    if old_fingerprint and "skills_bitset" in old_fingerprint:
+        try:
+            return bitset_to_skills(old_fingerprint["skills_bitset"])
+        except IndexError:
+            pass
+    # Unfingerprinted: counted from whatever its text yielded when the counters were built
+    return None
+
+
+def _fingerprint_batch(docs):
+    return [get_fingerprint(doc) for doc in docs]
+
+
+async def backfill_fingerprints(collection, batch_size: int = 500, counts_collection=None) -> int:
+    """Compute and store fingerprints for every stale document. Returns count updated.
+
+    Fingerprints are computed ``batch_size`` documents at a time in the
+    threadpool, off the event loop.
+
+    When ``counts_collection`` is given (and has been built), the counters
+    of every skill a re-parsed document gained or lost are then recounted
+    from the stored fingerprints. A document with no readable previous
+    fingerprint may have been counted under any skills, so all are recounted.
+    """
+    await collection.create_index([("fingerprint.version", ASCENDING)])
+    if counts_collection is not None and not await counters_ready(counts_collection):
+        counts_collection = None
+
+    updated = 0
+    # Skills whose counters may be off; None once every skill needs a recount
+    affected = set()
+
+    async def store(docs):
+        nonlocal updated, affected
+        old_fingerprints = [doc.pop("fingerprint", None) for doc in docs]
+        # Skill and experience extraction is CPU-bound: keep it off the event loop
+        fingerprints = await run_in_threadpool(_fingerprint_batch, docs)
+        for old_fingerprint, fingerprint in zip(old_fingerprints, fingerprints):
+            if counts_collection is not None and affected is not None:
+                previous = _previous_skills(old_fingerprint)
+                if previous is None:
+                    affected = None
+                else:
+                    affected.update(set(previous) ^ set(fingerprint["skills"]))
+        operations = [
+            UpdateOne({"_id": doc["_id"]}, {"$set": {"fingerprint": fingerprint}})
+            for doc, fingerprint in zip(docs, fingerprints)
+        ]
+        updated += (await collection.bulk_write(operations, ordered=False)).modified_count
+
+    batch = []
+    projection = {"resume_text": 1, "cleaned_text": 1, "fingerprint": 1}
+    async for doc in collection.find(STALE_FINGERPRINT_FILTER, projection, batch_size=batch_size):
+        batch.append(doc)
+        if len(batch) >= batch_size:
+            await store(batch)
+            batch = []
+    if batch:
+        await store(batch)
+    if counts_collection is not None and affected != set():
+        # One recount at a time, so concurrent backfills cannot interleave their writes
+        async with counters_lease(counts_collection):
+            await reconcile_skill_counts(counts_collection, collection, affected)
+    return updated
+
+
+async def _main() -> None:
+    from database.mongo import get_resume_collection, get_skill_counts_collection
+    from database.schema import close_mongo_connection, connect_to_mongo
+
+    await connect_to_mongo()
+    try:
+        updated = await backfill_fingerprints(
+            get_resume_collection(), counts_collection=get_skill_counts_collection()
+        )
+        print(f"✅ Backfilled fingerprints for {updated} resumes")
+    finally:
+        await close_mongo_connection()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
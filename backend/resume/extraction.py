@@ -0,0 +1,210 @@
+"""
+Document extraction service.
+
+pdfplumber and python-docx parsing is CPU-heavy pure Python, so it runs in a
+process pool instead of on the event loop. The number of jobs in flight is
+bounded: when the pool is saturated new jobs are refused straight away
+(surfaced as HTTP 429) instead of queueing without limit. If a worker dies
+(e.g. killed for memory on a hostile PDF) the pool is replaced and the
+jobs it took down fail as unavailable (HTTP 503) rather than as bad input.
+
+Configuration (environment):
+    EXTRACTION_WORKERS          worker processes (default: CPUs allowed by the
+                                container's cgroup CPU quota, at least 1, max 4)
+    EXTRACTION_MAX_PENDING      jobs running or queued before refusing (default: 4 x workers)
+    EXTRACTION_TIMEOUT_SECONDS  per-job timeout (default: 30)
+    EXTRACTION_MAX_PAGES        pages read per PDF (default: 50)
+    EXTRACTION_MAX_CHARS        characters read per document (default: 200000)
+"""
+import asyncio
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Optional, Union
+
+from matching.jd_matcher import extract_text_from_file
+from resume.cleaner import clean_text
+from resume.fingerprint import FingerprintBuilder
+from resume.ingest import open_source
+from resume.near_duplicates import minhash_signature
+from resume.parser import iter_pdf_pages
+
+
+class ExtractionQueueFull(Exception):
+    """Raised when the extraction pool already has its maximum of pending jobs."""
+
+
+class ExtractionTimeout(Exception):
+    """Raised when a document takes longer than the per-job timeout to parse."""
+
+
+class ExtractionUnavailable(Exception):
+    """Raised when the pool lost a worker while running the job; the pool is replaced."""
+
+
+def process_resume_pdf(file_obj, max_pages: Optional[int] = None, max_chars: Optional[int] = None) -> Dict:
+    """Extract, clean and fingerprint a resume PDF page by page.
+
+    Each page is cleaned and fed to the fingerprint as it is read, so only
+    the page texts themselves (needed for storage) are kept. The MinHash
+    signature for near-duplicate detection is taken over the cleaned text.
+    """
+    raw_pages = []
+    cleaned_pages = []
+    fingerprint = FingerprintBuilder()
+    for page_text in iter_pdf_pages(file_obj, max_pages, max_chars):
+        raw_pages.append(page_text)
+        cleaned = clean_text(page_text)
+        if cleaned:
+            cleaned_pages.append(cleaned)
+        fingerprint.add(page_text)
+    cleaned_text = " ".join(cleaned_pages)
+    return {
+        "resume_text": " ".join(raw_pages).strip(),
+        "cleaned_text": cleaned_text,
+        "fingerprint": fingerprint.build(),
+        "minhash": minhash_signature(cleaned_text),
+    }
+
+
+# Worker entry points; module-level so they can be pickled into the pool.
+# ``source`` is a SpooledUpload source: a spool file path, or small-file bytes.
+Source = Union[bytes, str]
+
+
+def _resume_pdf_job(source: Source, max_pages: Optional[int], max_chars: Optional[int]) -> Dict:
+    return process_resume_pdf(open_source(source), max_pages, max_chars)
+
+
+def _document_job(source: Source, filename: str, max_pages: Optional[int], max_chars: Optional[int]) -> str:
+    return extract_text_from_file(open_source(source), filename, max_pages, max_chars)
+
+
+class ExtractionService:
+    """Bounded process pool for document parsing."""
+
+    def __init__(
+        self,
+        workers: int,
+        max_pending: int,
+        timeout: float,
+        max_pages: Optional[int],
+        max_chars: Optional[int] = None,
+    ):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self.pending = 0
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def start(self):
+        if self._pool is None:
+            # Spawned (not forked) workers: the parent runs Motor and
+            # threadpool threads that are not safe to fork
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _release(self, _future):
+        self.pending -= 1
+
+    def _replace_broken(self, pool: ProcessPoolExecutor):
+        # Jobs that shared the broken pool all land here; only the first replaces it
+        if self._pool is pool:
+            print("⚠️  Extraction worker died; starting a fresh process pool")
+            self.shutdown()
+            self.start()
+
+    async def submit(self, fn, *args):
+        """Run ``fn(*args)`` in the pool, refusing work beyond ``max_pending``."""
+        if self.pending >= self.max_pending:
+            raise ExtractionQueueFull("Document extraction is at capacity, please retry shortly")
+        self.start()
+
+        pool = self._pool
+        try:
+            future = pool.submit(fn, *args)
+        except BrokenProcessPool:
+            self._replace_broken(pool)
+            raise ExtractionUnavailable("Document extraction restarted after a worker failure, please retry")
+        self.pending += 1
+        # A timed-out job keeps its worker busy until it finishes, so the slot
+        # is only released once the pool is actually done with it
+        loop = asyncio.get_running_loop()
+
+        def on_done(done):
+            try:
+                loop.call_soon_threadsafe(self._release, done)
+            except RuntimeError:
+                # Loop already closed; nothing else can be touching the counter
+                self._release(done)
+
+        future.add_done_callback(on_done)
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            raise ExtractionTimeout(f"Document extraction timed out after {self.timeout:g}s")
+        except BrokenProcessPool:
+            self._replace_broken(pool)
+            raise ExtractionUnavailable("Document extraction restarted after a worker failure, please retry")
+
+    async def process_resume_pdf(self, source: Source) -> Dict:
+        """Raw text, cleaned text and fingerprint of a resume PDF."""
+        return await self.submit(_resume_pdf_job, source, self.max_pages, self.max_chars)
+
+    async def extract_document(self, source: Source, filename: str) -> str:
+        return await self.submit(_document_job, source, filename, self.max_pages, self.max_chars)
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def _cgroup_cpu_limit() -> Optional[float]:
+    """CPUs allowed by the cgroup quota (v2 cpu.max or v1 cfs quota), or None if unlimited."""
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as handle:
+            quota, period = handle.read().split()[:2]
+        return None if quota == "max" else int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+    try:
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as handle:
+            quota = int(handle.read())
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_period_us") as handle:
+            period = int(handle.read())
+        return None if quota <= 0 else quota / period
+    except (OSError, ValueError):
+        return None
+
+
+def _default_workers() -> int:
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    limit = _cgroup_cpu_limit()
+    if limit is not None:
+        # A 500m pod gets one worker, not one per host core
+        cpus = min(cpus, math.floor(limit))
+    return max(1, min(cpus, 4))
+
+
+_WORKERS = _env_int("EXTRACTION_WORKERS", _default_workers())
+
+extraction_service = ExtractionService(
+    workers=_WORKERS,
+    max_pending=_env_int("EXTRACTION_MAX_PENDING", _WORKERS * 4),
+    timeout=float(os.getenv("EXTRACTION_TIMEOUT_SECONDS") or 30),
+    max_pages=_env_int("EXTRACTION_MAX_PAGES", 50) or None,
+    max_chars=_env_int("EXTRACTION_MAX_CHARS", 200_000) or None,
+)
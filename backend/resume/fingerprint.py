@@ -0,0 +1,156 @@
+"""
+Compact per-resume fingerprint computed once at upload.
+
+Holds the canonical skill set as a bitset over ``TECH_SKILLS`` indices
+(plus the same set as a plain array for server-side aggregation), the
+experience years and the categorized keyword hits, so analytics and
+matching can work from stored data instead of rescanning resume text.
+TECH_SKILLS is treated as append-only: fingerprints built against a
+different vocabulary size are recomputed on read.
+"""
+import re
+from typing import Dict, Iterable, List, Optional, Set
+
+import numpy as np
+from fastapi.concurrency import run_in_threadpool
+
+from insights.analyzer import TECHNICAL_KEYWORDS, extract_keywords_by_category
+from matching.ats_engine import _extract_skills, _preprocess
+from matching.jd_matcher import EXPERIENCE_PATTERNS
+from matching.skill_matcher import SKILL_MATCHER
+
+FINGERPRINT_VERSION = 3
+BITSET_BYTES = (len(SKILL_MATCHER.skills) + 7) // 8
+
+
+def skills_to_bitset(skills: Iterable[str]) -> bytes:
+    """Encode skills as a little-endian bitset (bit i = TECH_SKILLS[i])."""
+    bits = 0
+    for skill in skills:
+        bits |= 1 << SKILL_MATCHER.index[skill]
+    return bits.to_bytes(BITSET_BYTES, "little")
+
+
+def bitset_to_skills(bitset: bytes) -> List[str]:
+    """Decode a bitset back into skill names, in TECH_SKILLS order."""
+    bits = int.from_bytes(bitset, "little")
+    skills = SKILL_MATCHER.skills
+    result = []
+    while bits:
+        low = bits & -bits
+        result.append(skills[low.bit_length() - 1])
+        bits ^= low
+    return result
+
+
+class FingerprintBuilder:
+    """Accumulate a fingerprint from text chunks (e.g. PDF pages) as they arrive.
+
+    Skills and keyword hits are unions over chunks; experience follows
+    ``extract_experience_years`` (first pattern, in order, that matches
+    anywhere). Matches spanning two chunks are not seen.
+    """
+
+    def __init__(self):
+        self._skills: Set[str] = set()
+        self._keywords: Dict[str, Set[str]] = {}
+        self._experience: List[Optional[int]] = [None] * len(EXPERIENCE_PATTERNS)
+
+    def add(self, text: str):
+        self._skills.update(_extract_skills(_preprocess(text)))
+        for category, hits in extract_keywords_by_category(text).items():
+            if hits:
+                self._keywords.setdefault(category, set()).update(hits)
+        lower = text.lower()
+        for i, pattern in enumerate(EXPERIENCE_PATTERNS):
+            if self._experience[i] is None:
+                match = re.search(pattern, lower)
+                if match:
+                    self._experience[i] = int(match.group(1))
+
+    def build(self) -> Dict:
+        skills = sorted(self._skills)
+        experience = next((years for years in self._experience if years is not None), 0)
+        return {
+            "version": FINGERPRINT_VERSION,
+            "vocabulary_size": len(SKILL_MATCHER.skills),
+            "skills_bitset": skills_to_bitset(skills),
+            "skills": skills,
+            "skill_count": len(skills),
+            "experience_years": experience,
+            # Keyword order follows TECHNICAL_KEYWORDS, as in a single-text scan
+            "keyword_hits": {
+                category: [kw for kw in TECHNICAL_KEYWORDS[category] if kw in self._keywords[category]]
+                for category in TECHNICAL_KEYWORDS
+                if category in self._keywords
+            },
+        }
+
+
+def compute_fingerprint(resume_text: str) -> Dict:
+    """Build the fingerprint stored next to a resume document."""
+    builder = FingerprintBuilder()
+    builder.add(resume_text)
+    return builder.build()
+
+
+# Mongo filter selecting documents whose stored fingerprint is usable as-is
+CURRENT_FINGERPRINT_FILTER = {
+    "fingerprint.version": FINGERPRINT_VERSION,
+    "fingerprint.vocabulary_size": len(SKILL_MATCHER.skills),
+}
+STALE_FINGERPRINT_FILTER = {"$nor": [CURRENT_FINGERPRINT_FILTER]}
+
+
+def is_current(fingerprint: Optional[Dict]) -> bool:
+    return bool(fingerprint) and (
+        fingerprint.get("version") == FINGERPRINT_VERSION
+        and fingerprint.get("vocabulary_size") == len(SKILL_MATCHER.skills)
+    )
+
+
+def get_fingerprint(resume_doc: Dict) -> Dict:
+    """Return the stored fingerprint, recomputing it for legacy/stale documents."""
+    fingerprint = resume_doc.get("fingerprint")
+    if is_current(fingerprint):
+        return fingerprint
+    text = resume_doc.get("resume_text") or resume_doc.get("cleaned_text") or ""
+    return compute_fingerprint(text)
+
+
+def fingerprint_skills(resume_doc: Dict) -> Set[str]:
+    return set(bitset_to_skills(get_fingerprint(resume_doc)["skills_bitset"]))
+
+
+def fingerprint_matrix(bitsets: List[bytes]) -> np.ndarray:
+    """Unpack bitsets into a boolean (resumes x TECH_SKILLS) matrix."""
+    if not bitsets:
+        return np.zeros((0, len(SKILL_MATCHER.skills)), dtype=bool)
+    packed = np.frombuffer(b"".join(bitsets), dtype=np.uint8).reshape(len(bitsets), BITSET_BYTES)
+    bits = np.unpackbits(packed, axis=1, bitorder="little")
+    return bits[:, :len(SKILL_MATCHER.skills)].astype(bool)
+
+
+def skill_counts(bitsets: List[bytes]) -> Dict[str, int]:
+    """Number of resumes containing each skill, from stored bitsets."""
+    totals = fingerprint_matrix(bitsets).sum(axis=0)
+    return {skill: int(total) for skill, total in zip(SKILL_MATCHER.skills, totals)}
+
+
+async def load_fingerprints(collection, resume_ids: List) -> Dict:
+    """Fetch fingerprints by ``_id``, reading text only for stale documents."""
+    fingerprints = {}
+    stale_ids = []
+    async for doc in collection.find({"_id": {"$in": resume_ids}}, {"fingerprint": 1}):
+        if is_current(doc.get("fingerprint")):
+            fingerprints[doc["_id"]] = doc["fingerprint"]
+        else:
+            stale_ids.append(doc["_id"])
+    if stale_ids:
+        projection = {"resume_text": 1, "cleaned_text": 1}
+        stale = [doc async for doc in collection.find({"_id": {"$in": stale_ids}}, projection)]
+        # Re-parsing is CPU-bound: keep it off the event loop
+        recomputed = await run_in_threadpool(lambda: [get_fingerprint(doc) for doc in stale])
+        for doc, fingerprint in zip(stale, recomputed):
+            fingerprints[doc["_id"]] = fingerprint
+    return fingerprints
@@ -0,0 +1,158 @@
+"""
+Upload ingestion.
+
+Uploaded files are streamed in fixed-size chunks into a size-capped spool:
+held in memory while small, moved to a named temp file once they pass the
+spool threshold. The SHA-256 is computed on the same pass, and a file that
+goes over the cap is rejected as soon as the limit is crossed. Parsers in
+the extraction pool then open the spooled file by path, so the upload is
+never held in memory as one ``bytes`` object.
+
+``UploadLimitMiddleware`` guards the request body itself, answering 413
+from the Content-Length header, or as soon as the streamed body exceeds
+the limit, before the multipart form is fully read.
+
+Configuration (environment):
+    MAX_UPLOAD_SIZE     largest accepted file, in bytes (default: 10 MiB)
+    UPLOAD_SPOOL_BYTES  files above this go to disk (default: 1 MiB)
+"""
+import hashlib
+import os
+import tempfile
+from io import BytesIO
+from typing import Optional, Union
+
+from fastapi import HTTPException, UploadFile
+from fastapi.responses import JSONResponse
+
+CHUNK_SIZE = 64 * 1024
+UPLOAD_MAX_BYTES = int(os.getenv("MAX_UPLOAD_SIZE") or 10 * 1024 * 1024)
+UPLOAD_SPOOL_BYTES = int(os.getenv("UPLOAD_SPOOL_BYTES") or 1024 * 1024)
+# Whole multipart body: two files (job-match-analyze) plus form fields
+MAX_REQUEST_BYTES = 2 * UPLOAD_MAX_BYTES + CHUNK_SIZE
+
+
+class UploadTooLarge(Exception):
+    """Raised when an upload exceeds the configured size cap."""
+
+
+class SpooledUpload:
+    """An ingested upload: size, SHA-256 and the spooled content.
+
+    ``source`` is what the extraction workers receive: the bytes for small
+    uploads kept in memory, otherwise the path of the spool file.
+    """
+
+    def __init__(self, filename: str, spool_bytes: int = UPLOAD_SPOOL_BYTES):
+        self.filename = filename or ""
+        self.size = 0
+        self.sha256 = ""
+        self.path: Optional[str] = None
+        self._spool_bytes = spool_bytes
+        self._hash = hashlib.sha256()
+        self._file = BytesIO()
+
+    def write(self, chunk: bytes):
+        if self.path is None and self.size + len(chunk) > self._spool_bytes:
+            self._roll_over()
+        self._file.write(chunk)
+        self._hash.update(chunk)
+        self.size += len(chunk)
+
+    def _roll_over(self):
+        suffix = os.path.splitext(self.filename)[1]
+        spool = tempfile.NamedTemporaryFile(prefix="upload-", suffix=suffix, delete=False)
+        spool.write(self._file.getbuffer())
+        self._file = spool
+        self.path = spool.name
+
+    def finish(self):
+        self.sha256 = self._hash.hexdigest()
+        self._file.flush()
+
+    @property
+    def source(self) -> Union[bytes, str]:
+        return self.path if self.path is not None else self._file.getvalue()
+
+    def close(self):
+        self._file.close()
+        if self.path is not None:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+async def ingest_upload(upload: UploadFile, max_bytes: int = UPLOAD_MAX_BYTES) -> SpooledUpload:
+    """Stream an UploadFile into a SpooledUpload, hashing and size-checking as it goes."""
+    spooled = SpooledUpload(upload.filename)
+    try:
+        while True:
+            chunk = await upload.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            if spooled.size + len(chunk) > max_bytes:
+                raise UploadTooLarge(
+                    f"File is larger than the {max_bytes // (1024 * 1024)} MiB upload limit"
+                )
+            spooled.write(chunk)
+        spooled.finish()
+    except BaseException:
+        spooled.close()
+        raise
+    finally:
+        await upload.close()
+    return spooled
+
+
+async def ingest_or_413(upload: UploadFile) -> SpooledUpload:
+    try:
+        return await ingest_upload(upload)
+    except UploadTooLarge as too_large:
+        raise HTTPException(status_code=413, detail=str(too_large))
+
+
+def open_source(source: Union[bytes, str]):
+    """Parser input for a SpooledUpload source: a path, or a BytesIO over bytes."""
+    return source if isinstance(source, str) else BytesIO(source)
+
+
+class UploadLimitMiddleware:
+    """Reject multipart request bodies above ``max_bytes`` without reading them whole."""
+
+    def __init__(self, app, max_bytes: int = MAX_REQUEST_BYTES):
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        headers = dict(scope["headers"])
+        if not headers.get(b"content-type", b"").startswith(b"multipart/form-data"):
+            return await self.app(scope, receive, send)
+
+        detail = "Request body is larger than the upload limit"
+        content_length = headers.get(b"content-length")
+        if content_length and content_length.isdigit() and int(content_length) > self.max_bytes:
+            response = JSONResponse({"detail": detail}, status_code=413)
+            return await response(scope, receive, send)
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    # Re-raised by FastAPI's body parsing, answered by the exception middleware
+                    raise HTTPException(status_code=413, detail=detail)
+            return message
+
+        await self.app(scope, limited_receive, send)
@@ -0,0 +1,262 @@
+"""
+Near-duplicate resume detection with MinHash and banded LSH.
+
+``cleaned_text`` is split into overlapping word shingles, hashed with
+crc32 (stable across processes, unlike ``hash``), and reduced to a
+NUM_PERM-value MinHash signature. The fraction of equal signature values
+estimates the Jaccard similarity of two shingle sets.
+
+Signatures are cut into BANDS bands of ROWS values. Two resumes become
+candidates when any band is identical, so a lookup touches one bucket per
+band instead of every stored resume. Candidates are then confirmed against
+the Jaccard threshold using their full signatures.
+
+Configuration (environment):
+    DEDUP_JACCARD_THRESHOLD  similarity reported as near-duplicate (default: 0.8)
+"""
+import asyncio
+import os
+import zlib
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from fastapi.concurrency import run_in_threadpool
+from pymongo import UpdateOne
+
+SHINGLE_WORDS = 3
+NUM_PERM = 128
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+# Prime just above 2**32; (a * x + b) stays below 2**64 for 32-bit a, b, x
+_PRIME = np.uint64(4294967311)
+
+_rng = np.random.default_rng(20240601)
+_A = _rng.integers(1, 1 << 32, size=NUM_PERM, dtype=np.uint64)
+_B = _rng.integers(0, 1 << 32, size=NUM_PERM, dtype=np.uint64)
+
+JACCARD_THRESHOLD = float(os.getenv("DEDUP_JACCARD_THRESHOLD") or 0.8)
+
+
+def shingle_hashes(text: str, size: int = SHINGLE_WORDS) -> np.ndarray:
+    """crc32 of every ``size``-word shingle (the whole text if it is shorter)."""
+    words = (text or "").split()
+    if not words:
+        return np.zeros(0, dtype=np.uint64)
+    if len(words) <= size:
+        shingles = {" ".join(words)}
+    else:
+        shingles = {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+    return np.fromiter((zlib.crc32(s.encode()) for s in shingles), dtype=np.uint64, count=len(shingles))
+
+
+def minhash_signature(text: str) -> Optional[bytes]:
+    """NUM_PERM uint32 MinHash values as bytes, or None for text without words."""
+    hashes = shingle_hashes(text)
+    if not hashes.size:
+        return None
+    signature = np.full(NUM_PERM, np.iinfo(np.uint64).max, dtype=np.uint64)
+    # Chunked so very long texts do not allocate one huge (NUM_PERM x shingles) array
+    for start in range(0, hashes.size, 4096):
+        chunk = hashes[start:start + 4096]
+        values = (np.outer(_A, chunk) + _B[:, None]) % _PRIME
+        np.minimum(signature, values.min(axis=1), out=signature)
+    return (signature & np.uint64(0xFFFFFFFF)).astype(np.uint32).tobytes()
+
+
+def estimated_jaccard(left: bytes, right: bytes) -> float:
+    a = np.frombuffer(left, dtype=np.uint32)
+    b = np.frombuffer(right, dtype=np.uint32)
+    return float(np.count_nonzero(a == b)) / NUM_PERM
+
+
+class LSHIndex:
+    """Banded LSH buckets over MinHash signatures, keyed by resume id."""
+
+    def __init__(self, bands: int = BANDS, rows: int = ROWS):
+        self.bands = bands
+        self.rows = rows
+        self.signatures: Dict[str, bytes] = {}
+        self._buckets: List[Dict[bytes, Set[str]]] = [{} for _ in range(bands)]
+
+    def _band_keys(self, signature: bytes):
+        width = self.rows * 4
+        return [signature[band * width:(band + 1) * width] for band in range(self.bands)]
+
+    def add(self, resume_id: str, signature: Optional[bytes]):
+        if signature is None:
+            return
+        self.remove(resume_id)
+        self.signatures[resume_id] = signature
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            bucket.setdefault(key, set()).add(resume_id)
+
+    def remove(self, resume_id: str):
+        signature = self.signatures.pop(resume_id, None)
+        if signature is None:
+            return
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            members = bucket.get(key)
+            if members is not None:
+                members.discard(resume_id)
+                if not members:
+                    del bucket[key]
+
+    def snapshot(self) -> "LSHIndex":
+        """An independent copy, safe to walk in a worker thread while this one changes."""
+        copy = LSHIndex(self.bands, self.rows)
+        copy.signatures = dict(self.signatures)
+        copy._buckets = [{key: set(members) for key, members in bucket.items()} for bucket in self._buckets]
+        return copy
+
+    def candidates(self, signature: bytes) -> Set[str]:
+        found: Set[str] = set()
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            found.update(bucket.get(key, ()))
+        return found
+
+    def query(self, signature: Optional[bytes], threshold: float = JACCARD_THRESHOLD,
+              exclude: Optional[str] = None) -> List[Tuple[str, float]]:
+        """Stored resumes whose estimated Jaccard with ``signature`` is >= threshold, best first."""
+        if signature is None:
+            return []
+        matches = []
+        for resume_id in self.candidates(signature):
+            if resume_id == exclude:
+                continue
+            similarity = estimated_jaccard(signature, self.signatures[resume_id])
+            if similarity >= threshold:
+                matches.append((resume_id, round(similarity, 4)))
+        matches.sort(key=lambda match: (-match[1], match[0]))
+        return matches
+
+    def clusters(self, threshold: float = JACCARD_THRESHOLD) -> List[Dict]:
+        """Groups of resumes linked by near-duplicate pairs (union-find over LSH candidates).
+
+        Not safe against concurrent ``add``/``remove``: run it on a ``snapshot()``.
+        """
+        parent: Dict[str, str] = {}
+
+        def find(node):
+            parent.setdefault(node, node)
+            while parent[node] != node:
+                parent[node] = parent[parent[node]]
+                node = parent[node]
+            return node
+
+        pair_similarity: Dict[str, float] = {}
+        for resume_id, signature in self.signatures.items():
+            for other, similarity in self.query(signature, threshold, exclude=resume_id):
+                if other < resume_id:
+                    continue
+                root_a, root_b = find(resume_id), find(other)
+                if root_a != root_b:
+                    parent[root_b] = root_a
+                for member in (resume_id, other):
+                    pair_similarity[member] = max(pair_similarity.get(member, 0.0), similarity)
+
+        groups: Dict[str, List[str]] = {}
+        for member in pair_similarity:
+            groups.setdefault(find(member), []).append(member)
+        clusters = [
+            {
+                "resume_ids": sorted(members),
+                "max_similarity": max(pair_similarity[m] for m in members),
+            }
+            for members in groups.values()
+        ]
+        clusters.sort(key=lambda cluster: (-len(cluster["resume_ids"]), cluster["resume_ids"][0]))
+        return clusters
+
+
+def _signatures(texts: List[str]) -> List[bytes]:
+    return [minhash_signature(text) for text in texts]
+
+
+async def build_lsh_index(collection, batch_size: int = 500) -> LSHIndex:
+    """Index stored signatures.
+
+    Resumes stored before signatures existed are hashed ``batch_size`` at a
+    time in the threadpool, and their signatures written back, so each is
+    hashed once rather than on every startup.
+    """
+    index = LSHIndex()
+    async for doc in collection.find({"minhash": {"$type": "binData"}}, {"minhash": 1}):
+        index.add(str(doc["_id"]), bytes(doc["minhash"]))
+
+    async def store(docs):
+        signatures = await run_in_threadpool(_signatures, [doc.get("cleaned_text") or "" for doc in docs])
+        await collection.bulk_write(
+            [UpdateOne({"_id": doc["_id"]}, {"$set": {"minhash": sig}}) for doc, sig in zip(docs, signatures)],
+            ordered=False,
+        )
+        for doc, signature in zip(docs, signatures):
+            index.add(str(doc["_id"]), signature)
+
+    batch = []
+    legacy = collection.find({"minhash": {"$exists": False}}, {"cleaned_text": 1}, batch_size=batch_size)
+    async for doc in legacy:
+        batch.append(doc)
+        if len(batch) >= batch_size:
+            await store(batch)
+            batch = []
+    if batch:
+        await store(batch)
+    return index
+
+
+class NearDuplicateIndexManager:
+    """Holds the live LSHIndex; built in the background at startup."""
+
+    def __init__(self):
+        self.index: Optional[LSHIndex] = None
+        self._task: Optional[asyncio.Task] = None
+        self._changes_while_building: List[Tuple] = []
+
+    async def start(self, collection):
+        if collection is not None and self._task is None:
+            self._task = asyncio.create_task(self._build(collection))
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _build(self, collection):
+        try:
+            index = await build_lsh_index(collection)
+        except Exception as e:
+            print(f"⚠️  Could not build near-duplicate index: {e}")
+            return
+        # Uploads and deletes that raced with the build scan
+        for change in self._changes_while_building:
+            if change[0] == "add":
+                index.add(change[1], change[2])
+            else:
+                index.remove(change[1])
+        self._changes_while_building = []
+        self.index = index
+        print(f"✅ Near-duplicate index built ({len(index.signatures)} resumes)")
+
+    def query(self, signature: Optional[bytes]) -> List[Tuple[str, float]]:
+        if self.index is None:
+            return []
+        return self.index.query(signature)
+
+    def add(self, resume_id: str, signature: Optional[bytes]):
+        if self.index is not None:
+            self.index.add(resume_id, signature)
+        elif self._task is not None:
+            self._changes_while_building.append(("add", resume_id, signature))
+
+    def remove(self, resume_id: str):
+        if self.index is not None:
+            self.index.remove(resume_id)
+        elif self._task is not None:
+            self._changes_while_building.append(("remove", resume_id))
+
+
+NEAR_DUP_INDEX = NearDuplicateIndexManager()
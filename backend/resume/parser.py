@@ -1,32 +1,60 @@
-import pdfplumber
-from io import BytesIO
+from typing import Iterator, Optional
 
-def extract_text_from_pdf(file_obj):
+
+def iter_pdf_pages(file_obj, max_pages: Optional[int] = None, max_chars: Optional[int] = None) -> Iterator[str]:
     """
-    Extract text from PDF file object using pdfplumber.
+    Yield the text of each PDF page in order, one page at a time.
+    
+    Only the first ``max_pages`` pages are loaded, and iteration stops once
+    ``max_chars`` characters have been yielded (the last page is truncated).
+    Each page's cached layout objects are released as soon as its text is
+    taken, and the document is closed when the generator finishes or is
+    closed early.
     
     Args:
         file_obj: BytesIO object or file path
-        
-    Returns:
-        str: Extracted text from all pages
+        max_pages: Page budget (None reads every page)
+        max_chars: Character budget (None is unlimited)
         
     Raises:
         Exception: If PDF cannot be opened or read
     """
-    text = ""
-    
+    pages = list(range(1, max_pages + 1)) if max_pages else None
+    remaining = max_chars
     try:
-        with pdfplumber.open(file_obj) as pdf:
-            if not pdf.pages:
-                return ""
-                
+        # Imported on first use (extraction workers), not when the API starts
+        import pdfplumber
+
+        with pdfplumber.open(file_obj, pages=pages) as pdf:
             for page in pdf.pages:
-                page_text = page.extract_text()
+                try:
+                    page_text = page.extract_text() or ""
+                finally:
+                    page.close()
+                if remaining is not None:
+                    page_text = page_text[:remaining]
+                    remaining -= len(page_text)
                 if page_text:
-                    text += page_text + " "
-                    
-        return text.strip()
-        
+                    yield page_text
+                if remaining is not None and remaining <= 0:
+                    return
     except Exception as e:
         raise Exception(f"Failed to extract text from PDF: {str(e)}")
+
+
+def extract_text_from_pdf(file_obj, max_pages=None, max_chars=None):
+    """
+    Extract text from PDF file object using pdfplumber.
+    
+    Args:
+        file_obj: BytesIO object or file path
+        max_pages: Stop after this many pages (None reads every page)
+        max_chars: Stop after this many characters (None is unlimited)
+        
+    Returns:
+        str: Extracted text from all pages
+        
+    Raises:
+        Exception: If PDF cannot be opened or read
+    """
+    return " ".join(iter_pdf_pages(file_obj, max_pages, max_chars)).strip()
@@ -1,25 +1,73 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException
-from database.mongo import resume_collection
-from resume.parser import extract_text_from_pdf
-from resume.cleaner import clean_text
-from io import BytesIO
+from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
+from fastapi import APIRouter, UploadFile, File, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from analytics.skill_counters import increment_skills
+from database.mongo import (
+    MONGO_UNAVAILABLE_ERRORS,
+    get_resume_collection,
+    get_skill_counts_collection,
+)
+from matching.tfidf_index import TFIDF_INDEX
+from search.skill_index import SKILL_INDEX
+from resume.extraction import (
+    ExtractionQueueFull,
+    ExtractionTimeout,
+    ExtractionUnavailable,
+    extraction_service,
+)
+from resume.fingerprint import fingerprint_skills
+from resume.ingest import ingest_or_413
+from resume.near_duplicates import JACCARD_THRESHOLD, NEAR_DUP_INDEX
+from resume.upload_cache import UPLOAD_CACHE, find_by_hash
 import traceback
 
 router = APIRouter(prefix="/resume", tags=["Resume"])
 
 
+async def _adjust_skill_counts(skills, amount):
+    """Keep skill_counts in step; a failure here is fixed by the reconcile job."""
+    try:
+        await increment_skills(get_skill_counts_collection(), skills, amount)
+    except Exception as counter_error:
+        print(f"Skill counter update failed: {counter_error}")
+
+
+def _upload_response(filename, entry, cache_hit, near_duplicates=()):
+    return {
+        "message": (
+            "Resume already uploaded; returning stored copy"
+            if cache_hit else "Resume uploaded and parsed successfully"
+        ),
+        "filename": filename,
+        "resume_id": entry["resume_id"],
+        "resume_text": entry["resume_text"],
+        "text_length": len(entry["resume_text"]),
+        "cleaned_length": len(entry["cleaned_text"]),
+        "cache_hit": cache_hit,
+        "near_duplicates": [
+            {"resume_id": resume_id, "similarity": similarity}
+            for resume_id, similarity in near_duplicates
+        ],
+    }
+
+
 @router.post("/upload")
 async def upload_resume(file: UploadFile = File(...)):
     """
     Upload and process a PDF resume.
     
     - Validates PDF file format
-    - Extracts text using pdfplumber
-    - Cleans text (lowercase, remove stopwords)
-    - Stores both raw and cleaned text in MongoDB
+    - Returns the stored copy when the same file bytes were uploaded before
+    - Streams page text from pdfplumber in the extraction process pool,
+      within the configured page/character budgets
+    - Cleans text (lowercase, remove stopwords) and computes a
+      skill/experience fingerprint page by page
+    - Lists stored near-duplicates (MinHash/LSH over the cleaned text)
+    - Stores raw text, cleaned text, fingerprint, content hash and MinHash in MongoDB
     
     Returns:
-        Success message with processing details
+        Success message with processing details and whether it was a cache hit
     """
     # Validate file type
     if not file.filename.lower().endswith(".pdf"):
@@ -28,25 +76,52 @@ async def upload_resume(file: UploadFile = File(...)):
             detail="Only PDF files are allowed. Please upload a .pdf file."
         )
 
+    # Stream the upload into a size-capped spool, hashing as it goes
+    upload = await ingest_or_413(file)
+
     try:
-        # Read file bytes
-        file_bytes = await file.read()
-        
-        if not file_bytes:
+        if not upload.size:
             raise HTTPException(
                 status_code=400,
                 detail="Empty file received. Please upload a valid PDF."
             )
 
-        # Extract text using parser
+        resume_collection = get_resume_collection()
+        if resume_collection is None:
+            raise HTTPException(
+                status_code=503,
+                detail="MongoDB is not available. Please start MongoDB service."
+            )
+
+        # Same bytes uploaded before: skip parsing and storage entirely
+        digest = upload.sha256
         try:
-            raw_text = extract_text_from_pdf(BytesIO(file_bytes))
+            existing = await find_by_hash(resume_collection, digest, UPLOAD_CACHE)
+        except MONGO_UNAVAILABLE_ERRORS as db_error:
+            print(f"Database Error: {db_error}")
+            raise HTTPException(
+                status_code=503,
+                detail="MongoDB is not available. Please start MongoDB service."
+            )
+        if existing is not None:
+            return _upload_response(file.filename, existing, cache_hit=True)
+
+        # Extract, clean and fingerprint page by page in the parser process pool
+        try:
+            processed = await extraction_service.process_resume_pdf(upload.source)
+        except ExtractionQueueFull as busy:
+            raise HTTPException(status_code=429, detail=str(busy))
+        except ExtractionTimeout as timeout:
+            raise HTTPException(status_code=504, detail=str(timeout))
+        except ExtractionUnavailable as unavailable:
+            raise HTTPException(status_code=503, detail=str(unavailable))
         except Exception as parse_error:
             print(f"PDF Parsing Error: {parse_error}")
             raise HTTPException(
                 status_code=400,
                 detail=f"Failed to parse PDF: {str(parse_error)}"
             )
+        raw_text = processed["resume_text"]
 
         # Validate extracted text
         if not raw_text or not raw_text.strip():
@@ -55,40 +130,42 @@ async def upload_resume(file: UploadFile = File(...)):
                 detail="No text could be extracted from the PDF. The file may be scanned or empty."
             )
 
-        # Clean the extracted text
-        cleaned_text = clean_text(raw_text)
-        
+        cleaned_text = processed["cleaned_text"]
         if not cleaned_text:
             # If cleaning removes everything, at least keep raw text
             cleaned_text = raw_text.lower()
 
+        # Skills, experience and keyword hits computed once, read by analytics/matching
+        fingerprint = processed["fingerprint"]
+
+        # Previously stored resumes with nearly the same content (MinHash/LSH)
+        signature = processed["minhash"]
+        near_duplicates = NEAR_DUP_INDEX.query(signature)
+
         # Store in MongoDB
         try:
-            if resume_collection is None:
-                raise HTTPException(
-                    status_code=503,
-                    detail="MongoDB is not available. Please start MongoDB service."
-                )
-                
-            result = resume_collection.insert_one({
+            result = await resume_collection.insert_one({
                 "filename": file.filename,
+                "content_hash": digest,
                 "resume_text": raw_text,
                 "cleaned_text": cleaned_text,
                 "text_length": len(raw_text),
-                "cleaned_length": len(cleaned_text)
+                "cleaned_length": len(cleaned_text),
+                "fingerprint": fingerprint,
+                "minhash": signature,
             })
-            
-            return {
-                "message": "Resume uploaded and parsed successfully",
-                "filename": file.filename,
-                "resume_id": str(result.inserted_id),
-                "resume_text": raw_text,
-                "text_length": len(raw_text),
-                "cleaned_length": len(cleaned_text)
-            }
-            
-        except HTTPException:
-            raise
+        except DuplicateKeyError:
+            # A concurrent upload of the same file stored it first
+            existing = await find_by_hash(resume_collection, digest, UPLOAD_CACHE)
+            if existing is None:
+                raise
+            return _upload_response(file.filename, existing, cache_hit=True)
+        except MONGO_UNAVAILABLE_ERRORS as db_error:
+            print(f"Database Error: {db_error}")
+            raise HTTPException(
+                status_code=503,
+                detail="MongoDB is not available. Please start MongoDB service."
+            )
         except Exception as db_error:
             error_msg = f"Database Error: {type(db_error).__name__}: {str(db_error)}"
             print(error_msg)
@@ -98,6 +175,19 @@ async def upload_resume(file: UploadFile = File(...)):
                 detail=f"Failed to store resume in database: {str(db_error)}"
             )
 
+        await _adjust_skill_counts(fingerprint["skills"], 1)
+        TFIDF_INDEX.add(str(result.inserted_id), cleaned_text)
+        SKILL_INDEX.add(str(result.inserted_id), fingerprint["skills"], fingerprint["experience_years"])
+        NEAR_DUP_INDEX.add(str(result.inserted_id), signature)
+
+        entry = {
+            "resume_id": str(result.inserted_id),
+            "resume_text": raw_text,
+            "cleaned_text": cleaned_text,
+        }
+        UPLOAD_CACHE.put(digest, entry)
+        return _upload_response(file.filename, entry, cache_hit=False, near_duplicates=near_duplicates)
+
     except HTTPException:
         # Re-raise HTTP exceptions as-is
         raise
@@ -110,3 +200,64 @@ async def upload_resume(file: UploadFile = File(...)):
             status_code=500,
             detail=f"Resume processing failed: {str(e)}"
         )
+
+    finally:
+        upload.close()
+
+
+@router.get("/upload/cache-stats")
+async def upload_cache_stats():
+    """Hit rate of the content-hash upload dedup (memory LRU and MongoDB)."""
+    return UPLOAD_CACHE.stats()
+
+
+@router.get("/duplicates")
+async def near_duplicate_report(threshold: float = Query(JACCARD_THRESHOLD, gt=0, le=1)):
+    """Clusters of stored resumes whose estimated Jaccard similarity is >= threshold."""
+    index = NEAR_DUP_INDEX.index
+    if index is None:
+        raise HTTPException(status_code=503, detail="Near-duplicate index is not ready yet")
+    # Uploads and deletes mutate the live index on the loop: cluster a frozen copy
+    snapshot = index.snapshot()
+    clusters = await run_in_threadpool(snapshot.clusters, threshold)
+    return {
+        "threshold": threshold,
+        "indexed": len(snapshot.signatures),
+        "total_clusters": len(clusters),
+        "duplicate_resumes": sum(len(cluster["resume_ids"]) for cluster in clusters),
+        "clusters": clusters,
+    }
+
+
+@router.delete("/{resume_id}")
+async def delete_resume(resume_id: str):
+    """Delete a stored resume and decrement its skill counters."""
+    resume_collection = get_resume_collection()
+    if resume_collection is None:
+        raise HTTPException(
+            status_code=503,
+            detail="MongoDB is not available. Please start MongoDB service."
+        )
+    if not ObjectId.is_valid(resume_id):
+        raise HTTPException(status_code=400, detail="Invalid resume id")
+
+    try:
+        deleted = await resume_collection.find_one_and_delete(
+            {"_id": ObjectId(resume_id)},
+            projection={"fingerprint": 1, "resume_text": 1, "cleaned_text": 1, "content_hash": 1},
+        )
+    except MONGO_UNAVAILABLE_ERRORS:
+        raise HTTPException(
+            status_code=503,
+            detail="MongoDB is not available. Please start MongoDB service."
+        )
+    if deleted is None:
+        raise HTTPException(status_code=404, detail="Resume not found")
+
+    UPLOAD_CACHE.discard(deleted.get("content_hash"))
+    TFIDF_INDEX.remove(resume_id)
+    SKILL_INDEX.remove(resume_id)
+    NEAR_DUP_INDEX.remove(resume_id)
+    # Legacy documents are re-parsed here: keep that off the event loop
+    await _adjust_skill_counts(await run_in_threadpool(fingerprint_skills, deleted), -1)
+    return {"message": "Resume deleted", "resume_id": resume_id}
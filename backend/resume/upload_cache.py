@@ -0,0 +1,99 @@
+"""
+Content-addressed upload dedup.
+
+Uploads are keyed by the SHA-256 of their bytes, computed while they are
+spooled (``SpooledUpload.sha256``, see resume.ingest). The resumes
+collection holds the hash under a unique index; a small in-process LRU sits
+in front of it so repeat uploads of a hot file skip both parsing and the
+Mongo lookup.
+"""
+import os
+from collections import OrderedDict
+from typing import Dict, Optional
+
+# Fields kept per cached upload; enough to answer a repeat upload without parsing
+CACHED_FIELDS = ("resume_text", "cleaned_text")
+
+
+class UploadCache:
+    """LRU of content hash -> stored resume, with hit/miss counters."""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self.memory_hits = 0
+        self.store_hits = 0
+        self.misses = 0
+
+    def get(self, digest: str) -> Optional[Dict]:
+        entry = self._entries.get(digest)
+        if entry is not None:
+            self._entries.move_to_end(digest)
+        return entry
+
+    def put(self, digest: str, entry: Dict):
+        if self.maxsize <= 0:
+            return
+        self._entries[digest] = entry
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def discard(self, digest: Optional[str]):
+        if digest:
+            self._entries.pop(digest, None)
+
+    def record(self, source: Optional[str]):
+        """Count a lookup answered from ``"memory"``, ``"store"`` or neither (None)."""
+        if source == "memory":
+            self.memory_hits += 1
+        elif source == "store":
+            self.store_hits += 1
+        else:
+            self.misses += 1
+
+    def stats(self) -> Dict:
+        hits = self.memory_hits + self.store_hits
+        lookups = hits + self.misses
+        return {
+            "lookups": lookups,
+            "hits": hits,
+            "memory_hits": self.memory_hits,
+            "store_hits": self.store_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+
+def cache_entry(doc: Dict) -> Dict:
+    """Build a cache entry from a stored resume document."""
+    entry = {"resume_id": str(doc["_id"])}
+    for field in CACHED_FIELDS:
+        entry[field] = doc.get(field) or ""
+    return entry
+
+
+async def find_by_hash(collection, digest: str, cache: "UploadCache") -> Optional[Dict]:
+    """Look up an upload in the LRU, then in Mongo, recording the outcome."""
+    entry = cache.get(digest)
+    if entry is not None:
+        cache.record("memory")
+        return entry
+
+    doc = await collection.find_one(
+        {"content_hash": digest},
+        projection={field: 1 for field in CACHED_FIELDS},
+    )
+    if doc is None:
+        cache.record(None)
+        return None
+
+    entry = cache_entry(doc)
+    cache.put(digest, entry)
+    cache.record("store")
+    return entry
+
+
+UPLOAD_CACHE = UploadCache(maxsize=int(os.getenv("UPLOAD_CACHE_SIZE") or 256))
@@ -0,0 +1,2 @@
+# Candidate Search Module
+# Boolean skill queries over an in-memory inverted index of stored resumes
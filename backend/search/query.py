@@ -0,0 +1,128 @@
+"""
+Boolean candidate query parser.
+
+Grammar (keywords are case-insensitive):
+
+    query    := or_expr ("," or_expr)*          commas are a low-precedence AND
+    or_expr  := and_expr ("OR" and_expr)*
+    and_expr := not_expr ("AND" not_expr)*
+    not_expr := "NOT" not_expr | atom
+    atom     := "(" or_expr ")" | phrase
+    phrase   := a skill ("spring boot", "c++", an alias such as "js")
+              | an experience clause ("3+ years", "2-5 yrs", "at least 4 years")
+
+e.g. ``python AND (django OR flask) AND NOT php, 3+ years``
+
+Parsing yields a small tuple AST:
+    ("skill", name) | ("years", min, max) | ("and", a, b) | ("or", a, b) | ("not", a)
+"""
+import re
+from typing import List, Optional, Tuple
+
+from matching.skill_matcher import SKILL_MATCHER
+from matching.skills import ALIAS_MAP
+
+_TOKEN_RE = re.compile(r"\(|\)|,|[^\s(),]+")
+_KEYWORDS = {"and", "or", "not"}
+_YEARS_RE = re.compile(
+    r"^(?:(?P<plus>\d+)\s*\+|at\s+least\s+(?P<least>\d+)|(?P<low>\d+)\s*-\s*(?P<high>\d+)|(?P<exact>\d+))"
+    r"\s*(?:years?|yrs?)(?:\s+(?:of\s+)?experience)?$"
+)
+
+
+class QuerySyntaxError(ValueError):
+    """Raised for malformed queries or unknown skills."""
+
+
+def canonical_skill(phrase: str) -> Optional[str]:
+    """Map a query phrase to a TECH_SKILLS entry, via ALIAS_MAP if needed."""
+    phrase = " ".join(phrase.lower().split())
+    phrase = ALIAS_MAP.get(phrase, phrase)
+    return phrase if phrase in SKILL_MATCHER.index else None
+
+
+def _years_clause(phrase: str) -> Optional[Tuple]:
+    match = _YEARS_RE.match(phrase)
+    if not match:
+        return None
+    if match["plus"] or match["least"]:
+        return ("years", int(match["plus"] or match["least"]), None)
+    if match["exact"]:
+        return ("years", int(match["exact"]), None)
+    low, high = int(match["low"]), int(match["high"])
+    if low > high:
+        raise QuerySyntaxError(f"Invalid experience range: {phrase}")
+    return ("years", low, high)
+
+
+class _Parser:
+    def __init__(self, tokens: List[str]):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self) -> Optional[str]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def accept(self, keyword: str) -> bool:
+        token = self.peek()
+        if token is not None and token.lower() == keyword:
+            self.pos += 1
+            return True
+        return False
+
+    def query(self):
+        node = self.or_expr()
+        while self.accept(","):
+            node = ("and", node, self.or_expr())
+        if self.peek() is not None:
+            raise QuerySyntaxError(f"Unexpected '{self.peek()}'")
+        return node
+
+    def or_expr(self):
+        node = self.and_expr()
+        while self.accept("or"):
+            node = ("or", node, self.and_expr())
+        return node
+
+    def and_expr(self):
+        node = self.not_expr()
+        while self.accept("and"):
+            node = ("and", node, self.not_expr())
+        return node
+
+    def not_expr(self):
+        if self.accept("not"):
+            return ("not", self.not_expr())
+        return self.atom()
+
+    def atom(self):
+        if self.accept("("):
+            node = self.or_expr()
+            if not self.accept(")"):
+                raise QuerySyntaxError("Missing ')'")
+            return node
+
+        words = []
+        while self.peek() is not None and self.peek() not in ("(", ")", ",") and self.peek().lower() not in _KEYWORDS:
+            words.append(self.tokens[self.pos])
+            self.pos += 1
+        if not words:
+            found = self.peek()
+            raise QuerySyntaxError(f"Expected a skill before '{found}'" if found else "Query ended unexpectedly")
+
+        phrase = " ".join(words).lower()
+        years = _years_clause(phrase)
+        if years is not None:
+            return years
+        skill = canonical_skill(phrase)
+        if skill is None:
+            raise QuerySyntaxError(f"Unknown skill: {' '.join(words)}")
+        return ("skill", skill)
+
+
+def parse_query(query: str):
+    """Parse a candidate query into its AST. Raises QuerySyntaxError."""
+    tokens = _TOKEN_RE.findall(query or "")
+    if not tokens:
+        raise QuerySyntaxError("Query is empty")
+    return _Parser(tokens).query()
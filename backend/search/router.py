@@ -0,0 +1,51 @@
+from bson import ObjectId
+from fastapi import APIRouter, HTTPException, Query
+from database.mongo import MONGO_UNAVAILABLE_ERRORS, get_resume_collection
+from .query import QuerySyntaxError, parse_query
+from .schemas import CandidateSearchResponse
+from .skill_index import SKILL_INDEX
+
+router = APIRouter(prefix="/search", tags=["Candidate Search"])
+
+
+@router.get("/candidates", response_model=CandidateSearchResponse)
+async def search_candidates(
+    q: str = Query(..., description='e.g. "python AND (django OR flask) AND NOT php, 3+ years"'),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+):
+    """Boolean skill/experience search over all stored resumes."""
+    try:
+        node = parse_query(q)
+    except QuerySyntaxError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    index = SKILL_INDEX.index
+    if index is None:
+        raise HTTPException(status_code=503, detail="Candidate index is not ready yet")
+
+    total, docs = index.search(node, offset=(page - 1) * page_size, limit=page_size)
+    results = [
+        {
+            "resume_id": index.ids[doc],
+            "experience_years": index.experience_of(doc),
+            "skills": index.skills_of(doc),
+        }
+        for doc in docs
+    ]
+
+    # Filenames for the page only
+    collection = get_resume_collection()
+    if collection is not None and results:
+        object_ids = [ObjectId(r["resume_id"]) for r in results if ObjectId.is_valid(r["resume_id"])]
+        try:
+            filenames = {
+                str(doc["_id"]): doc.get("filename")
+                async for doc in collection.find({"_id": {"$in": object_ids}}, {"filename": 1})
+            }
+        except MONGO_UNAVAILABLE_ERRORS:
+            filenames = {}
+        for result in results:
+            result["filename"] = filenames.get(result["resume_id"])
+
+    return {"query": q, "total": total, "page": page, "page_size": page_size, "results": results}
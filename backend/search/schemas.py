@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+class CandidateResult(BaseModel):
+    resume_id: str
+    filename: Optional[str] = None
+    experience_years: int
+    skills: List[str]
+
+class CandidateSearchResponse(BaseModel):
+    query: str
+    total: int
+    page: int
+    page_size: int
+    results: List[CandidateResult]
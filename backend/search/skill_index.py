@@ -0,0 +1,188 @@
+"""
+In-memory inverted skill index over stored resumes.
+
+Every resume gets a dense document number. Each TECH_SKILLS entry maps to a
+bitmap of document numbers (a Python int, so AND/OR/NOT run as C-level
+big-integer operations). Experience years are kept as a compact uint16
+column. Deleted resumes are cleared from the ``alive`` bitmap rather than
+from every posting.
+
+The index is built from the stored fingerprints at startup and updated on
+upload and delete. Startup only reads: resumes whose fingerprint is
+missing or stale are left out (and counted in the log) until the one-off
+``python -m resume.backfill`` job has fingerprinted them, so restarting
+every replica at once never parses or writes the corpus.
+"""
+import asyncio
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from matching.skill_matcher import SKILL_MATCHER
+from resume.fingerprint import CURRENT_FINGERPRINT_FILTER, STALE_FINGERPRINT_FILTER, fingerprint_matrix
+
+
+def _bitmap_from_mask(mask: np.ndarray) -> int:
+    return int.from_bytes(np.packbits(mask, bitorder="little").tobytes(), "little")
+
+
+def _mask_from_bitmap(bitmap: int, size: int) -> np.ndarray:
+    packed = np.frombuffer(bitmap.to_bytes((size + 7) // 8, "little"), dtype=np.uint8)
+    return np.unpackbits(packed, bitorder="little")[:size].astype(bool)
+
+
+class SkillIndex:
+    """Skill -> resume bitmap postings plus an experience-years column."""
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self._docs: Dict[str, int] = {}
+        self._postings: List[int] = [0] * len(SKILL_MATCHER.skills)
+        self._experience = array("H")
+        self.alive = 0
+
+    @classmethod
+    def from_rows(cls, ids: List[str], bitsets: List[bytes], experience: Iterable[int]) -> "SkillIndex":
+        """Bulk-build from fingerprint skill bitsets, one column pack per skill."""
+        index = cls()
+        index.ids = list(ids)
+        index._docs = {resume_id: doc for doc, resume_id in enumerate(index.ids)}
+        index._experience = array("H", (min(int(years or 0), 65535) for years in experience))
+        matrix = fingerprint_matrix(bitsets)
+        index._postings = [_bitmap_from_mask(matrix[:, s]) for s in range(matrix.shape[1])]
+        index.alive = (1 << len(index.ids)) - 1
+        return index
+
+    @property
+    def size(self) -> int:
+        return self.alive.bit_count()
+
+    def add(self, resume_id: str, skills: Iterable[str], experience_years: int = 0):
+        """Index a resume (re-adding an id replaces its previous entry)."""
+        self.remove(resume_id)
+        doc = len(self.ids)
+        bit = 1 << doc
+        self.ids.append(resume_id)
+        self._docs[resume_id] = doc
+        self._experience.append(min(int(experience_years or 0), 65535))
+        for skill in skills:
+            position = SKILL_MATCHER.index.get(skill)
+            if position is not None:
+                self._postings[position] |= bit
+        self.alive |= bit
+
+    def remove(self, resume_id: str):
+        doc = self._docs.pop(resume_id, None)
+        if doc is not None:
+            self.alive &= ~(1 << doc)
+
+    def skills_of(self, doc: int) -> List[str]:
+        bit = 1 << doc
+        return [skill for skill, posting in zip(SKILL_MATCHER.skills, self._postings) if posting & bit]
+
+    def experience_of(self, doc: int) -> int:
+        return self._experience[doc]
+
+    def _years_bitmap(self, low: int, high: Optional[int]) -> int:
+        years = np.frombuffer(self._experience, dtype=np.uint16) if self.ids else np.zeros(0, np.uint16)
+        mask = years >= low
+        if high is not None:
+            mask &= years <= high
+        return _bitmap_from_mask(mask)
+
+    def evaluate(self, node) -> int:
+        """Evaluate a search.query AST to a bitmap of live documents."""
+        kind = node[0]
+        if kind == "skill":
+            return self._postings[SKILL_MATCHER.index[node[1]]] & self.alive
+        if kind == "years":
+            return self._years_bitmap(node[1], node[2]) & self.alive
+        if kind == "and":
+            return self.evaluate(node[1]) & self.evaluate(node[2])
+        if kind == "or":
+            return self.evaluate(node[1]) | self.evaluate(node[2])
+        if kind == "not":
+            return self.alive & ~self.evaluate(node[1])
+        raise ValueError(f"Unknown query node: {kind}")
+
+    def search(self, node, offset: int = 0, limit: int = 20) -> Tuple[int, List[int]]:
+        """Return (total matches, one page of document numbers).
+
+        Pages are ordered by experience (most first), newest resume first on ties.
+        """
+        bitmap = self.evaluate(node)
+        if not bitmap:
+            return 0, []
+        docs = np.flatnonzero(_mask_from_bitmap(bitmap, len(self.ids)))
+        years = np.frombuffer(self._experience, dtype=np.uint16)[docs]
+        order = np.lexsort((-docs, -years.astype(np.int32)))
+        return len(docs), docs[order][offset:offset + limit].tolist()
+
+
+async def build_skill_index(collection) -> SkillIndex:
+    """Build a SkillIndex from current stored fingerprints (stale ones are skipped)."""
+    stale = await collection.count_documents(STALE_FINGERPRINT_FILTER)
+    if stale:
+        print(f"⚠️  {stale} resumes lack a current fingerprint and are not searchable; run: python -m resume.backfill")
+
+    ids, bitsets, experience = [], [], []
+    projection = {"fingerprint.skills_bitset": 1, "fingerprint.experience_years": 1}
+    async for doc in collection.find(CURRENT_FINGERPRINT_FILTER, projection).sort("_id", 1):
+        ids.append(str(doc["_id"]))
+        bitsets.append(doc["fingerprint"]["skills_bitset"])
+        experience.append(doc["fingerprint"].get("experience_years", 0))
+    return SkillIndex.from_rows(ids, bitsets, experience)
+
+
+class SkillIndexManager:
+    """Holds the live SkillIndex; built in the background at startup."""
+
+    def __init__(self):
+        self.index: Optional[SkillIndex] = None
+        self._task: Optional[asyncio.Task] = None
+        self._changes_while_building: List[Tuple] = []
+
+    async def start(self, collection):
+        if collection is not None and self._task is None:
+            self._task = asyncio.create_task(self._build(collection))
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _build(self, collection):
+        try:
+            index = await build_skill_index(collection)
+        except Exception as e:
+            print(f"⚠️  Could not build candidate skill index: {e}")
+            return
+        # Uploads and deletes that raced with the build scan
+        for change in self._changes_while_building:
+            if change[0] == "add":
+                index.add(*change[1:])
+            else:
+                index.remove(change[1])
+        self._changes_while_building = []
+        self.index = index
+        print(f"✅ Candidate skill index built ({index.size} resumes)")
+
+    def add(self, resume_id: str, skills: Iterable[str], experience_years: int = 0):
+        if self.index is not None:
+            self.index.add(resume_id, skills, experience_years)
+        elif self._task is not None:
+            self._changes_while_building.append(("add", resume_id, list(skills), experience_years))
+
+    def remove(self, resume_id: str):
+        if self.index is not None:
+            self.index.remove(resume_id)
+        elif self._task is not None:
+            self._changes_while_building.append(("remove", resume_id))
+
+
+SKILL_INDEX = SkillIndexManager()
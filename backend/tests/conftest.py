@@ -0,0 +1,77 @@
+import os
+import sys
+
+import pytest
+
+# Tests import modules the same way main.py does (from the backend directory)
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+class _AsyncCursor:
+    def __init__(self, cursor):
+        self._cursor = iter(cursor)
+
+    def sort(self, *args, **kwargs):
+        self._cursor = iter(sorted(self._cursor, key=lambda doc: doc["_id"]))
+        return self
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._cursor)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class _BulkResult:
+    def __init__(self, modified_count):
+        self.modified_count = modified_count
+
+
+class AsyncMockCollection:
+    """The slice of the Motor collection API the backend uses, over mongomock."""
+
+    def __init__(self, collection):
+        self._collection = collection
+
+    def __getattr__(self, name):
+        return getattr(self._collection, name)
+
+    def find(self, *args, batch_size=None, **kwargs):
+        return _AsyncCursor(self._collection.find(*args, **kwargs))
+
+    def aggregate(self, pipeline):
+        return _AsyncCursor(self._collection.aggregate(pipeline))
+
+    async def count_documents(self, *args, **kwargs):
+        return self._collection.count_documents(*args, **kwargs)
+
+    async def update_one(self, *args, **kwargs):
+        return self._collection.update_one(*args, **kwargs)
+
+    async def delete_one(self, *args, **kwargs):
+        return self._collection.delete_one(*args, **kwargs)
+
+    async def find_one(self, *args, **kwargs):
+        return self._collection.find_one(*args, **kwargs)
+
+    async def create_index(self, *args, **kwargs):
+        return self._collection.create_index(*args, **kwargs)
+
+    async def bulk_write(self, operations, ordered=True):
+        # UpdateOne only; mongomock's bulk_write does not accept current pymongo operations
+        modified = 0
+        for op in operations:
+            modified += self._collection.update_one(op._filter, op._doc, upsert=op._upsert).modified_count
+        return _BulkResult(modified)
+
+
+@pytest.fixture
+def mongo_db():
+    """An in-memory database whose collections behave like Motor's."""
+    mongomock = pytest.importorskip("mongomock")
+    database = mongomock.MongoClient().db
+    return lambda name: AsyncMockCollection(database[name])
@@ -0,0 +1,60 @@
+from collections import Counter
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from matching import analysis_context
+from matching.ats_engine import calculate_ats_score
+from matching.enhanced_router import router
+from matching.jd_matcher import calculate_match_percentage
+from matching.skill_matcher import SKILL_MATCHER
+
+RESUME = "Python developer, 6 years of experience with Django, JS, Docker and Docker Compose on AWS."
+JD = "Need Python and React engineers; 5+ years experience. Docker, Kubernetes and AWS a plus."
+
+
+def _legacy(resume, jd):
+    """The endpoint's previous triple computation."""
+    resume_skills = SKILL_MATCHER.count(resume)
+    jd_skills = SKILL_MATCHER.find(jd)
+    return {
+        "match_percentage": calculate_match_percentage(resume, jd)["match_percentage"],
+        "ats_score": calculate_ats_score(resume, jd)["ats_score"],
+        "matched_skills": [s for s in resume_skills if s in jd_skills],
+        "missing_skills": sorted(jd_skills - set(resume_skills)),
+        "resume_skills": resume_skills,
+    }
+
+
+def test_context_matches_standalone_functions():
+    context = analysis_context.AnalysisContext(RESUME, JD)
+    assert context.ats_result == calculate_ats_score(RESUME, JD)
+    assert calculate_match_percentage(RESUME, JD, context=context) == calculate_match_percentage(RESUME, JD)
+    assert (context.resume.experience_years, context.jd.experience_years) == (6, 5)
+    assert context.jd.raw_skills == SKILL_MATCHER.find(JD)
+
+
+def test_jd_match_runs_each_stage_once(monkeypatch):
+    calls = Counter()
+
+    def counted(name, fn):
+        def wrapper(*args, **kwargs):
+            calls[name] += 1
+            return fn(*args, **kwargs)
+        return wrapper
+
+    monkeypatch.setattr(analysis_context, "_preprocess", counted("preprocess", analysis_context._preprocess))
+    monkeypatch.setattr(analysis_context, "_experience_from_lowered",
+                        counted("experience", analysis_context._experience_from_lowered))
+    monkeypatch.setattr(SKILL_MATCHER, "find", counted("find", SKILL_MATCHER.find))
+    monkeypatch.setattr(SKILL_MATCHER, "count", counted("count", SKILL_MATCHER.count))
+
+    app = FastAPI()
+    app.include_router(router)
+    response = TestClient(app).post("/matching/jd-match", json={"resume_text": RESUME, "job_description": JD})
+    assert response.status_code == 200
+    # One preprocessing pass, ATS scan, raw count and experience parse per text
+    assert calls == {"preprocess": 2, "find": 2, "count": 2, "experience": 2}
+
+    monkeypatch.undo()
+    assert response.json() == _legacy(RESUME, JD)
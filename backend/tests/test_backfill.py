@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from analytics.skill_counters import (
+    META_ID,
+    CountersBusy,
+    counters_lease,
+    read_skill_counts,
+    reconcile_skill_counts,
+)
+from resume.backfill import backfill_fingerprints
+from resume.fingerprint import compute_fingerprint, skills_to_bitset
+
+RESUME = "Python and Docker engineer, 4 years of experience."
+
+
+def test_backfill_reconciles_counters_for_legacy_documents(mongo_db):
+    resumes, counts = mongo_db("resumes"), mongo_db("skill_counts")
+    current = compute_fingerprint("React and Python developer")
+    resumes.insert_many([
+        {"_id": 1, "resume_text": RESUME},  # legacy, never fingerprinted
+        {"_id": 2, "resume_text": RESUME, "fingerprint": {"version": 1, "skills_bitset": skills_to_bitset(["java"])}},
+        {"_id": 3, "resume_text": "React and Python developer", "fingerprint": current},
+    ])
+    # Seeded by an older extractor: the legacy resume was counted under "java", not its re-parsed skills
+    counts.insert_many([
+        {"_id": META_ID},
+        {"_id": "java", "count": 2},
+        {"_id": "python", "count": 1},
+        {"_id": "react", "count": 1},
+    ])
+
+    assert asyncio.run(backfill_fingerprints(resumes, counts_collection=counts)) == 2
+    totals = asyncio.run(read_skill_counts(counts))
+    assert {skill: n for skill, n in totals.items() if n} == {"python": 3, "docker": 2, "react": 1}
+
+
+def test_reconciles_are_idempotent_and_exclusive(mongo_db):
+    resumes, counts = mongo_db("resumes"), mongo_db("skill_counts")
+    resumes.insert_one({"_id": 1, "fingerprint": compute_fingerprint(RESUME)})
+    counts.insert_one({"_id": "python", "count": 5})
+
+    async def run():
+        async with counters_lease(counts):
+            # A second recount has to wait for the lease
+            with pytest.raises(CountersBusy):
+                async with counters_lease(counts, wait_seconds=0):
+                    pass
+            await reconcile_skill_counts(counts, resumes, ["python", "docker"])
+            await reconcile_skill_counts(counts, resumes, ["python", "docker"])
+        async with counters_lease(counts, wait_seconds=0):
+            pass  # released
+        return await read_skill_counts(counts)
+
+    totals = asyncio.run(run())
+    assert (totals["python"], totals["docker"]) == (1, 1)
@@ -0,0 +1,61 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from matching.ats_engine import calculate_ats_score
+from matching.batch_scoring import batch_ats_scores, batch_match_percentages
+from matching.jd_matcher import calculate_match_percentage
+from matching.router import router
+from matching.schemas import MAX_BATCH_IDS, MAX_BATCH_TEXTS
+
+JD = "Need 3+ years experience with Python, FastAPI, Docker and AWS."
+RESUMES = [
+    "Python developer, 5 years experience. FastAPI, Docker, AWS, React.",
+    "Java and Spring Boot engineer.",
+    "Python and Docker",
+    "",
+]
+
+
+def test_many_resumes_one_jd_matches_single_scoring():
+    results = batch_ats_scores(RESUMES, [JD])
+    assert [r["index"] for r in results] == [0, 2, 1, 3]
+    for result in results:
+        expected = calculate_ats_score(RESUMES[result["index"]], JD)
+        assert {k: v for k, v in result.items() if k != "index"} == expected
+
+
+def test_one_resume_many_jds_with_top_k():
+    jds = ["Python", "Rust and Go", "Python, Docker, Kubernetes"]
+    results = batch_match_percentages([RESUMES[0]], jds, top_k=2)
+    assert [r["index"] for r in results] == [0, 2]
+    assert results[1] == {"index": 2, **calculate_match_percentage(RESUMES[0], jds[2])}
+
+
+def test_batch_endpoints():
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    response = client.post("/ats/score/batch", json={"resume_texts": RESUMES, "job_description": JD, "top_k": 1})
+    assert response.status_code == 200
+    assert response.json()["total"] == 4
+    assert response.json()["results"][0]["ats_score"] == 100
+
+    response = client.post("/ats/match/batch", json={"resume_text": RESUMES[0], "job_descriptions": [JD]})
+    assert response.status_code == 200
+    assert response.json()["results"][0]["experience_match"]["meets_requirement"] is True
+
+    response = client.post("/ats/score/batch", json={"resume_texts": RESUMES, "job_descriptions": [JD]})
+    assert response.status_code == 400
+
+
+def test_batch_endpoints_reject_oversized_batches():
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+    too_many = {"resume_texts": ["python"] * (MAX_BATCH_TEXTS + 1), "job_description": JD}
+    assert client.post("/ats/score/batch", json=too_many).status_code == 422
+    too_many = {"resume_text": "python", "job_descriptions": [JD] * (MAX_BATCH_TEXTS + 1)}
+    assert client.post("/ats/match/batch", json=too_many).status_code == 422
+    too_many = {"resume_ids": ["0" * 24] * (MAX_BATCH_IDS + 1), "job_description": JD}
+    assert client.post("/ats/match/batch", json=too_many).status_code == 422
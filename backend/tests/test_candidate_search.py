@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from matching.skill_matcher import SKILL_MATCHER
+from resume import backfill
+from resume.fingerprint import compute_fingerprint, skills_to_bitset
+from search.query import QuerySyntaxError, parse_query
+from search.router import router
+from search.skill_index import SKILL_INDEX, SkillIndex, build_skill_index
+
+RESUMES = [
+    ("r1", ["python", "django"], 5),
+    ("r2", ["python", "flask", "php"], 4),
+    ("r3", ["python", "flask"], 2),
+    ("r4", ["java", "spring boot"], 8),
+    ("r5", ["python", "flask"], 6),
+]
+
+
+def _index():
+    ids, skills, years = zip(*RESUMES)
+    return SkillIndex.from_rows(list(ids), [skills_to_bitset(s) for s in skills], years)
+
+
+def _ids(index, query, **page):
+    total, docs = index.search(parse_query(query), **page)
+    return total, [index.ids[doc] for doc in docs]
+
+
+def test_parser_precedence_aliases_and_experience():
+    assert parse_query("python OR java AND NOT php") == (
+        "or", ("skill", "python"), ("and", ("skill", "java"), ("not", ("skill", "php")))
+    )
+    assert parse_query("JS, 2-5 yrs") == ("and", ("skill", "javascript"), ("years", 2, 5))
+    assert parse_query("(spring boot)") == ("skill", "spring boot")
+    for bad in ("", "python AND", "(python", "cobol wizardry", "python )"):
+        with pytest.raises(QuerySyntaxError):
+            parse_query(bad)
+
+
+def test_boolean_query_with_experience_orders_by_years():
+    index = _index()
+    assert _ids(index, "python AND (django OR flask) AND NOT php, 3+ years") == (2, ["r5", "r1"])
+    assert _ids(index, "NOT python") == (1, ["r4"])
+    assert _ids(index, "python", offset=1, limit=2) == (4, ["r1", "r2"])
+
+
+def test_incremental_updates_match_bulk_build():
+    bulk = _index()
+    incremental = SkillIndex()
+    for resume_id, skills, years in RESUMES:
+        incremental.add(resume_id, skills, years)
+    for query in ("python AND flask", "NOT flask, 5+ years", "php OR spring boot"):
+        assert _ids(bulk, query) == _ids(incremental, query)
+
+    incremental.remove("r5")
+    incremental.add("r3", ["python", "django"], 7)
+    assert _ids(incremental, "django") == (2, ["r3", "r1"])
+    assert incremental.size == 4
+
+
+def test_candidates_endpoint_paginates(monkeypatch):
+    monkeypatch.setattr(SKILL_INDEX, "index", _index())
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    response = client.get("/search/candidates", params={"q": "python, 3+ years", "page": 2, "page_size": 2})
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["total"], body["page"]) == (3, 2)
+    skills = [s for s in SKILL_MATCHER.skills if s in ("python", "flask", "php")]
+    assert body["results"] == [{"resume_id": "r2", "filename": None, "experience_years": 4, "skills": skills}]
+
+    assert client.get("/search/candidates", params={"q": "python AND"}).status_code == 400
+
+
+def test_startup_build_only_reads_current_fingerprints(mongo_db, monkeypatch):
+    resumes = mongo_db("resumes")
+    resumes.insert_many([
+        {"_id": "a", "fingerprint": compute_fingerprint("Java and Spring Boot, 8 years of experience")},
+        {"_id": "b", "resume_text": "Python and Flask, 3 years of experience"},
+    ])
+    monkeypatch.setattr(resumes, "bulk_write", None)  # startup never writes
+    index = asyncio.run(build_skill_index(resumes))
+    assert index.size == 1 and _ids(index, "java") == (1, ["a"])
+    assert "fingerprint" not in asyncio.run(resumes.find_one({"_id": "b"}))
+
+    # The one-off backfill makes the legacy resume searchable from the next build
+    monkeypatch.undo()
+    asyncio.run(backfill.backfill_fingerprints(resumes))
+    assert _ids(asyncio.run(build_skill_index(resumes)), "python, 3+ years") == (1, ["b"])
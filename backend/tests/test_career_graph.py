@@ -0,0 +1,49 @@
+from insights import analyzer
+from insights.analyzer import match_job_roles, suggest_career_paths
+from insights.career_graph import CareerGraph
+
+PATHS = {
+    "Developer": [("Senior Developer", ["design", "testing"]), ("Team Lead", ["leadership", "hiring", "budgets", "planning"])],
+    "Senior Developer": [("Team Lead", ["leadership"]), ("Architect", ["architecture", "design"])],
+    "Architect": [("CTO", ["strategy", "leadership"])],
+}
+
+
+def test_precomputes_cheapest_multi_hop_progressions():
+    graph = CareerGraph(PATHS, tracks={"Junior Python Developer": "Developer"})
+    assert graph.top_progressions("Developer", k=10) == [
+        (2, 1, "Senior Developer", (), ("design", "testing")),
+        # Two hops (3 skills) beat the direct edge (4 skills)
+        (3, 2, "Team Lead", ("Senior Developer",), ("design", "testing", "leadership")),
+        (4, 2, "Architect", ("Senior Developer",), ("design", "testing", "architecture")),
+        (6, 3, "CTO", ("Senior Developer", "Architect"), ("design", "testing", "architecture", "strategy", "leadership")),
+    ]
+    # Track edges are free and never suggested as a move
+    assert graph.top_progressions("Junior Python Developer", k=2) == graph.top_progressions("Developer", k=2)
+    assert graph.top_progressions("Unknown Role") == []
+
+
+def test_current_role_is_not_suggested():
+    graph = CareerGraph({"Backend": [("Senior Backend", ["a"]), ("DevOps", ["b"])]}, tracks={"Senior Backend": "Backend"})
+    assert [p[2] for p in graph.top_progressions("Senior Backend")] == ["DevOps"]
+
+
+def test_suggestions_reuse_the_given_role_match(monkeypatch):
+    resume = "Python, FastAPI, Django, PostgreSQL and Docker backend work, 3 years."
+    role_match = match_job_roles(resume)
+    assert role_match[0][0]["title"] == "Mid-Level Backend Developer"
+
+    def unexpected(*args, **kwargs):
+        raise AssertionError("role match recomputed")
+
+    monkeypatch.setattr(analyzer, "match_job_roles", unexpected)
+    trajectory, paths, plan = suggest_career_paths(resume, role_match=role_match)
+    assert trajectory == "Mid-Level Backend Developer"
+    assert [path["next_role"] for path in paths] == ["Senior Backend Developer", "DevOps Engineer", "Technical Lead"]
+    assert paths[0]["experience_needed"] == "5-7 years" and paths[0]["via"] == []
+    assert plan[0] == "Develop system design capability"
+
+
+def test_roles_without_a_track_get_the_generic_path():
+    _, paths, _ = suggest_career_paths("resume", role_match=([{"title": "Full Stack Developer"}], "junior", 0.5))
+    assert [path["next_role"] for path in paths] == ["Senior Full Stack Developer"]
@@ -0,0 +1,154 @@
+import asyncio
+import os
+import time
+from io import BytesIO
+
+import pytest
+
+from resume.cleaner import clean_text
+from resume import extraction
+from resume.extraction import (
+    ExtractionQueueFull,
+    ExtractionService,
+    ExtractionTimeout,
+    ExtractionUnavailable,
+    process_resume_pdf,
+)
+from resume.fingerprint import compute_fingerprint
+from resume.parser import extract_text_from_pdf, iter_pdf_pages
+
+
+def _sleep(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def _crash():
+    os._exit(1)
+
+
+def _service(**overrides):
+    options = {"workers": 1, "max_pending": 2, "timeout": 10, "max_pages": 5}
+    options.update(overrides)
+    return ExtractionService(**options)
+
+
+def test_extracts_document_in_pool():
+    service = _service()
+    try:
+        text = asyncio.run(service.extract_document(b"Python and Docker", "jd.txt"))
+        assert text == "Python and Docker"
+        with pytest.raises(ValueError):
+            asyncio.run(service.extract_document(b"data", "jd.xls"))
+    finally:
+        service.shutdown()
+    assert service.pending == 0
+
+
+def test_refuses_jobs_beyond_max_pending():
+    service = _service(max_pending=1)
+
+    async def run():
+        first = asyncio.create_task(service.submit(_sleep, 0.5))
+        await asyncio.sleep(0)
+        with pytest.raises(ExtractionQueueFull):
+            await service.submit(_sleep, 0)
+        return await first
+
+    try:
+        assert asyncio.run(run()) == 0.5
+    finally:
+        service.shutdown()
+
+
+def test_replaces_pool_after_a_worker_dies():
+    service = _service()
+
+    async def run():
+        with pytest.raises(ExtractionUnavailable):
+            await service.submit(_crash)
+        return await service.submit(_sleep, 0)
+
+    try:
+        assert asyncio.run(run()) == 0
+    finally:
+        service.shutdown()
+    assert service.pending == 0
+
+
+def test_default_workers_follow_cgroup_quota(monkeypatch):
+    monkeypatch.setattr(extraction, "_cgroup_cpu_limit", lambda: 0.5)
+    assert extraction._default_workers() == 1
+    monkeypatch.setattr(extraction, "_cgroup_cpu_limit", lambda: None)
+    assert 1 <= extraction._default_workers() <= 4
+
+
+def test_times_out_and_releases_slot_when_job_finishes():
+    service = _service(max_pending=1, timeout=0.2)
+
+    async def run():
+        with pytest.raises(ExtractionTimeout):
+            await service.submit(_sleep, 1)
+        # The worker is still busy with the timed-out job
+        assert service.pending == 1
+        deadline = time.monotonic() + 30
+        while service.pending and time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
+        assert service.pending == 0
+        return await service.submit(_sleep, 0)
+
+    try:
+        assert asyncio.run(run()) == 0
+    finally:
+        service.shutdown()
+
+
+def _pdf(pages):
+    """Tiny multi-page text PDF; ``pages`` is a list of line lists."""
+    objects = {1: b"<< /Type /Catalog /Pages 2 0 R >>", 3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"}
+    kids = []
+    for i, lines in enumerate(pages):
+        page_id, content_id = 4 + 2 * i, 5 + 2 * i
+        kids.append(f"{page_id} 0 R")
+        stream = ("BT /F1 11 Tf 50 780 Td 14 TL " + " ".join(f"({line}) Tj T*" for line in lines) + " ET").encode()
+        objects[page_id] = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {content_id} 0 R "
+            "/Resources << /Font << /F1 3 0 R >> >> >>"
+        ).encode()
+        objects[content_id] = b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+    objects[2] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(pages)} >>".encode()
+
+    pdf, offsets = b"%PDF-1.4\n", {}
+    for number in sorted(objects):
+        offsets[number] = len(pdf)
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, objects[number])
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offsets[n] for n in sorted(objects))
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return pdf
+
+
+PAGES = [
+    ["Senior Python developer", "5 years of experience with Django"],
+    ["Skills: Docker, Kubernetes, AWS"],
+    ["Hobbies: chess"],
+]
+
+
+def test_page_stream_respects_page_and_char_budgets():
+    pdf = _pdf(PAGES)
+    assert list(iter_pdf_pages(BytesIO(pdf))) == ["\n".join(lines) for lines in PAGES]
+    assert len(list(iter_pdf_pages(BytesIO(pdf), max_pages=2))) == 2
+    assert "".join(iter_pdf_pages(BytesIO(pdf), max_chars=30)) == "Senior Python developer\n5 year"
+    assert extract_text_from_pdf(BytesIO(pdf), max_pages=1) == "\n".join(PAGES[0])
+
+
+def test_streamed_processing_matches_whole_text():
+    pdf = _pdf(PAGES)
+    processed = process_resume_pdf(BytesIO(pdf))
+    raw_text = extract_text_from_pdf(BytesIO(pdf))
+    assert processed["resume_text"] == raw_text
+    assert processed["cleaned_text"] == clean_text(raw_text)
+    assert processed["fingerprint"] == compute_fingerprint(raw_text)
+    assert processed["fingerprint"]["experience_years"] == 5
@@ -0,0 +1,73 @@
+import asyncio
+import threading
+
+from analytics import services
+from matching.batch_scoring import batch_match_percentages, stored_match_percentages
+from matching.skill_matcher import SKILL_MATCHER
+from resume import fingerprint as fingerprint_module
+from resume.fingerprint import (
+    bitset_to_skills,
+    compute_fingerprint,
+    get_fingerprint,
+    load_fingerprints,
+    skill_counts,
+    skills_to_bitset,
+)
+
+RESUME = "Senior engineer, 6 years of experience with Python, Docker, Kubernetes and AWS. Mentoring."
+
+
+def test_bitset_round_trip():
+    skills = ["python", "selenium", "c++", "spring boot"]
+    bitset = skills_to_bitset(skills)
+    assert len(bitset) == (len(SKILL_MATCHER.skills) + 7) // 8
+    assert sorted(bitset_to_skills(bitset)) == sorted(skills)
+
+
+def test_compute_fingerprint():
+    fingerprint = compute_fingerprint(RESUME)
+    assert bitset_to_skills(fingerprint["skills_bitset"]) == ["python", "aws", "docker", "kubernetes"]
+    assert fingerprint["skill_count"] == 4
+    assert fingerprint["experience_years"] == 6
+    assert fingerprint["keyword_hits"]["soft_skills"] == ["mentoring"]
+
+
+def test_legacy_document_is_fingerprinted_on_read():
+    fingerprint = get_fingerprint({"resume_text": RESUME})
+    assert fingerprint == compute_fingerprint(RESUME)
+
+
+def test_skill_counts_from_bitsets():
+    bitsets = [skills_to_bitset(["python", "aws"]), skills_to_bitset(["python"]), skills_to_bitset([])]
+    counts = skill_counts(bitsets)
+    assert counts["python"] == 2
+    assert counts["aws"] == 1
+    assert sum(counts.values()) == 3
+
+
+def test_stored_matching_equals_text_matching():
+    resumes = [RESUME, "Java developer", "Python and React, 1 year experience"]
+    jd = "5+ years experience: Python, AWS, React"
+    fingerprints = [compute_fingerprint(text) for text in resumes]
+    assert stored_match_percentages(fingerprints, jd) == batch_match_percentages(resumes, [jd])
+
+
+def test_stale_documents_are_parsed_off_the_event_loop(mongo_db, monkeypatch):
+    resumes = mongo_db("resumes")
+    resumes.insert_many([
+        {"_id": 1, "fingerprint": compute_fingerprint("Java developer")},
+        {"_id": 2, "resume_text": RESUME},
+    ])
+    monkeypatch.setattr(services, "get_resume_collection", lambda: resumes)
+    parsed_on = []
+
+    def tracking_compute(text):
+        parsed_on.append(threading.current_thread())
+        return compute_fingerprint(text)
+
+    monkeypatch.setattr(fingerprint_module, "compute_fingerprint", tracking_compute)
+    counts = asyncio.run(services.compute_top_skills())
+    assert (counts["java"], counts["python"], counts["aws"]) == (1, 1, 1)
+    fingerprints = asyncio.run(load_fingerprints(resumes, [1, 2]))
+    assert fingerprints[2] == compute_fingerprint(RESUME)
+    assert len(parsed_on) == 2 and threading.main_thread() not in parsed_on
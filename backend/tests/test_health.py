@@ -0,0 +1,27 @@
+import time
+
+from fastapi.testclient import TestClient
+
+from main import app
+
+
+def test_probes_report_liveness_and_readiness_separately():
+    client = TestClient(app)
+    # Without the lifespan the app is alive but not ready
+    assert client.get("/health/live").json() == {"status": "alive"}
+    assert client.get("/health/ready").status_code == 503
+
+    start = time.perf_counter()
+    with TestClient(app) as client:
+        # Startup does not wait on MongoDB (none is running here)
+        assert time.perf_counter() - start < 3
+        response = client.get("/health/ready")
+        assert response.status_code == 200
+        assert response.json()["status"] == "ready"
+        assert response.json()["mongo"] in ("up", "unavailable")
+        # CPU-only scoring is served regardless of MongoDB
+        score = client.post("/ats/score", json={
+            "resume_text": "Python developer with FastAPI and Docker",
+            "job_description": "Looking for a Python developer who knows Docker",
+        })
+        assert score.status_code == 200
@@ -0,0 +1,83 @@
+import random
+import re
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from ai_enhancements import generator
+from ai_enhancements.generator import (
+    ACTION_VERBS,
+    METRICS_KEYWORDS,
+    QUANTIFIERS,
+    WEAK_VERBS,
+    analyze_resume_for_improvements,
+    scan_lines,
+)
+from ai_enhancements.router import router
+from matching.analysis_context import TextAnalysis
+
+
+def _reference_suggestions(resume_text):
+    """The previous two loops (one search per verb/keyword and line), with their crashes fixed."""
+    lines = resume_text.split("\n")
+    weak, quantification = [], []
+    for i, line in enumerate(lines):
+        for weak_verb in WEAK_VERBS:
+            if re.search(r"\b" + weak_verb + r"\b", line.lower()):
+                category = next((k for k, v in ACTION_VERBS.items() if weak_verb in [a.lower() for a in v]), "development")
+                weak.append((i + 1, "action_verb", f"{ACTION_VERBS[category][0]} [specific action]"))
+    for i, line in enumerate(lines):
+        if any(metric in line.lower() for metric in METRICS_KEYWORDS):
+            if not (any(c.isdigit() for c in line) or any(quant in line for quant in QUANTIFIERS)):
+                quantification.append((i + 1, "quantification", line.strip() + " by [specific metric/percentage]"))
+    return weak + quantification, min((len(weak) + len(quantification)) * 10, 100)
+
+
+def _summary(suggestions):
+    return [
+        (s["line_number"], s["suggestions"][0]["improvement_type"], s["suggestions"][0]["suggested"])
+        for s in suggestions
+        if s["section"] == "experience"
+    ]
+
+
+def test_weak_verbs_no_longer_fail_and_map_to_their_category():
+    suggestions, potential, _, _ = analyze_resume_for_improvements("Managed the team\nWorked on the API, was on call")
+    assert [s["suggestions"][0]["suggested"] for s in suggestions] == [
+        "Led [specific action]", "Engineered [specific action]", "Engineered [specific action]",
+    ]
+    assert [s["line_number"] for s in suggestions] == [1, 2, 2]
+    assert potential == 50
+
+    app = FastAPI()
+    app.include_router(router)
+    response = TestClient(app).post("/ai/resume-improvements", json={"resume_text": "I helped ship the app"})
+    assert response.status_code == 200
+
+
+def test_matches_reference_scan_including_the_cutoff():
+    rng = random.Random(3)
+    vocabulary = ["built", "the", "service", "improved", "Reduced", "latency", "40%", "3x", "worked", "Was",
+                  "managed", "helped", "workedout", "costs", "MILLION", "saved", "team"]
+    for _ in range(200):
+        text = "\n".join(" ".join(rng.choices(vocabulary, k=rng.randint(0, 8))) for _ in range(rng.randint(1, 30)))
+        expected, expected_potential = _reference_suggestions(text)
+        suggestions, potential, _, _ = analyze_resume_for_improvements(text)
+        assert _summary(suggestions) == expected[:10]
+        assert potential == max(50, expected_potential)
+
+
+def test_scan_stops_at_the_cutoff():
+    lines = ["handled incidents"] * 5000
+    findings, weak_verb_count, _ = scan_lines(TextAnalysis("\n".join(lines)), limit=10)
+    assert (len(findings), weak_verb_count) == (10, 10)
+
+    # A line is finished even past the cutoff, since its verbs are reordered
+    lines = ["was handled, was made"] * 5000
+    findings, weak_verb_count, _ = scan_lines(TextAnalysis("\n".join(lines)), limit=10)
+    assert (len(findings), weak_verb_count, findings[3]["weak_verbs"]) == (4, 12, ["handled", "was", "made"])
+
+    lines = ["improved uptime"] * 5000 + ["was on call"] * 3
+    findings, weak_verb_count, unquantified = scan_lines(TextAnalysis("\n".join(lines)), limit=10)
+    assert (unquantified, weak_verb_count, len(findings)) == (7, 3, 10)
+    assert generator.WEAK_VERB_CATEGORY["managed"] == "leadership"
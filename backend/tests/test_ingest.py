@@ -0,0 +1,65 @@
+import asyncio
+import hashlib
+import os
+from io import BytesIO
+
+import pytest
+from fastapi import FastAPI, File, UploadFile
+from fastapi.testclient import TestClient
+
+from resume.ingest import (
+    SpooledUpload,
+    UploadLimitMiddleware,
+    UploadTooLarge,
+    ingest_upload,
+    open_source,
+)
+
+
+def _ingest(data, **kwargs):
+    upload = UploadFile(file=BytesIO(data), filename="resume.pdf")
+    return asyncio.run(ingest_upload(upload, **kwargs))
+
+
+def test_small_upload_stays_in_memory_with_hash():
+    data = b"%PDF small"
+    with _ingest(data) as upload:
+        assert upload.path is None
+        assert upload.size == len(data)
+        assert upload.sha256 == hashlib.sha256(data).hexdigest()
+        assert open_source(upload.source).read() == data
+
+
+def test_large_upload_spools_to_disk_and_is_removed_on_close():
+    data = os.urandom(200 * 1024)
+    with SpooledUpload("resume.pdf", spool_bytes=1024) as spool:
+        for start in range(0, len(data), 4096):
+            spool.write(data[start:start + 4096])
+        spool.finish()
+        assert spool.path.endswith(".pdf")
+        with open(spool.source, "rb") as handle:
+            assert handle.read() == data
+        assert spool.sha256 == hashlib.sha256(data).hexdigest()
+        path = spool.path
+    assert not os.path.exists(path)
+
+
+def test_oversize_upload_is_rejected():
+    with pytest.raises(UploadTooLarge):
+        _ingest(b"x" * 2048, max_bytes=1024)
+
+
+def test_middleware_rejects_oversize_multipart_body():
+    app = FastAPI()
+    app.add_middleware(UploadLimitMiddleware, max_bytes=4096)
+
+    @app.post("/upload")
+    async def upload(file: UploadFile = File(...)):
+        return {"size": len(await file.read())}
+
+    client = TestClient(app)
+    small = client.post("/upload", files={"file": ("a.pdf", b"x" * 100)})
+    assert small.status_code == 200 and small.json() == {"size": 100}
+
+    large = client.post("/upload", files={"file": ("a.pdf", b"x" * 10000)})
+    assert large.status_code == 413
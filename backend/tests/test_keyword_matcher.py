@@ -0,0 +1,38 @@
+from insights.analyzer import (
+    KEYWORD_MATCHER,
+    KeywordMatcher,
+    analyze_keyword_gaps,
+    extract_keywords_by_category,
+)
+from matching.analysis_context import TextAnalysis
+
+
+def test_counts_are_word_bounded_and_literal():
+    counts = KEYWORD_MATCHER.count("C++ and c++17? No: C, JavaScript, Go, Google, Git, GitHub. Python, python!")
+    assert counts["languages"] == {"python": 2, "javascript": 1, "go": 1, "c++": 1}
+    assert counts["tools"] == {"git": 1, "github": 1}
+    assert counts["cloud"] == {} and set(counts) == set(KEYWORD_MATCHER.categories)
+
+
+def test_keyword_may_sit_in_several_categories():
+    matcher = KeywordMatcher({"a": ["react", "ui"], "b": ["ui", "frontend"]})
+    assert matcher.count("React UI, ui kit; guide") == {"a": {"react": 1, "ui": 2}, "b": {"ui": 2}}
+
+
+def test_extract_keywords_keeps_declared_order():
+    found = extract_keywords_by_category("Leadership, Redis then Docker and PostgreSQL; mentoring")
+    assert found["databases"] == ["postgresql", "redis"]
+    assert found["soft_skills"] == ["leadership", "mentoring"]
+
+
+def test_keyword_gaps_count_cpp_and_skip_substrings():
+    jd = "C++ and C++ again, Rust, good communication. Ongoing work in Java."
+    missing, _, _, _ = analyze_keyword_gaps("Rust developer", jd)
+    frequencies = {gap["keyword"]: gap["frequency_in_jd"] for gap in missing}
+    # "go" inside "good"/"ongoing" is not a Go requirement
+    assert frequencies == {"c++": 2, "java": 1, "communication": 1}
+
+
+def test_role_keywords_are_word_bounded():
+    assert not {"ml", "ai"} & TextAnalysis("Maintained HTML pages").role_keywords
+    assert {"ml", "ai"} <= TextAnalysis("ML and AI research").role_keywords
@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from bson import ObjectId
+
+from analytics.services import MATCH_BUCKETS, match_distribution_pipeline
+
+
+def test_pipeline_filters_on_indexed_fields_only():
+    jd_id = str(ObjectId())
+    start = datetime(2026, 1, 1)
+    match, project, bucket = match_distribution_pipeline(jd_id=jd_id, start_date=start)
+
+    assert set(match["$match"]) == {"match_percentage", "jd_id", "created_at"}
+    assert match["$match"]["jd_id"] == ObjectId(jd_id)
+    assert match["$match"]["created_at"] == {"$gte": start}
+    assert project == {"$project": {"_id": 0, "match_percentage": 1}}
+    assert bucket["$bucket"]["boundaries"] == MATCH_BUCKETS
+
+
+def test_pipeline_without_filters():
+    match = match_distribution_pipeline()[0]["$match"]
+    assert match == {"match_percentage": {"$gte": 0, "$lt": 101}}
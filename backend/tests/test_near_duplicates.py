@@ -0,0 +1,111 @@
+import asyncio
+import random
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from resume import near_duplicates
+from resume.near_duplicates import (
+    NEAR_DUP_INDEX,
+    LSHIndex,
+    build_lsh_index,
+    estimated_jaccard,
+    minhash_signature,
+    shingle_hashes,
+)
+from resume.router import router
+
+_rng = random.Random(7)
+VOCABULARY = [f"term{i}" for i in range(2000)]
+BASE = " ".join(_rng.choice(VOCABULARY) for _ in range(400))
+EDITED = BASE.replace(BASE.split()[200], "changed", 1) + " updated phone number"
+OTHER = " ".join(_rng.choice(VOCABULARY) for _ in range(400))
+
+
+def _true_jaccard(left, right):
+    a, b = set(shingle_hashes(left).tolist()), set(shingle_hashes(right).tolist())
+    return len(a & b) / len(a | b)
+
+
+def test_signature_estimates_jaccard():
+    base, edited, other = (minhash_signature(t) for t in (BASE, EDITED, OTHER))
+    assert len(base) == 512
+    assert minhash_signature(BASE) == base  # stable across calls (and processes)
+    assert abs(estimated_jaccard(base, edited) - _true_jaccard(BASE, EDITED)) < 0.1
+    assert estimated_jaccard(base, other) < 0.1
+    assert minhash_signature("") is None
+    assert minhash_signature("two words") is not None
+
+
+def test_lsh_query_threshold_and_remove():
+    index = LSHIndex()
+    index.add("base", minhash_signature(BASE))
+    index.add("other", minhash_signature(OTHER))
+    index.add("empty", None)
+
+    matches = index.query(minhash_signature(EDITED))
+    assert [resume_id for resume_id, _ in matches] == ["base"]
+    assert matches[0][1] >= 0.8
+    assert index.query(minhash_signature(EDITED), threshold=1.0) == []
+    assert index.query(minhash_signature(BASE), exclude="base") == []
+
+    index.remove("base")
+    assert index.query(minhash_signature(EDITED)) == []
+    assert set(index.signatures) == {"other"}
+
+
+def test_snapshot_is_unaffected_by_later_changes():
+    index = LSHIndex()
+    index.add("a", minhash_signature(BASE))
+    index.add("b", minhash_signature(EDITED))
+    snapshot = index.snapshot()
+    index.remove("b")
+    index.add("d", minhash_signature(OTHER))
+    assert sorted(snapshot.signatures) == ["a", "b"]
+    assert [cluster["resume_ids"] for cluster in snapshot.clusters()] == [["a", "b"]]
+    assert index.clusters() == []
+
+
+def test_clusters_group_transitive_duplicates():
+    index = LSHIndex()
+    for resume_id, text in (("a", BASE), ("b", EDITED), ("c", BASE), ("d", OTHER)):
+        index.add(resume_id, minhash_signature(text))
+    clusters = index.clusters()
+    assert [cluster["resume_ids"] for cluster in clusters] == [["a", "b", "c"]]
+    assert clusters[0]["max_similarity"] == 1.0
+
+
+def test_build_stores_legacy_signatures(mongo_db, monkeypatch):
+    resumes = mongo_db("resumes")
+    resumes.insert_many([
+        {"_id": "a", "cleaned_text": BASE, "minhash": minhash_signature(BASE)},
+        {"_id": "b", "cleaned_text": EDITED},
+        {"_id": "c", "cleaned_text": OTHER},
+    ])
+    index = asyncio.run(build_lsh_index(resumes, batch_size=1))
+    assert [pair[0] for pair in index.query(minhash_signature(BASE))] == ["a", "b"]
+    stored = asyncio.run(resumes.find_one({"_id": "c"}))["minhash"]
+    assert bytes(stored) == minhash_signature(OTHER)
+
+    # A restart reads the stored signatures instead of hashing again
+    monkeypatch.setattr(near_duplicates, "minhash_signature", None)
+    assert len(asyncio.run(build_lsh_index(resumes)).signatures) == 3
+
+
+def test_duplicates_report_endpoint(monkeypatch):
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    monkeypatch.setattr(NEAR_DUP_INDEX, "index", None)
+    assert client.get("/resume/duplicates").status_code == 503
+
+    index = LSHIndex()
+    index.add("a", minhash_signature(BASE))
+    index.add("b", minhash_signature(EDITED))
+    index.add("d", minhash_signature(OTHER))
+    monkeypatch.setattr(NEAR_DUP_INDEX, "index", index)
+    body = client.get("/resume/duplicates").json()
+    assert (body["indexed"], body["total_clusters"], body["duplicate_resumes"]) == (3, 1, 2)
+    assert body["clusters"][0]["resume_ids"] == ["a", "b"]
+    assert client.get("/resume/duplicates", params={"threshold": 1.0}).json()["clusters"] == []
@@ -0,0 +1,97 @@
+from collections import Counter
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from ai_enhancements.generator import analyze_resume_for_improvements, generate_interview_prep
+from insights import analyzer
+from insights.analyzer import analyze_keyword_gaps, match_job_roles, suggest_career_paths
+from matching import analysis_context
+from matching.jd_matcher import calculate_match_percentage
+from report import builder
+from report.router import router
+
+RESUME = (
+    "Jane Doe\n"
+    "Backend engineer with 6 years of experience in Python, Django and PostgreSQL.\n"
+    "Built REST APIs on AWS with Docker, cutting latency by 40%.\n"
+    "Led a team of 4 engineers using agile practices."
+)
+JD = "Senior engineer: Python, Kubernetes, AWS, machine learning. 5+ years experience, leadership and communication."
+FULL = {
+    "resume_text": RESUME,
+    "job_description": JD,
+    "company_name": "Acme",
+    "position_title": "Senior Engineer",
+}
+
+
+def _client():
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+def test_sections_match_standalone_analyzers():
+    body = _client().post("/report", json=FULL).json()
+
+    assert body["errors"] == {}
+    assert body["ats_match"]["match_percentage"] == calculate_match_percentage(RESUME, JD)["match_percentage"]
+    missing, gap_score, critical, _ = analyze_keyword_gaps(RESUME, JD)
+    assert [gap["keyword"] for gap in body["keyword_gaps"]["missing_keywords"]] == [m["keyword"] for m in missing[:15]]
+    assert (body["keyword_gaps"]["total_gap_score"], body["keyword_gaps"]["critical_gaps"]) == (gap_score, critical)
+    roles, level, _ = match_job_roles(RESUME)
+    assert [role["title"] for role in body["job_roles"]["top_roles"]] == [role["title"] for role in roles]
+    assert body["job_roles"]["current_level"] == level
+    assert body["career_paths"]["current_trajectory"] == suggest_career_paths(RESUME)[0]
+    assert body["resume_improvements"]["overall_score"] == analyze_resume_for_improvements(RESUME, JD)[1]
+    assert body["interview_prep"]["key_talking_points"] == generate_interview_prep(RESUME, JD)[1]
+    assert "Acme" in body["cover_letter"]["cover_letter"]
+
+
+def test_field_mask_and_required_inputs():
+    client = _client()
+    body = client.post("/report", json={"resume_text": RESUME, "sections": ["job_roles"]}).json()
+    assert body["job_roles"] and body["ats_match"] is None and body["cover_letter"] is None
+
+    # Without a JD, JD-dependent sections are skipped by default...
+    body = client.post("/report", json={"resume_text": RESUME}).json()
+    assert body["ats_match"] is None and body["keyword_gaps"] is None and body["career_paths"]
+    # ...and rejected when asked for
+    response = client.post("/report", json={"resume_text": RESUME, "sections": ["cover_letter"]})
+    assert response.status_code == 400 and "company_name" in response.json()["detail"]
+    assert client.post("/report", json={"resume_text": ""}).status_code == 400
+    assert client.post("/report", json={"resume_text": RESUME, "sections": ["nope"]}).status_code == 422
+
+
+def test_failed_section_is_reported_without_losing_the_rest(monkeypatch):
+    def boom(request, context):
+        raise RuntimeError("role catalogue unavailable")
+
+    monkeypatch.setitem(builder.SECTIONS, "job_roles", (boom, (), "Error matching job roles"))
+    body = _client().post("/report", json=FULL).json()
+    assert body["errors"] == {"job_roles": "Error matching job roles: role catalogue unavailable"}
+    assert body["job_roles"] is None and body["career_paths"]
+
+
+def test_text_is_scanned_once_per_report(monkeypatch):
+    calls = Counter()
+
+    def counted(module, name):
+        fn = getattr(module, name)
+
+        def wrapper(*args, **kwargs):
+            calls[name] += 1
+            return fn(*args, **kwargs)
+
+        monkeypatch.setattr(module, name, wrapper)
+
+    counted(analyzer.KEYWORD_MATCHER, "count")
+    counted(analyzer, "year_mentions_in_lowered")
+    counted(analysis_context, "_preprocess")
+    counted(analyzer, "match_job_roles")
+    counted(builder, "match_job_roles")
+    _client().post("/report", json=FULL)
+    # Once for the resume and once for the JD, however many sections read them;
+    # job_roles and career_paths share one role match
+    assert calls == {"count": 2, "year_mentions_in_lowered": 1, "_preprocess": 2, "match_job_roles": 1}
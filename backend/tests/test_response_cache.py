@@ -0,0 +1,116 @@
+import asyncio
+
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from cache import response_cache
+from cache.response_cache import LRUTTLCache, ResponseCache, ResponseCacheMiddleware, cache_key
+
+
+class InMemoryRedis:
+    """Stand-in for redis.asyncio.Redis (get/set/aclose)."""
+
+    def __init__(self, fail=False):
+        self.data = {}
+        self.fail = fail
+
+    async def get(self, name):
+        if self.fail:
+            raise ConnectionError("redis down")
+        return self.data.get(name)
+
+    async def set(self, name, value, ex=None):
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.data[name] = value
+
+    async def aclose(self):
+        pass
+
+
+def _client(cache):
+    calls = []
+    app = FastAPI()
+
+    @app.post("/score")
+    async def score(payload: dict):
+        calls.append(payload)
+        if payload.get("fail"):
+            raise HTTPException(status_code=400, detail="bad")
+        return {"score": len(payload.get("text", ""))}
+
+    app.add_middleware(ResponseCacheMiddleware, cache=cache, paths={"/score"})
+    return TestClient(app), calls
+
+
+def test_key_ignores_formatting_and_key_order_but_not_version():
+    assert cache_key("/a", b'{"x": 1, "y": [1, 2]}') == cache_key("/a", b'{"y":[1,2],"x":1}')
+    assert cache_key("/a", b'{"x": 1}') != cache_key("/b", b'{"x": 1}')
+    assert cache_key("/a", b'{"x": 1}', version="v1") != cache_key("/a", b'{"x": 1}', version="v2")
+    assert cache_key("/a", b"not json") is None
+
+
+def test_engine_version_follows_the_role_catalog_file(tmp_path, monkeypatch):
+    catalog = tmp_path / "roles.json"
+    catalog.write_text('{"A": {}}')
+    monkeypatch.setenv("ROLE_CATALOG_PATH", str(catalog))
+    before = response_cache.engine_version()
+    catalog.write_text('{"B": {}}')
+    assert response_cache.engine_version() != before
+    monkeypatch.delenv("ROLE_CATALOG_PATH")
+    assert response_cache.engine_version() == response_cache.engine_version(data_files=())
+
+
+def test_lru_evicts_by_count_bytes_and_ttl(monkeypatch):
+    lru = LRUTTLCache(max_entries=2, max_bytes=10, ttl=60)
+    lru.put("a", b"1234")
+    lru.put("b", b"1234")
+    lru.get("a")
+    lru.put("c", b"12")
+    assert (lru.get("b"), len(lru)) == (None, 2)  # least recently used
+    lru.put("d", b"123456789")
+    assert list(lru._entries) == ["d"] and lru.bytes == 9
+    lru.put("huge", b"x" * 11)
+    assert lru.get("huge") is None
+
+    now = response_cache.time.monotonic()
+    monkeypatch.setattr(response_cache.time, "monotonic", lambda: now + 61)
+    assert lru.get("d") is None and lru.bytes == 0
+
+
+def test_middleware_serves_hits_and_304s_without_running_the_handler():
+    cache = ResponseCache(LRUTTLCache())
+    client, calls = _client(cache)
+
+    first = client.post("/score", json={"text": "python", "n": 1})
+    assert (first.status_code, first.headers["x-cache"]) == (200, "MISS")
+    second = client.post("/score", content=b'{ "n": 1, "text": "python" }', headers={"content-type": "application/json"})
+    assert (second.headers["x-cache"], second.json()) == ("HIT", {"score": 6})
+    assert second.headers["etag"] == first.headers["etag"]
+    assert len(calls) == 1
+
+    revalidated = client.post("/score", json={"text": "python", "n": 1},
+                              headers={"if-none-match": f'W/"x", {first.headers["etag"]}'})
+    assert (revalidated.status_code, revalidated.content) == (304, b"")
+
+    assert client.post("/score", json={"fail": True}).status_code == 400
+    assert client.post("/score", json={"fail": True}).status_code == 400
+    assert client.post("/score", content=b"{broken", headers={"content-type": "application/json"}).status_code == 422
+    assert len(calls) == 3
+    assert cache.stats()["hits"] == 1 and cache.stats()["not_modified"] == 1
+
+
+def test_shared_tier_is_reused_across_replicas_and_failures_are_misses():
+    shared = InMemoryRedis()
+    client_a, calls_a = _client(ResponseCache(LRUTTLCache(), shared=shared))
+    client_b, calls_b = _client(ResponseCache(LRUTTLCache(), shared=shared))
+    client_a.post("/score", json={"text": "java"})
+    response = client_b.post("/score", json={"text": "java"})
+    assert (response.headers["x-cache"], len(calls_a), len(calls_b)) == ("HIT", 1, 0)
+
+    broken = ResponseCache(LRUTTLCache(), shared=InMemoryRedis(fail=True))
+    client_c, calls_c = _client(broken)
+    assert client_c.post("/score", json={"text": "go"}).json() == {"score": 2}
+    assert client_c.post("/score", json={"text": "go"}).headers["x-cache"] == "HIT"  # local tier still works
+    assert broken.stats()["shared_errors"] == 2
+    asyncio.run(broken.aclose())
@@ -0,0 +1,88 @@
+import json
+import random
+
+import numpy as np
+
+from insights.analyzer import ROLE_PROFILES, match_job_roles
+from insights.role_catalog import RoleCatalog, get_role_catalog
+
+SKILLS = ["python", "java", "sql", "docker", "aws", "react", "go", "kubernetes", "spark", "linux"]
+KEYWORDS = ["backend", "frontend", "data", "cloud", "lead", "ml"]
+
+
+def _legacy_top_roles(profiles, resume_skills, total_experience, keyword_hits, k=5):
+    """The previous per-role loop of match_job_roles."""
+    role_scores = []
+    for role_name, role_profile in profiles.items():
+        profile_skills = [s.lower() for s in role_profile["skills"]]
+        matched_skills = [s for s in resume_skills if s in profile_skills]
+        skill_overlap = len(matched_skills) / len(profile_skills) if profile_skills else 0
+        exp_min, exp_max = role_profile["experience_years"]
+        experience_match = 1.0 if exp_min <= total_experience <= exp_max else 0.5
+        keywords_found = sum(1 for kw in role_profile["keywords"] if kw in keyword_hits)
+        keyword_bonus = min(keywords_found * 0.1, 0.2)
+        match_score = (skill_overlap * 0.6 + experience_match * 0.3 + keyword_bonus * 0.1) * 100
+        role_scores.append({
+            "title": role_name,
+            "match_score": match_score,
+            "required_skills": profile_skills[:8],
+            "your_skills": matched_skills[:8],
+            "skill_overlap": skill_overlap,
+        })
+    role_scores.sort(key=lambda x: x["match_score"], reverse=True)
+    return role_scores[:k]
+
+
+def _random_catalog(rng, size):
+    return {
+        f"Role {i}": {
+            "skills": rng.choices(SKILLS, k=rng.randint(0, 6)),  # may repeat, may be empty
+            "experience_years": sorted(rng.sample(range(12), 2)),
+            "keywords": rng.choices(KEYWORDS, k=rng.randint(0, 3)),
+        }
+        for i in range(size)
+    }
+
+
+def test_batch_scores_match_the_per_role_loop():
+    rng = random.Random(7)
+    profiles = _random_catalog(rng, 300)
+    catalog = RoleCatalog(profiles)
+    resumes = [rng.choices(SKILLS + ["cobol"], k=rng.randint(0, 8)) for _ in range(20)]
+    years = [rng.randint(0, 12) for _ in resumes]
+    hits = [frozenset(rng.sample(KEYWORDS, rng.randint(0, 3))) for _ in resumes]
+
+    batch = catalog.top_roles(resumes, years, hits, k=7)
+    for j, resume in enumerate(resumes):
+        expected = _legacy_top_roles(profiles, resume, years[j], hits[j], k=7)
+        got = [{key: role[key] for key in expected[0]} for role in batch[j]]
+        assert got == expected
+        assert catalog.top_roles([resume], [years[j]], [hits[j]], k=7)[0] == batch[j]
+
+
+def test_top_k_breaks_ties_in_catalog_order():
+    scores = np.array([1.0, 3.0, 3.0, 2.0, 3.0, 0.0])
+    assert list(RoleCatalog.top_k(scores, 2)) == [1, 2]
+    assert list(RoleCatalog.top_k(scores, 4)) == [1, 2, 4, 3]
+    assert list(RoleCatalog.top_k(scores, 10)) == [1, 2, 4, 3, 0, 5]
+
+
+def test_builtin_profiles_and_catalog_file(tmp_path, monkeypatch):
+    roles, _, _ = match_job_roles("Python and FastAPI backend with PostgreSQL and Docker, 3 years.")
+    assert roles[0]["title"] == "Mid-Level Backend Developer"
+    assert roles[0]["experience_match"] == "mid"
+    assert len(get_role_catalog()) == len(ROLE_PROFILES)
+
+    path = tmp_path / "roles.json"
+    path.write_text(json.dumps({
+        "Data Platform Engineer": {"skills": ["python", "spark"], "experience_years": [3, 8], "keywords": ["data"]},
+        "Go Developer": {"skills": ["go"], "experience_years": [0, 3], "keywords": []},
+    }))
+    monkeypatch.setenv("ROLE_CATALOG_PATH", str(path))
+    get_role_catalog.cache_clear()
+    try:
+        roles, _, _ = match_job_roles("Python and Spark data pipelines", ["spark"])
+        assert [role["title"] for role in roles] == ["Data Platform Engineer", "Go Developer"]
+        assert roles[0]["your_skills"] == ["spark", "python"]
+    finally:
+        get_role_catalog.cache_clear()  # rebuilt from ROLE_PROFILES once the env is restored
@@ -0,0 +1,52 @@
+import re
+
+from matching.ats_engine import calculate_ats_score
+from matching.skill_matcher import SKILL_MATCHER, SkillMatcher
+from matching.skills import TECH_SKILLS
+
+
+def _reference_find(text):
+    found = set()
+    for skill in TECH_SKILLS:
+        pattern = r"(?<!\w)" + re.escape(skill).replace(r"\ ", r"\s+") + r"(?!\w)"
+        if re.search(pattern, text, flags=re.IGNORECASE):
+            found.add(skill)
+    return found
+
+
+def test_matches_per_skill_search():
+    text = (
+        "Python/Django dev. JavaScript, TypeScript, node.js and next.js. "
+        "Unit testing + integration testing; GitHub Actions, GitLab  CI, "
+        "Spring\nBoot, scikit-learn, R, Go, C++ and C#. Java 17."
+    )
+    assert SKILL_MATCHER.find(text) == _reference_find(text)
+
+
+def test_word_boundaries():
+    found = SKILL_MATCHER.find("javascript mysql github")
+    assert "java" not in found
+    assert "sql" not in found
+    assert "git" not in found
+    assert {"c++", "c#"} <= SKILL_MATCHER.find("c++, c# and more")
+
+
+def test_overlapping_skills_are_counted():
+    counts = SKILL_MATCHER.count("unit testing and testing via github actions")
+    assert counts["unit testing"] == 1
+    assert counts["testing"] == 2
+    assert counts["github actions"] == 1
+    assert counts["github"] == 1
+
+
+def test_custom_vocabulary():
+    matcher = SkillMatcher(["spring boot", "spring"])
+    assert matcher.find("Spring   Boot") == {"spring boot", "spring"}
+    assert matcher.find("springboot") == set()
+
+
+def test_ats_score_uses_matcher():
+    result = calculate_ats_score("Python, React and Docker", "Need Python, React, AWS")
+    assert result["matched_skills"] == ["python", "react"]
+    assert result["missing_skills"] == ["aws"]
+    assert result["ats_score"] == 67
@@ -0,0 +1,21 @@
+import os
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFERRED_MODULES = ("sklearn", "scipy", "joblib", "nltk", "pdfplumber", "docx", "jose", "passlib", "bcrypt", "httpx")
+
+
+def test_importing_the_app_defers_heavy_libraries():
+    code = f"import sys, main; print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ""
+
+
+def test_deferred_helpers_still_work():
+    from auth.utils import create_access_token, get_pwd_context
+    from resume.cleaner import clean_text
+
+    assert clean_text("Built C++ & Python APIs!") == "built c++ python apis"
+    assert create_access_token({"sub": "a@example.com"}).count(".") == 2
+    assert get_pwd_context() is get_pwd_context()
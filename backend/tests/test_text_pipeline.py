@@ -0,0 +1,35 @@
+import random
+import re
+
+from matching.ats_engine import _normalize_aliases, _preprocess
+from matching.skills import ALIAS_MAP
+from resume.cleaner import clean_text
+
+
+def _legacy_normalize(text):
+    for alias, canonical in ALIAS_MAP.items():
+        pattern = re.compile(r"\b" + re.escape(alias) + r"\b", re.IGNORECASE)
+        text = pattern.sub(canonical, text)
+    return text
+
+
+def test_alias_ordering_semantics():
+    assert _normalize_aliases("node js and nodejs") == "node.javascript and node.javascript"
+    assert _normalize_aliases("js, py, ml") == "javascript, python, machine learning"
+    assert _normalize_aliases("Fast API + C-Sharp, ci-cd") == "fastapi + c#, ci/cd"
+
+
+def test_matches_sequential_substitution():
+    pieces = list(ALIAS_MAP) + ["node", "js", "c", "plus", "sharp", "api", "x", "jsx"]
+    separators = [" ", "  ", ".", "-", ",", "/", "", "\n"]
+    rng = random.Random(7)
+    for _ in range(2000):
+        text = "".join(
+            rng.choice(pieces) + rng.choice(separators) for _ in range(rng.randint(1, 8))
+        )
+        assert _normalize_aliases(text) == _legacy_normalize(text), text
+
+
+def test_preprocess_and_cleaner_share_aliases():
+    assert _preprocess("The Node JS and ML stack") == "node.javascript machine learning stack"
+    assert "javascript" in clean_text("Built services in JS")
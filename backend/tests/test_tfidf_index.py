@@ -0,0 +1,89 @@
+import asyncio
+import os
+
+import numpy as np
+from bson import ObjectId
+from sklearn.metrics.pairwise import cosine_similarity
+
+from matching.tfidf_index import TfidfIndex, TfidfIndexManager
+
+IDS = ["r1", "r2", "r3", "r4"]
+TEXTS = [
+    "python django postgresql rest api developer",
+    "java spring boot microservices kafka",
+    "react javascript css frontend developer",
+    "python machine learning pandas numpy scikit",
+]
+JD = "python django rest api"
+
+
+def test_query_ranks_by_cosine_similarity_with_top_k():
+    index = TfidfIndex.build(IDS, TEXTS)
+    results = index.query(JD, top_k=2)
+    assert [resume_id for resume_id, _ in results] == ["r1", "r4"]
+
+    expected = cosine_similarity(index.vectorizer.transform([JD]), index.matrix).ravel()
+    assert results[0][1] == round(float(expected[0]), 4)
+    assert len(index.query(JD, top_k=10)) == int(np.count_nonzero(expected))
+    assert index.query("golang rust", top_k=3) == []
+
+
+def test_append_and_remove_without_rebuild():
+    index = TfidfIndex.build(IDS, TEXTS)
+    index.add("r5", "senior python django developer rest api")
+    assert index.query(JD, top_k=1)[0][0] == "r5"
+    index.remove("r5")
+    index.remove("r1")
+    assert [resume_id for resume_id, _ in index.query(JD, top_k=5)] == ["r4"]
+    assert index.size == 3
+    assert index.changes == 3
+
+
+def test_removing_a_pending_append_does_not_merge():
+    index = TfidfIndex.build(IDS, TEXTS)
+    matrix = index.matrix
+    index.add("r5", "senior python django developer rest api")
+    index.remove("r5")
+    assert index.matrix is matrix
+    assert index.size == 4
+    assert [resume_id for resume_id, _ in index.query(JD, top_k=5)] == ["r1", "r4"]
+
+
+def test_rebuild_keeps_deletes_made_while_fitting(tmp_path, mongo_db, monkeypatch):
+    resumes = mongo_db("resumes")
+    ids = [ObjectId() for _ in TEXTS]
+    resumes.insert_many([{"_id": i, "cleaned_text": text} for i, text in zip(ids, TEXTS)])
+    manager = TfidfIndexManager(str(tmp_path / "tfidf"))
+    build = TfidfIndex.build
+
+    def build_while_deleting(*args):
+        # A delete lands after the corpus snapshot was read
+        manager.remove(str(ids[0]))
+        return build(*args)
+
+    monkeypatch.setattr(TfidfIndex, "build", staticmethod(build_while_deleting))
+    asyncio.run(manager.rebuild(resumes))
+    assert manager.index.size == 3
+    assert str(ids[0]) not in [resume_id for resume_id, _ in manager.index.query(JD, top_k=5)]
+    assert os.listdir(tmp_path) == ["tfidf"]
+
+
+def test_save_and_load_round_trip(tmp_path):
+    index = TfidfIndex.build(IDS, TEXTS)
+    index.add("r5", "kafka java streaming")
+    index.remove("r2")
+    directory = str(tmp_path / "tfidf")
+    index.save(directory)
+    index.save(directory)  # replaces the previous copy
+
+    loaded, last_id = TfidfIndex.load(directory)
+    assert last_id == "r5"
+    assert loaded.query("java kafka", top_k=3) == index.query("java kafka", top_k=3)
+    assert TfidfIndex.load(str(tmp_path / "missing")) == (None, None)
+
+
+def test_empty_corpus_builds_an_unqueryable_index():
+    index = TfidfIndex.build([], [])
+    index.add("r1", "python")
+    assert index.query("python") == []
+    assert index.changes == 1
@@ -0,0 +1,44 @@
+import asyncio
+import hashlib
+
+from resume.upload_cache import UploadCache, find_by_hash
+
+
+class _Resumes:
+    """Minimal stand-in for the resumes collection's find_one."""
+
+    def __init__(self, docs):
+        self.docs = docs
+        self.queries = 0
+
+    async def find_one(self, query, projection=None):
+        self.queries += 1
+        return self.docs.get(query["content_hash"])
+
+
+def test_lru_evicts_least_recently_used():
+    cache = UploadCache(maxsize=2)
+    cache.put("a", {"resume_id": "1"})
+    cache.put("b", {"resume_id": "2"})
+    cache.get("a")
+    cache.put("c", {"resume_id": "3"})
+    assert cache.get("b") is None
+    assert cache.get("a") == {"resume_id": "1"}
+    cache.discard("a")
+    assert cache.get("a") is None
+
+
+def test_lookup_goes_memory_then_store_and_counts_hit_rate():
+    digest = hashlib.sha256(b"pdf bytes").hexdigest()
+    resumes = _Resumes({digest: {"_id": "abc", "resume_text": "Python", "cleaned_text": "python"}})
+    cache = UploadCache(maxsize=4)
+
+    assert asyncio.run(find_by_hash(resumes, hashlib.sha256(b"other").hexdigest(), cache)) is None
+    stored = asyncio.run(find_by_hash(resumes, digest, cache))
+    assert stored == {"resume_id": "abc", "resume_text": "Python", "cleaned_text": "python"}
+    assert asyncio.run(find_by_hash(resumes, digest, cache)) == stored
+    assert resumes.queries == 2
+
+    stats = cache.stats()
+    assert (stats["memory_hits"], stats["store_hits"], stats["misses"]) == (1, 1, 1)
+    assert stats["hit_rate"] == round(2 / 3, 4)
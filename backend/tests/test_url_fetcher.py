@@ -0,0 +1,148 @@
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from matching import jd_matcher
+from matching.router import router
+from matching.url_fetcher import HTMLTextExtractor, JDFetcher, UpstreamFetchError
+
+JOB_PAGE = (
+    b"<html><head><title>Job</title><style>p{color:red}</style></head><body>"
+    b"<h1>Backend Engineer</h1><script>var x = 1;</script>"
+    b"<p>Python &amp; FastAPI,<br>3+ years experience</p></body></html>"
+)
+
+
+class _JobBoard(BaseHTTPRequestHandler):
+    hits = {}
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.hits[self.path] = cls.hits.get(self.path, 0) + 1
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        try:
+            self._respond()
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+    def _respond(self):
+        if self.path == "/job":
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            self._send(JOB_PAGE, "text/html; charset=utf-8", etag='"v1"')
+        elif self.path == "/plain":
+            self._send(b"Plain JD text", "text/plain")
+        elif self.path == "/huge":
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain")
+            self.end_headers()
+            for _ in range(64):
+                self.wfile.write(b"x" * 1024)
+        elif self.path == "/slow":
+            time.sleep(0.3)
+            self._send(b"slow", "text/plain")
+        else:
+            self.send_response(404)
+            self.end_headers()
+
+    def _send(self, body, content_type, etag=None):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def board():
+    _JobBoard.hits, _JobBoard.active, _JobBoard.peak = {}, 0, 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _JobBoard)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _run(fetcher, coro):
+    async def run():
+        try:
+            return await coro
+        finally:
+            await fetcher.aclose()
+    return asyncio.run(run())
+
+
+def test_html_is_stripped_while_streaming():
+    extractor = HTMLTextExtractor()
+    for i in range(0, len(JOB_PAGE), 7):
+        extractor.feed(JOB_PAGE[i:i + 7].decode())
+    assert extractor.text() == "Backend Engineer\nPython & FastAPI,\n3+ years experience"
+
+
+def test_fetch_revalidates_with_etag(board):
+    fetcher = JDFetcher()
+
+    async def fetch_twice():
+        first = await fetcher.fetch_text(board + "/job")
+        second = await fetcher.fetch_text(board + "/job")
+        return first, second
+
+    first, second = _run(fetcher, fetch_twice())
+    assert first == second == "Backend Engineer\nPython & FastAPI,\n3+ years experience"
+    assert _JobBoard.hits["/job"] == 2
+    assert _run(fetcher, fetcher.fetch_text(board + "/plain")) == "Plain JD text"
+
+
+def test_rejects_oversize_bodies_errors_and_timeouts(board):
+    fetcher = JDFetcher(max_bytes=16 * 1024, read_timeout=0.1)
+    with pytest.raises(ValueError, match="larger"):
+        _run(fetcher, fetcher.fetch_text(board + "/huge"))
+    with pytest.raises(UpstreamFetchError, match="Could not fetch"):
+        _run(fetcher, fetcher.fetch_text(board + "/missing"))
+    with pytest.raises(UpstreamFetchError, match="Timed out"):
+        _run(fetcher, fetcher.fetch_text(board + "/slow"))
+    with pytest.raises(ValueError) as excinfo:
+        _run(fetcher, fetcher.fetch_text("file:///etc/passwd"))
+    assert not isinstance(excinfo.value, UpstreamFetchError)
+
+
+def test_jd_fetch_maps_unreachable_pages_to_502(monkeypatch):
+    monkeypatch.setattr(jd_matcher, "JD_FETCHER", JDFetcher(connect_timeout=1))
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+    # Nothing listens on port 9 locally: a connection error, not a 500
+    response = client.post("/ats/jd-fetch", json={"url": "http://127.0.0.1:9/job"})
+    assert response.status_code == 502
+    assert client.post("/ats/jd-fetch", json={"url": "ftp://example.com/job"}).status_code == 400
+
+
+def test_limits_concurrent_requests_per_host(board):
+    fetcher = JDFetcher(per_host=2)
+
+    async def burst():
+        return await asyncio.gather(*(fetcher.fetch_text(board + "/slow") for _ in range(6)))
+
+    assert _run(fetcher, burst()) == ["slow"] * 6
+    assert _JobBoard.peak == 2
+    # Idle hosts do not keep a semaphore around
+    assert fetcher._host_limits == {}